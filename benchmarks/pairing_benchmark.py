@@ -0,0 +1,268 @@
+"""
+Benchmark and quality harness of the Swiss pairing strategies.
+
+Plays synthetic Swiss tournaments with each strategy of
+utils.pairing_utils.PAIRING_STRATEGIES. For a given size and seed every
+strategy gets the same players; results are drawn from the ELO difference
+(or another distribution), so the standings diverge only through the
+pairings. Each round is paired with the generator of utils.pairing_utils.round_rng
+derived from the seed, as in a seeded tournament, so a run is reproducible
+and the pairings do not depend on the results drawn. Measured for every round:
+
+- seconds: wall time of the pairing;
+- peak_memory_kib: memory allocated at the peak of the pairing (tracemalloc,
+  measured on a second run with the same round generator so that the timing
+  is not affected);
+- unpaired: players neither paired nor exempted (should be 0);
+- rematches: pairs of players who had already met;
+- score_difference: sum of the score differences of the paired players;
+- score_spread: largest score difference on a board (score groups mixed);
+- colour_imbalance: players whose colour balance exceeds one game.
+
+Results are printed as a table and written as JSON (--output) so runs of
+different versions can be compared (--baseline).
+
+Usage (from the project root):
+    python -m benchmarks.pairing_benchmark --players 10 100 1000 --rounds 9
+    python -m benchmarks.pairing_benchmark --players 2000 --strategies matching --label v2 \\
+        --output benchmarks/results/v2.json --baseline benchmarks/results/v1.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import time
+import tracemalloc
+from datetime import datetime
+from utils.forecast_utils import simulate_game
+from utils.history_utils import PlayerHistory
+from utils.pairing_utils import PAIRING_STRATEGIES, BYE_POINTS, PlayedPairs, round_rng
+from utils.tournament_utils import expected_score
+
+# Result distributions: "elo" draws from the expected score of the ELO
+# difference, "random" ignores the ratings, "favourites" always lets the
+# higher rated player win.
+RESULT_DISTRIBUTIONS = ("elo", "random", "favourites")
+MEASURES = ("seconds", "peak_memory_kib", "unpaired", "rematches", "score_difference", "score_spread",
+            "colour_imbalance")
+
+
+def synthetic_ratings(player_count, rng):
+    """
+    Return the ratings of a synthetic field of players.
+
+    Ratings follow a normal distribution around 1800 (standard deviation
+    300), bounded to 1000-2800 like an open tournament.
+
+    Parameters
+    ----------
+    player_count : int
+        Number of players.
+    rng : random.Random
+        Source of randomness.
+
+    Returns
+    -------
+    dict
+        Mapping player_id -> ELO.
+    """
+    return {f"P{i:05d}": min(2800, max(1000, round(rng.gauss(1800, 300)))) for i in range(player_count)}
+
+
+def draw_result(white_elo, black_elo, distribution, draw_rate, rng):
+    """
+    Draw the result of a game for the white player.
+
+    Parameters
+    ----------
+    white_elo, black_elo : int
+        Ratings of the players.
+    distribution : str
+        One of RESULT_DISTRIBUTIONS.
+    draw_rate : float
+        Probability of a draw between players of equal strength (it
+        decreases with the rating difference).
+    rng : random.Random
+        Source of randomness.
+
+    Returns
+    -------
+    float
+        1.0, 0.5 or 0.0.
+    """
+    if distribution == "favourites":
+        return 1.0 if white_elo > black_elo else 0.0 if white_elo < black_elo else 0.5
+    expected = 0.5 if distribution == "random" else expected_score(white_elo, black_elo)
+    return simulate_game(expected, draw_rate, rng)
+
+
+def play_tournament(strategy, player_count, rounds, seed, distribution="elo", draw_rate=0.3, memory=True):
+    """
+    Play a synthetic tournament paired with one strategy.
+
+    Parameters
+    ----------
+    strategy : str
+        Key of PAIRING_STRATEGIES.
+    player_count : int
+        Number of players.
+    rounds : int
+        Number of rounds.
+    seed : int
+        Seed of the ratings and results, and pairing seed of the rounds.
+    distribution : str
+        Result distribution (see RESULT_DISTRIBUTIONS).
+    draw_rate : float
+        Draw probability between players of equal strength.
+    memory : bool
+        Measure the peak memory of each pairing.
+
+    Returns
+    -------
+    list of dict
+        One dict per round with the MEASURES.
+    """
+    rng = random.Random(seed)
+    ratings = synthetic_ratings(player_count, rng)
+    points = {player_id: 0.0 for player_id in ratings}
+    history = PlayerHistory()
+    played = PlayedPairs()
+    pair_round = PAIRING_STRATEGIES[strategy]
+    results = []
+    for round_number in range(1, rounds + 1):
+        start = time.perf_counter()
+        matches, bye = pair_round(points, played, rng=round_rng(seed, round_number), history=history)
+        seconds = time.perf_counter() - start
+        peak_memory = None
+        if memory:
+            tracemalloc.start()
+            pair_round(points, played, rng=round_rng(seed, round_number), history=history)
+            peak_memory = tracemalloc.get_traced_memory()[1] / 1024
+            tracemalloc.stop()
+        history.record_round(matches, bye, points)
+
+        seated = {bye} if bye is not None else set()
+        differences = []
+        rematches = 0
+        for (white, _), (black, _) in matches:
+            seated.update((white, black))
+            differences.append(abs(points[white] - points[black]))
+            rematches += played.have_met(white, black)
+            played.add(white, black)
+        for (white, _), (black, _) in matches:
+            result = draw_result(ratings[white], ratings[black], distribution, draw_rate, rng)
+            points[white] += result
+            points[black] += 1 - result
+        if bye is not None:
+            points[bye] += BYE_POINTS
+        results.append({
+            "seconds": seconds,
+            "peak_memory_kib": peak_memory,
+            "unpaired": player_count - len(seated),
+            "rematches": rematches,
+            "score_difference": sum(differences),
+            "score_spread": max(differences, default=0.0),
+            "colour_imbalance": sum(1 for player_id in ratings if abs(history.colour_balance(player_id)) > 1),
+        })
+    return results
+
+
+def summarize(rounds_results):
+    """
+    Return the totals of a tournament: sums, maxima, and the final imbalance.
+    """
+    memories = [r["peak_memory_kib"] for r in rounds_results if r["peak_memory_kib"] is not None]
+    return {
+        "seconds": sum(r["seconds"] for r in rounds_results),
+        "max_round_seconds": max(r["seconds"] for r in rounds_results),
+        "peak_memory_kib": max(memories) if memories else None,
+        "unpaired": sum(r["unpaired"] for r in rounds_results),
+        "rematches": sum(r["rematches"] for r in rounds_results),
+        "score_difference": sum(r["score_difference"] for r in rounds_results),
+        "score_spread": max(r["score_spread"] for r in rounds_results),
+        "colour_imbalance": rounds_results[-1]["colour_imbalance"],
+    }
+
+
+def compare(baseline, runs):
+    """
+    Print the changes of the totals against a previous result file.
+
+    Parameters
+    ----------
+    baseline : dict
+        Content of a result file written by a previous run.
+    runs : list of dict
+        Runs of the current benchmark.
+    """
+    previous = {(run["strategy"], run["players"]): run["summary"] for run in baseline.get("runs", [])}
+    print(f"\nComparaison avec {baseline.get('label') or baseline.get('created')}")
+    for run in runs:
+        before = previous.get((run["strategy"], run["players"]))
+        if before is None:
+            continue
+        after = run["summary"]
+        ratio = after["seconds"] / before["seconds"] if before["seconds"] else float("inf")
+        print(f"{run['strategy']:<14}{run['players']:>7} joueurs  temps x{ratio:.2f}  "
+              f"revanches {after['rematches'] - before['rematches']:+d}  "
+              f"écarts {after['score_difference'] - before['score_difference']:+.1f}  "
+              f"couleurs {after['colour_imbalance'] - before['colour_imbalance']:+d}")
+
+
+def main():
+    """Parse the command line, run the benchmark, print and save the results."""
+    parser = argparse.ArgumentParser(description="Benchmark the Swiss pairing strategies.")
+    parser.add_argument("--players", type=int, nargs="+", default=[10, 100, 1000],
+                        help="numbers of players, from 10 to 10000 (default 10 100 1000)")
+    parser.add_argument("--rounds", type=int, default=9, help="number of rounds (default 9)")
+    parser.add_argument("--strategies", nargs="+", choices=list(PAIRING_STRATEGIES), default=list(PAIRING_STRATEGIES),
+                        help="strategies to run (default all)")
+    parser.add_argument("--results", choices=RESULT_DISTRIBUTIONS, default="elo",
+                        help="result distribution (default elo)")
+    parser.add_argument("--draw-rate", type=float, default=0.3,
+                        help="draw probability between players of equal strength (default 0.3)")
+    parser.add_argument("--seed", type=int, default=1, help="random seed (default 1)")
+    parser.add_argument("--no-memory", action="store_true", help="do not measure the peak memory")
+    parser.add_argument("--label", default="", help="name of this run (e.g. a version)")
+    parser.add_argument("--output", help="JSON file receiving the results")
+    parser.add_argument("--baseline", help="JSON file of a previous run to compare with")
+    args = parser.parse_args()
+
+    runs = []
+    print(f"{'stratégie':<14}{'joueurs':>8}{'ronde':>6}{'temps (s)':>11}{'mém. (Kio)':>12}{'non app.':>9}"
+          f"{'revanches':>10}{'écarts':>9}{'max':>6}{'couleurs':>10}")
+    for player_count in args.players:
+        rounds = min(args.rounds, max(player_count - 1, 1))
+        for strategy in args.strategies:
+            rounds_results = play_tournament(strategy, player_count, rounds, args.seed, args.results, args.draw_rate,
+                                             memory=not args.no_memory)
+            summary = summarize(rounds_results)
+            for number, result in enumerate(rounds_results + [summary], start=1):
+                memory = "-" if result["peak_memory_kib"] is None else f"{result['peak_memory_kib']:.0f}"
+                label = "total" if number > len(rounds_results) else number
+                print(f"{strategy:<14}{player_count:>8}{label:>6}{result['seconds']:>11.3f}{memory:>12}"
+                      f"{result['unpaired']:>9}{result['rematches']:>10}{result['score_difference']:>9.1f}"
+                      f"{result['score_spread']:>6.1f}{result['colour_imbalance']:>10}")
+            runs.append({"strategy": strategy, "players": player_count, "rounds": rounds_results, "summary": summary})
+
+    report = {
+        "label": args.label,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "parameters": {
+            "rounds": args.rounds, "results": args.results, "draw_rate": args.draw_rate, "seed": args.seed,
+        },
+        "runs": runs,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nRésultats écrits dans {args.output}")
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            compare(json.load(f), runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Benchmark of the batch ELO computation and of the rating engines.
+
+Rates a synthetic rating period (random games between players of a synthetic
+field) with utils.rating_utils.rate_games, vectorised with NumPy when it is
+installed and in pure Python, and with one calculate_elo() call per
+player-game for reference. The new ratings of both batch computations are
+checked to be identical.
+
+Then rates a synthetic history of tournaments (--tournaments, each one a
+rating period of --rounds rounds between --field players drawn from the
+pool) with every engine of utils.rating_engine_utils.RATING_ENGINES, as the
+settlement of finished tournaments does.
+
+Usage (from the project root):
+    python -m benchmarks.rating_benchmark --games 5000 --players 2000
+    python -m benchmarks.rating_benchmark --tournaments 500 --field 60 --rounds 7
+"""
+
+import argparse
+import random
+import time
+from benchmarks.pairing_benchmark import draw_result, synthetic_ratings
+from model.player_model import ChessPlayer
+from utils.rating_engine_utils import RATING_ENGINES
+from utils.rating_utils import HAS_NUMPY, rate_games
+from utils.tournament_utils import calculate_elo
+
+
+def synthetic_period(player_count, game_count, rng):
+    """
+    Return the ratings and the games of a synthetic rating period.
+
+    Parameters
+    ----------
+    player_count : int
+        Number of players.
+    game_count : int
+        Number of games, between random players.
+    rng : random.Random
+        Source of randomness.
+
+    Returns
+    -------
+    tuple
+        (ratings, players, opponents, scores, k_factors), in the format of
+        rate_games(): two player-games per game.
+    """
+    ratings = list(synthetic_ratings(player_count, rng).values())
+    players, opponents, scores, k_factors = [], [], [], []
+    for _ in range(game_count):
+        white, black = rng.sample(range(player_count), 2)
+        result = rng.choice((1.0, 0.5, 0.0))
+        players += [white, black]
+        opponents += [black, white]
+        scores += [result, 1 - result]
+        k_factors += [40 if ratings[white] < 1600 else 20, 40 if ratings[black] < 1600 else 20]
+    return ratings, players, opponents, scores, k_factors
+
+
+def synthetic_history(player_count, tournament_count, field, rounds, rng):
+    """
+    Return the players and the tournaments of a synthetic rating history.
+
+    Parameters
+    ----------
+    player_count : int
+        Number of players of the pool.
+    tournament_count : int
+        Number of tournaments.
+    field : int
+        Players of each tournament, drawn from the pool.
+    rounds : int
+        Rounds of each tournament, paired at random.
+    rng : random.Random
+        Source of randomness.
+
+    Returns
+    -------
+    tuple
+        (players, tournaments): ChessPlayer instances by id, and for each
+        tournament its rounds matches ([white_id, score], [black_id, score]),
+        with results drawn from the ELO difference.
+    """
+    ratings = synthetic_ratings(player_count, rng)
+    players = {player_id: ChessPlayer("", "", "", player_id, elo) for player_id, elo in ratings.items()}
+    player_ids = list(ratings)
+    tournaments = []
+    for _ in range(tournament_count):
+        entrants = rng.sample(player_ids, min(field, player_count))
+        rounds_matches = []
+        for _ in range(rounds):
+            rng.shuffle(entrants)
+            matches = []
+            for white, black in zip(entrants[::2], entrants[1::2]):
+                result = draw_result(ratings[white], ratings[black], "elo", 0.3, rng)
+                matches.append(([white, result], [black, 1 - result]))
+            rounds_matches.append(matches)
+        tournaments.append((entrants, rounds_matches))
+    return players, tournaments
+
+
+def rate_history(engine, players, tournaments):
+    """
+    Rate a synthetic history with an engine and return the final states.
+    """
+    states = {player_id: engine.state(player) for player_id, player in players.items()}
+    for entrants, rounds_matches in tournaments:
+        engine.rate_period(rounds_matches, {player_id: states[player_id] for player_id in entrants})
+    return states
+
+
+def best_time(function, repeat):
+    """
+    Return the best wall time of repeat calls of function, in seconds.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    """Parse the command line, run the benchmark and print the timings."""
+    parser = argparse.ArgumentParser(description="Benchmark the batch ELO computation.")
+    parser.add_argument("--games", type=int, default=5000, help="games of the rating period (default 5000)")
+    parser.add_argument("--players", type=int, default=2000, help="number of players (default 2000)")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measure, the best is kept (default 5)")
+    parser.add_argument("--seed", type=int, default=1, help="random seed (default 1)")
+    parser.add_argument("--tournaments", type=int, default=200,
+                        help="tournaments of the history rated by the engines (default 200)")
+    parser.add_argument("--field", type=int, default=60, help="players per tournament (default 60)")
+    parser.add_argument("--rounds", type=int, default=7, help="rounds per tournament (default 7)")
+    args = parser.parse_args()
+
+    period = synthetic_period(args.players, args.games, random.Random(args.seed))
+    ratings, players, opponents, scores, k_factors = period
+    python_ratings = rate_games(*period, use_numpy=False)
+    measures = [("python", best_time(lambda: rate_games(*period, use_numpy=False), args.repeat))]
+    if HAS_NUMPY:
+        numpy_ratings = rate_games(*period, use_numpy=True)
+        measures.append(("numpy", best_time(lambda: rate_games(*period, use_numpy=True), args.repeat)))
+        print(f"Classements identiques NumPy / Python : {'oui' if numpy_ratings == python_ratings else 'NON'}")
+    else:
+        print("NumPy n'est pas installé : seul le calcul en Python pur est mesuré.")
+    measures.append(("calculate_elo", best_time(
+        lambda: [calculate_elo(ratings[player], ratings[opponent], k_factor, score)
+                 for player, opponent, score, k_factor in zip(players, opponents, scores, k_factors)],
+        args.repeat)))
+
+    print(f"{'calcul':<16}{'parties':>9}{'temps (ms)':>12}")
+    for name, seconds in measures:
+        print(f"{name:<16}{args.games:>9}{seconds * 1000:>12.2f}")
+
+    players, tournaments = synthetic_history(args.players, args.tournaments, args.field, args.rounds,
+                                             random.Random(args.seed))
+    games = sum(len(matches) for _, rounds_matches in tournaments for matches in rounds_matches)
+    print(f"\n{'moteur':<16}{'tournois':>9}{'parties':>9}{'temps (ms)':>12}{'ms / tournoi':>14}")
+    for name, engine in RATING_ENGINES.items():
+        seconds = best_time(lambda: rate_history(engine, players, tournaments), args.repeat)
+        print(f"{name:<16}{args.tournaments:>9}{games:>9}{seconds * 1000:>12.2f}"
+              f"{seconds * 1000 / max(args.tournaments, 1):>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
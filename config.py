@@ -0,0 +1,41 @@
+"""
+Application configuration for Ajedrez.
+
+Settings are read from environment variables so the storage backend can be
+selected without editing the code:
+
+- AJEDREZ_STORAGE: "json" (default) to use the JSON files of the data/
+  directory, "sharded" to store each tournament in its own file under
+  data/tournaments/ (players stay in data/players.json), or "sqlite" to use
+  a SQLite database.
+- AJEDREZ_DATABASE: path of the SQLite database (default "data/ajedrez.db").
+- AJEDREZ_LAZY_LOAD: "1" (default) to decode the players, rounds and matches
+  history of a tournament only when they are first accessed, "0" to decode
+  every tournament completely at load time.
+- AJEDREZ_SNAPSHOT: "1" (default) to keep a binary snapshot next to each JSON
+  data file and load it instead of the JSON while it is up to date, "0" to
+  always decode the JSON files.
+- AJEDREZ_PAIRING: Swiss pairing strategy, "backtracking" (default) for the
+  score-group search of utils.pairing_utils.pair_swiss_round, or "matching"
+  for the maximum-weight matching of pair_weighted_round (large opens).
+- AJEDREZ_TIE_BREAKS: order of the tie-breaks of the standings, names of
+  utils.tie_break_utils.TIE_BREAKS separated by commas (default
+  "buchholz,median,sonneborn_berger,progressive").
+
+RATING_HISTORY_FILE holds the base ratings and checkpoints used to recompute
+the ratings from the finished tournaments (ChessPlayerController.recompute_ratings).
+"""
+
+import os
+
+PLAYERS_FILE = "data/players.json"
+TOURNAMENTS_FILE = "data/tournaments.json"
+TOURNAMENTS_DIRECTORY = "data/tournaments"
+RATING_HISTORY_FILE = "data/rating_history.json"
+
+STORAGE_BACKEND = os.environ.get("AJEDREZ_STORAGE", "json").lower()
+DATABASE_PATH = os.environ.get("AJEDREZ_DATABASE", "data/ajedrez.db")
+LAZY_TOURNAMENTS = os.environ.get("AJEDREZ_LAZY_LOAD", "1") != "0"
+USE_SNAPSHOTS = os.environ.get("AJEDREZ_SNAPSHOT", "1") != "0"
+PAIRING_STRATEGY = os.environ.get("AJEDREZ_PAIRING", "backtracking").lower()
+TIE_BREAK_ORDER = os.environ.get("AJEDREZ_TIE_BREAKS", "buchholz,median,sonneborn_berger,progressive")
@@ -1,23 +1,33 @@
-import json
 from model.player_model import ChessPlayer
-from utils.tournament_utils import calculate_elo
+from repository.rating_history import RatingHistory
+from repository.session import get_player_repository, get_tournament_repository
+from utils.rating_engine_utils import get_rating_engine
+from utils.rating_history_utils import archive_entry, archive_order, bootstrap_base, replay_archive
 
 
 class ChessPlayerController:
-    """Controller for managing ChessPlayer data persisted in JSON.
+    """Controller for managing persisted ChessPlayer data.
 
     Provides simple CRUD operations, lookup helpers and rating updates used by
-    the console views and tournament workflow.
+    the console views and tournament workflow. Players are read once per
+    session through a shared player repository (JSON file or SQLite database,
+    see config.py); mutators only write back what they changed.
+
+    Lookups by federation ID go through the identity map of the repository,
+    a dict keyed on federation_chess_id kept up to date by add_player,
+    modify_player (ID changes) and remove_player.
 
     Attributes
     ----------
+    repository : BasePlayerRepository
+        Session repository holding the identity map of players.
     chess_players : list[ChessPlayer]
-        In-memory list of ChessPlayer instances loaded from the JSON store.
+        In-memory list of ChessPlayer instances (shared with the repository).
 
     Methods
     -------
     display_players_from_json()
-        Load players from JSON and return the list of ChessPlayer instances.
+        Return the list of ChessPlayer instances (loaded once per session).
     add_player(surname, name, date_of_birth, id, elo)
         Create a new ChessPlayer and persist it to JSON.
     remove_player(index)
@@ -25,7 +35,7 @@ class ChessPlayerController:
     modify_player(index, ...)
         Update fields of an existing player and persist changes.
     get_player(index)
-        Return the ChessPlayer at the given index (after loading from JSON).
+        Return the ChessPlayer at the given index.
     get_players_count()
         Return the current number of players.
     get_players_id()
@@ -35,37 +45,44 @@ class ChessPlayerController:
     get_player_by_federation_id(federation_id)
         Lookup and return a ChessPlayer by their federation ID.
     update_player_by_federation_id(federation_id, player1)
-        Update a player's rating and/or games played by federation ID and persist.
+        Update a player's rating and/or games played by federation ID.
     update_players_games_and_elo(tournament)
         Apply tournament results: increment games played, compute and persist new ELOs.
-    save_players_to_json(filepath="data/players.json")
-        Serialize the in-memory players list to the given JSON file.
-    load_players_from_json(filepath="data/players.json")
-        Populate the in-memory list by reading the given JSON file.
+    settle_tournament_ratings(tournament)
+        Batched settlement behind update_players_games_and_elo (single commit).
+    recompute_ratings(history=None)
+        Replay the finished tournaments to recompute the ratings after a correction.
+    commit()
+        Flush pending player changes to the store.
+    save_players_to_json(filepath=None)
+        Flush pending changes, or export the full list to another file.
+    load_players_from_json(filepath=None)
+        Load the players of the given JSON file, reusing them if unchanged.
     """
 
-    def __init__(self):
+    def __init__(self, repository=None):
         """
         Initialize the ChessPlayerController.
 
-        The controller starts with an empty in-memory list; callers should
-        invoke display_players_from_json() or load_players_from_json() to
-        populate the list from persistent storage.
+        Parameters
+        ----------
+        repository : BasePlayerRepository | None
+            Repository to use; defaults to the session repository of the
+            configured backend. Nothing is read until the first access.
         """
-        self.chess_players = []
+        self.repository = repository if repository is not None else get_player_repository()
+        self.chess_players = self.repository.players
 
     def display_players_from_json(self):
         """
-        Load players from the default JSON file into memory and return them.
+        Return the players, loading them on the first call of the session.
 
         Returns
         -------
         list[ChessPlayer]
             List of ChessPlayer instances loaded from storage (may be empty).
         """
-        self.chess_players.clear()
-        self.load_players_from_json()
-        return self.chess_players
+        return self.repository.ensure_loaded()
 
     def add_player(self, surname, name, date_of_birth, id, elo):
         """
@@ -84,11 +101,9 @@ class ChessPlayerController:
         elo : int | float
             Player rating.
         """
-        self.chess_players.clear()
-        self.load_players_from_json()
         new_player = ChessPlayer(surname, name, date_of_birth, id, elo)
-        self.chess_players.append(new_player)
-        self.save_players_to_json()
+        self.repository.add(new_player)
+        self.commit()
 
     def remove_player(self, index):
         """
@@ -104,10 +119,8 @@ class ChessPlayerController:
         tuple (name, surname)
             The removed player's given name and family name.
         """
-        self.chess_players.clear()
-        self.load_players_from_json()
-        removed_player = self.chess_players.pop(index)
-        self.save_players_to_json()
+        removed_player = self.repository.remove(index)
+        self.commit()
         return removed_player.name, removed_player.surname
 
     def modify_player(self, index, surname=None, name=None, date_of_birth=None, federation_chess_id=None, elo=None):
@@ -127,9 +140,7 @@ class ChessPlayerController:
         -------
         None
         """
-        self.chess_players.clear()
-        self.load_players_from_json()
-        player = self.chess_players[index]
+        player = self.get_player(index)
         if surname:
             player.surname = surname
         if name:
@@ -137,10 +148,13 @@ class ChessPlayerController:
         if date_of_birth:
             player.date_of_birth = date_of_birth
         if federation_chess_id:
+            old_federation_id = player.federation_chess_id
             player.federation_chess_id = federation_chess_id
+            self.repository.rekey(player, old_federation_id)
         if elo:
             player.elo = elo
-        self.save_players_to_json()
+        self.repository.mark_dirty(player)
+        self.commit()
 
     def get_player(self, index):
         """
@@ -156,9 +170,7 @@ class ChessPlayerController:
         ChessPlayer
             The requested player instance.
         """
-        self.chess_players.clear()
-        self.load_players_from_json()
-        return self.chess_players[index]
+        return self.repository.ensure_loaded()[index]
 
     def get_players_count(self):
         """
@@ -169,9 +181,7 @@ class ChessPlayerController:
         int
             Number of players.
         """
-        self.chess_players.clear()
-        self.load_players_from_json()
-        return len(self.chess_players)
+        return len(self.repository.ensure_loaded())
 
     def get_players_id(self):
         """
@@ -182,9 +192,7 @@ class ChessPlayerController:
         list[str]
             List of federation_chess_id values.
         """
-        self.chess_players.clear()
-        self.load_players_from_json()
-        return [player.federation_chess_id for player in self.chess_players]
+        return [player.federation_chess_id for player in self.repository.ensure_loaded()]
 
     def transform_players_id_list(self, players_id):
         """
@@ -201,12 +209,15 @@ class ChessPlayerController:
             valid_ids : list[str] IDs that exist in the store.
             invalid_ids : list[str] IDs that were not found.
         """
-        self.chess_players.clear()
-        self.load_players_from_json()
         players_id_list = [pid.strip() for pid in players_id.split(",") if pid.strip()]
-        existing_players_id = self.get_players_id()
-        invalid_ids = [pid for pid in players_id_list if pid not in existing_players_id]
-        valid_ids = [pid for pid in players_id_list if pid in existing_players_id]
+        existing_players_id = self.repository.keys()
+        valid_ids = []
+        invalid_ids = []
+        for pid in players_id_list:
+            if pid in existing_players_id:
+                valid_ids.append(pid)
+            else:
+                invalid_ids.append(pid)
         return valid_ids, invalid_ids
 
     def get_player_by_federation_id(self, federation_id):
@@ -223,12 +234,7 @@ class ChessPlayerController:
         ChessPlayer | None
             The matching player instance, or None if not found.
         """
-        self.chess_players.clear()
-        self.load_players_from_json()
-        for player in self.chess_players:
-            if player.federation_chess_id == federation_id:
-                return player
-        return None
+        return self.repository.get(federation_id)
 
     def update_player_by_federation_id(self, federation_id, player1):
         """
@@ -246,114 +252,207 @@ class ChessPlayerController:
         Returns
         -------
         bool
-            True if a matching player was found and updated (and changes saved),
+            True if a matching player was found and updated,
             False if no player with the given federation_id was found.
 
         Notes
         -----
-        The method reloads the players from persistent storage, applies any
-        provided updates to the matching player, persists the list back to
-        storage, and returns whether an update occurred.
-        """
-        self.chess_players.clear()
-        self.load_players_from_json()
-        for player in self.chess_players:
-            if player.federation_chess_id == federation_id:
-                if player1.games_played is not None:
-                    player.modify_games_played(player1.games_played)
-                if player1.elo is not None:
-                    player.modify_elo(player1.elo)
-                self.save_players_to_json()
-                return True
-        return False
+        The change is only marked as pending in the session repository;
+        callers persist it with commit().
+        """
+        player = self.repository.get(federation_id)
+        if player is None:
+            return False
+        if player1.games_played is not None:
+            player.modify_games_played(player1.games_played)
+        if player1.elo is not None:
+            player.modify_elo(player1.elo)
+        self.repository.mark_dirty(player)
+        return True
 
     def update_players_games_and_elo(self, tournament):
         """
         Update all players' games played and ELO ratings based on tournament results.
 
-        For each match in each round the method:
-          - looks up the two players by federation ID,
-          - computes new ELOs using calculate_elo() and each player's K-factor,
-          - increments games_played,
-          - updates in-memory player objects and persists changes.
+        Kept for the views; equivalent to settle_tournament_ratings().
+
+        Parameters
+        ----------
+        tournament : Tournament
+            The tournament instance containing rounds and matches to process.
+        """
+        self.settle_tournament_ratings(tournament)
+
+    def settle_tournament_ratings(self, tournament):
+        """
+        Apply the results of a finished tournament to its players in one batch.
+
+        The players of the tournament are looked up once through the
+        federation-id index of the repository, every game is applied to
+        in-memory states by the rating engine of the tournament
+        (tournament.rating_engine, see utils.rating_engine_utils): settle_elo()
+        for the classic ELO (same order and K coefficient rules as
+        ChessPlayer.modify_elo), one Glicko-2 rating period for Glicko-2.
+        The final values are then assigned and persisted with a single
+        commit.
 
         Parameters
         ----------
         tournament : Tournament
             The tournament instance containing rounds and matches to process.
 
+        Returns
+        -------
+        dict
+            Mapping federation_chess_id -> (old_rating, new_rating) of the
+            players whose rating was settled, in the system of the
+            tournament.
+
         Notes
         -----
         The method expects `tournament.rounds` to contain rounds with `.matches`
         where each match is represented as ([player1_id, score1], [player2_id, score2]).
+        Once the rating history exists (see recompute_ratings), the ELO of a
+        player settled for the first time is added to its base.
         """
-        for round in tournament.rounds:
-            for match in round.matches:
-                player1_id = match[0][0]
-                player2_id = match[1][0]
-                result1 = match[0][1]
-                result2 = match[1][1]
-
-                player1 = self.get_player_by_federation_id(player1_id)
-                player2 = self.get_player_by_federation_id(player2_id)
-
-                new_elo_player1 = calculate_elo(
-                    elo_player=player1.elo,
-                    elo_opponent=player2.elo,
-                    k_player=player1.coef_k,
-                    w=result1
-                )
-                new_elo_player2 = calculate_elo(
-                    elo_player=player2.elo,
-                    elo_opponent=player1.elo,
-                    k_player=player2.coef_k,
-                    w=result2
-                )
+        engine = get_rating_engine(tournament.rating_engine)
+        players = {}
+        for player_id in tournament.players:
+            player = self.repository.get(player_id)
+            if player is not None:
+                players[player_id] = player
+        states = {player_id: engine.state(player) for player_id, player in players.items()}
+        if engine.name == "elo":
+            history = RatingHistory().load()
+            if history.exists() and history.record_base(states):
+                history.save()
+        engine.rate_period((round.matches for round in tournament.rounds), states)
+
+        changes = {}
+        for player_id, state in states.items():
+            player = players[player_id]
+            if state == engine.state(player):
+                continue
+            old_rating = engine.rating(player)
+            engine.apply(player, state)
+            changes[player_id] = (old_rating, engine.rating(player))
+            self.repository.mark_dirty(player)
+        self.commit()
+        return changes
+
+    def recompute_ratings(self, history=None):
+        """
+        Recompute the ratings by replaying every finished tournament.
+
+        The finished tournaments are replayed in chronological order (start
+        date, then round timestamps) with settle_elo(), from the ratings the
+        players had before them. On the first call these base ratings are
+        found from the current ratings by undoing the archive; afterwards
+        the replay starts from the nearest checkpoint before the first
+        tournament whose results changed, so a correction in a recent
+        tournament does not replay the whole archive.
+
+        The ELO of the players of the archive is replaced by the recomputed
+        value, including ratings edited by hand since their last tournament,
+        and their K coefficient follows (ChessPlayer.modify_elo); games
+        played are kept, as they also count the games of tournaments rated
+        with another engine. Only the tournaments rated with the classic ELO
+        are replayed, and games against a player removed from the list are
+        not rated.
 
-                player1.modify_games_played(player1.games_played + 1)
-                player2.modify_games_played(player2.games_played + 1)
+        Parameters
+        ----------
+        history : RatingHistory | None
+            Rating history to use (default the file config.RATING_HISTORY_FILE).
 
-                player1.modify_elo(new_elo_player1)
-                player2.modify_elo(new_elo_player2)
+        Returns
+        -------
+        dict
+            "changes": mapping federation_chess_id -> (old_elo, new_elo) of
+            the updated players; "tournaments": number of finished
+            tournaments; "replayed": number of tournaments replayed;
+            "mismatches": on the first call, ids of the players whose current
+            rating could not be reproduced from the archive.
+        """
+        history = history if history is not None else RatingHistory().load()
+        archive = [archive_entry(tournament) for tournament in archive_order(
+            tournament for tournament in get_tournament_repository().ensure_loaded()
+            if get_rating_engine(tournament.rating_engine).name == "elo")]
+        ratings = {player.federation_chess_id: [player.elo, player.coef_k, player.games_played]
+                   for player in self.repository.ensure_loaded()}
+        mismatches = []
+        if history.exists():
+            history.record_base(ratings)
+        else:
+            history.base, mismatches = bootstrap_base(archive, ratings)
+        recomputed, history.checkpoints, start = replay_archive(
+            history.base, archive, history.archive, history.checkpoints, history.every)
+        history.archive = [[tournament_id, digest] for tournament_id, digest, _ in archive]
+        history.save()
+
+        archived = {player_id for _, _, rounds_matches in archive for matches in rounds_matches
+                    for (player1_id, _), (player2_id, _) in matches for player_id in (player1_id, player2_id)}
+        changes = {}
+        for player_id in archived:
+            player = self.repository.get(player_id)
+            if player is None or player_id not in recomputed:
+                continue
+            elo = recomputed[player_id][0]
+            if player.elo == elo:
+                continue
+            changes[player_id] = (player.elo, elo)
+            player.modify_elo(elo)
+            self.repository.mark_dirty(player)
+        self.commit()
+        return {"changes": changes, "tournaments": len(archive), "replayed": len(archive) - start,
+                "mismatches": mismatches}
+
+    def commit(self):
+        """
+        Flush pending player changes to the store.
 
-                self.update_player_by_federation_id(player1_id, player1)
-                self.update_player_by_federation_id(player2_id, player2)
+        Returns
+        -------
+        bool
+            True if the file was written, False if nothing was pending.
+        """
+        return self.repository.commit()
 
-    def save_players_to_json(self, filepath="data/players.json"):
+    def save_players_to_json(self, filepath=None):
         """
         Persist the in-memory players list to a JSON file.
 
         Parameters
         ----------
-        filepath : str
-            Destination path for the JSON file.
+        filepath : str | None
+            Destination path for the JSON file. Defaults to the repository
+            store, which is only written when changes are pending; any other
+            path receives a full JSON export.
         """
-        data = []
-        for player in self.chess_players:
-            data.append(player.to_dict())
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        self.repository.commit(filepath)
 
-    def load_players_from_json(self, filepath="data/players.json"):
+    def load_players_from_json(self, filepath=None):
         """
-        Load players from a JSON file into the in-memory list.
+        Load the players of a JSON file, unless they are already up to date.
+
+        The file is only decoded again if its (st_mtime_ns, st_size) changed
+        since the last load; otherwise the ChessPlayer instances already in
+        memory are kept (see repository.cache_stats() for the hit/miss
+        counters).
 
         Parameters
         ----------
-        filepath : str
-            Path to the JSON file to read.
+        filepath : str | None
+            Path to the JSON file to read. Defaults to the store of the current
+            repository; another path switches the controller to the session
+            repository of that JSON file.
 
         Notes
         -----
-        If the file does not exist or contains invalid JSON, the method
-        silently leaves the in-memory list empty.
-        """
-        try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                data_loaded = json.load(f)
-                for player_data in data_loaded:
-                    player = ChessPlayer.from_dict(player_data)
-                    self.chess_players.append(player)
-
-        except (FileNotFoundError, json.JSONDecodeError):
-            pass
+        If the file does not exist or contains invalid JSON, the in-memory
+        list stays empty.
+        """
+        if filepath is not None and filepath != self.repository.filepath:
+            self.repository = get_player_repository(filepath)
+            self.chess_players = self.repository.players
+        self.repository.refresh()
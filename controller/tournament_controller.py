@@ -1,28 +1,51 @@
+import random
+import config
 from model.tournament_model import Tournament, TournamentRound
-import json
+from repository.session import get_player_repository, get_tournament_repository
 from utils.tournament_utils import generate_first_round_matches
-from utils.tournament_utils import inscribe_match_results
-from utils.tournament_utils import generate_round_matches
+from utils.tournament_utils import inscribe_match_results, pair_next_round, pair_next_rounds, replay_rounds
+from utils.forecast_utils import forecast_standings
+from utils.history_utils import PlayerHistory
+from utils.pairing_utils import BYE_POINTS, PAIRING_STRATEGIES, PlayedPairs, acceleration_settings, round_rng
+from utils.rating_engine_utils import DEFAULT_RATING_ENGINE
+from utils.tie_break_utils import TIE_BREAKS, parse_tie_break_order
+from utils.round_robin_utils import berger_schedule, schedule_round
 from datetime import datetime
 
 
 class TournamentController:
-    """Controller for managing Tournament instances persisted as JSON.
+    """Controller for managing persisted Tournament instances.
+
+    Tournaments are read once per session through a shared tournament
+    repository (JSON file, per-tournament files or SQLite database, see
+    config.py). Mutators only mark the touched tournament dirty; changes are
+    written back in one coalesced flush at the workflow steps that call
+    commit() (creation, edition, start and end of a tournament, exit).
+    Results, round closing, points and pairings of a running tournament are
+    handed to the repository as events (journal entries for JSON, a rewrite
+    of the tournament's own file when sharded, single-row updates for
+    SQLite).
 
     Attributes
     ----------
+    repository : BaseTournamentRepository
+        Session repository holding the identity map of tournaments.
     tournaments : list[Tournament]
-        In-memory list of Tournament instances loaded from the JSON store.
+        In-memory list of Tournament instances (shared with the repository).
 
     Methods
     -------
-    load_tournaments_from_json(filepath="data/tournaments.json"):
-        Load tournaments from a JSON file into memory.
-    save_tournaments_to_json(filepath="data/tournaments.json"):
-        Persist the in-memory tournaments list to a JSON file.
+    load_tournaments_from_json(filepath=None):
+        Load the tournaments of a JSON file, reusing them if unchanged.
+    save_tournaments_to_json(filepath=None):
+        Flush pending changes, or export the full list to another file.
+    commit():
+        Flush pending tournament changes to the store.
     display_tournaments():
-        Return the list of tournaments (loads from storage first).
-    add_tournament(name, location, start_date, end_date, description):
+        Return the list of tournaments (loaded once per session).
+    get_tournaments_summaries():
+        Return the lightweight headers used by the tournaments list.
+    add_tournament(name, location, start_date, end_date, description, rating_engine=None):
         Create and persist a new tournament.
     remove_tournament(index):
         Remove a tournament by index and persist changes.
@@ -31,13 +54,13 @@ class TournamentController:
     subscribe_players(index, player_ids):
         Subscribe players to a tournament.
     get_tournament(index):
-        Retrieve a tournament by index (loads from storage first).
+        Retrieve a tournament by index.
     get_tournaments_count():
         Return the number of tournaments stored.
     get_tournament_round_matches_count(index, round_index):
         Return the number of matches in a specific round.
-    start_tournament(index):
-        Initialize tournament (generate first round, set status).
+    start_tournament(index, round_robin=True, accelerated=False):
+        Initialize tournament (schedule or generate first round, set status).
     tournament_round_status_update(index, round_index):
         Check if all matches in a round have results.
     close_tournament_round(index, round_index):
@@ -48,72 +71,124 @@ class TournamentController:
         Update players' points from a finished round.
     initiate_next_tournament_round(index):
         Generate and append the next round pairings.
+    initiate_next_rounds(tournament_ids, workers=None):
+        Pair the next round of several tournaments concurrently, in one commit.
+    forecast_tournament(index, simulations=10000, workers=None, seed=None):
+        Return the win and podium probabilities of the players.
+    replay_tournament_pairings(index):
+        Pair the stored rounds again from the seed and return the differences.
+    get_standings(index, order=None):
+        Return the standings with tie-breaks.
     close_tournament(index):
         Mark tournament as finished.
     """
 
-    def __init__(self):
+    def __init__(self, repository=None):
         """
         Initialize the TournamentController.
 
-        Starts with an empty in-memory list; callers should use display_tournaments()
-        or load_tournaments_from_json() to populate the list from persistent storage.
+        Parameters
+        ----------
+        repository : BaseTournamentRepository | None
+            Repository to use; defaults to the session repository of the
+            configured backend. Nothing is read until the first access.
         """
-        self.tournaments = []
+        self.repository = repository if repository is not None else get_tournament_repository()
+        self.tournaments = self.repository.tournaments
 
-    def load_tournaments_from_json(self, filepath="data/tournaments.json"):
+    def load_tournaments_from_json(self, filepath=None):
         """
-        Load tournaments from a JSON file into the in-memory list.
+        Load the tournaments of a JSON file, unless they are already up to date.
+
+        The file is only decoded again if its (st_mtime_ns, st_size) changed
+        since the last load; otherwise the Tournament instances already in
+        memory are kept (see repository.cache_stats() for the hit/miss
+        counters).
 
         Parameters
         ----------
-        filepath : str
-            Path to the JSON file containing tournament records.
+        filepath : str | None
+            Path to the JSON file containing tournament records. Defaults to
+            the store of the current repository; another path switches the
+            controller to the session repository of that JSON file.
 
         Notes
         -----
         If the file does not exist or contains invalid JSON, the in-memory list
         remains empty (no exception is raised).
         """
-        try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                tournaments_loaded = json.load(f)
-                for tournament_data in tournaments_loaded:
-                    tournament = Tournament.from_dict(tournament_data)
-                    self.tournaments.append(tournament)
+        if filepath is not None and filepath != self.repository.filepath:
+            self.repository = get_tournament_repository(filepath)
+            self.tournaments = self.repository.tournaments
+        self.repository.refresh()
 
-        except (FileNotFoundError, json.JSONDecodeError):
-            pass
-
-    def save_tournaments_to_json(self, filepath="data/tournaments.json"):
+    def save_tournaments_to_json(self, filepath=None):
         """
         Persist the in-memory tournaments list to a JSON file.
 
         Parameters
         ----------
-        filepath : str
-            Destination path for the JSON file.
+        filepath : str | None
+            Destination path for the JSON file. Defaults to the repository
+            store, which is only written when changes are pending; any other
+            path receives a full JSON export.
+        """
+        self.repository.commit(filepath)
+
+    def commit(self):
+        """
+        Flush pending tournament changes to the store.
+
+        Returns
+        -------
+        bool
+            True if the file was written, False if nothing was pending.
+        """
+        return self.repository.commit()
+
+    def _get_tournament_for_update(self, index):
         """
-        data = []
-        for tournament in self.tournaments:
-            data.append(tournament.to_dict())
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        Return the tournament at index and mark it dirty.
+
+        Parameters
+        ----------
+        index : int
+            Index of the tournament.
+
+        Returns
+        -------
+        Tournament
+            The tournament about to be modified.
+        """
+        tournament = self.get_tournament(index)
+        self.repository.mark_dirty(tournament)
+        return tournament
 
     def display_tournaments(self):
         """
-        Return the list of tournaments, reloading from storage first.
+        Return the list of tournaments, loading them on the first call.
 
         Returns
         -------
         list[Tournament]
             In-memory list of Tournament instances.
         """
-        self.tournaments.clear()
-        self.load_tournaments_from_json()
-        return self.tournaments
+        return self.repository.ensure_loaded()
+
+    def get_tournaments_summaries(self):
+        """
+        Return the headers of the tournaments for listings.
 
-    def add_tournament(self, name, location, start_date, end_date, description):
+        With the sharded storage only the manifest is read.
+
+        Returns
+        -------
+        list[TournamentSummary]
+            One summary per tournament, in index order.
+        """
+        return self.repository.summaries()
+
+    def add_tournament(self, name, location, start_date, end_date, description, rating_engine=None):
         """
         Create a new Tournament and persist it.
 
@@ -129,18 +204,21 @@ class TournamentController:
             End date string (YYYY-MM-DD).
         description : str
             Optional description for the tournament.
+        rating_engine : str | None
+            Rating system applied when the tournament ends, a key of
+            utils.rating_engine_utils.RATING_ENGINES (None or "elo" for the
+            classic ELO).
         """
-        self.tournaments.clear()
-        self.load_tournaments_from_json()
         new_tournament = Tournament(
             name=name,
             location=location,
             start_date=start_date,
             end_date=end_date,
             description=description,
+            rating_engine=rating_engine if rating_engine != DEFAULT_RATING_ENGINE else None,
             )
-        self.tournaments.append(new_tournament)
-        self.save_tournaments_to_json()
+        self.repository.add(new_tournament)
+        self.commit()
 
     def remove_tournament(self, index):
         """
@@ -156,10 +234,8 @@ class TournamentController:
         tuple (name, tournament_id)
             Name and unique id of the removed tournament.
         """
-        self.tournaments.clear()
-        self.load_tournaments_from_json()
-        remove_tournament = self.tournaments.pop(index)
-        self.save_tournaments_to_json()
+        remove_tournament = self.repository.remove(index)
+        self.commit()
         return remove_tournament.name, remove_tournament.tournament_id
 
     def modify_tournament(self, index, name=None, location=None, start_date=None, end_date=None, description=None):
@@ -175,9 +251,7 @@ class TournamentController:
         name, location, start_date, end_date, description : optional
             New values for corresponding tournament attributes.
         """
-        self.tournaments.clear()
-        self.load_tournaments_from_json()
-        tournament = self.tournaments[index]
+        tournament = self._get_tournament_for_update(index)
         if name:
             tournament.name = name
         if location:
@@ -188,7 +262,7 @@ class TournamentController:
             tournament.end_date = end_date
         if description:
             tournament.description = description
-        self.save_tournaments_to_json()
+        self.commit()
 
     def subscribe_players(self, index, player_ids):
         """
@@ -206,9 +280,7 @@ class TournamentController:
         tuple (subscribed_ids, already_subscribed_ids)
             Subscribed IDs and IDs that were already present.
         """
-        self.tournaments.clear()
-        self.load_tournaments_from_json()
-        tournament = self.tournaments[index]
+        tournament = self._get_tournament_for_update(index)
         subscribed_ids = []
         already_subscribed_ids = []
         for pid in player_ids:
@@ -217,12 +289,12 @@ class TournamentController:
                 subscribed_ids.append(pid)
             else:
                 already_subscribed_ids.append(pid)
-        self.save_tournaments_to_json()
+        self.commit()
         return subscribed_ids, already_subscribed_ids
 
     def get_tournament(self, index):
         """
-        Retrieve a tournament by index after reloading storage.
+        Retrieve a tournament by index.
 
         Parameters
         ----------
@@ -234,9 +306,7 @@ class TournamentController:
         Tournament
             The requested Tournament instance.
         """
-        self.tournaments.clear()
-        self.load_tournaments_from_json()
-        return self.tournaments[index]
+        return self.repository.get_at(index)
 
     def get_tournaments_count(self):
         """
@@ -247,9 +317,7 @@ class TournamentController:
         int
             Number of tournaments.
         """
-        self.tournaments.clear()
-        self.load_tournaments_from_json()
-        return len(self.tournaments)
+        return self.repository.count()
 
     def get_tournament_round_matches_count(self, index, round_index):
         """
@@ -267,30 +335,82 @@ class TournamentController:
         int
             Number of matches in the requested round.
         """
-        self.tournaments.clear()
-        self.load_tournaments_from_json()
-        return len(self.tournaments[index].rounds[round_index].matches)
+        return len(self.get_tournament(index).rounds[round_index].matches)
 
-    def start_tournament(self, index):
+    def start_tournament(self, index, round_robin=True, accelerated=False):
         """
         Initialize a tournament: set status, compute number of rounds and create first round.
 
+        A round robin computes its whole Berger schedule here (every player
+        meets every other once, with alternating colours) and the number of
+        rounds follows from it: n - 1 rounds for an even number n of players,
+        n rounds with one bye per round for an odd one.
+
+        Otherwise the first round is paired at random (the player left out
+        with an odd count is exempted) and the following rounds by the Swiss
+        engine.
+
+        The colours and the bye of the first round start the player history
+        of the tournament.
+
+        The tournament receives a random pairing seed (tournament.pairing,
+        with the Swiss strategy of config.PAIRING_STRATEGY): the Berger
+        seeding order and every Swiss round are drawn with a generator
+        derived from it (utils.pairing_utils.round_rng), so the pairings
+        can be replayed (see replay_tournament_pairings()).
+
+        An accelerated Swiss tournament stores its acceleration settings in
+        tournament.pairing["acceleration"]: the better rated half of the
+        players (ELO of the player repository) gets virtual points in the
+        first rounds, the first round included, which is then paired by the
+        Swiss engine instead of drawn at random. Virtual points are only
+        used to pair; tournament.players keeps the real points.
+
         Parameters
         ----------
         index : int
             Index of the tournament to start.
+        round_robin : bool
+            Schedule the tournament as a round robin (default).
+        accelerated : bool
+            Use accelerated pairings (Swiss tournaments only).
         """
-        self.tournaments.clear()
-        self.load_tournaments_from_json()
-        tournament = self.tournaments[index]
+        tournament = self._get_tournament_for_update(index)
         tournament.current_round = 1
-        tournament.number_of_rounds = len(tournament.players) - 1
         tournament.status = "En cours"
+        tournament.player_history = PlayerHistory()
+        seed = random.getrandbits(32)
         # Instancier le premier round
-        matches, tournament.matches_history = generate_first_round_matches(tournament.players)
-        first_round = TournamentRound(round_number=1, matches=matches, status="En cours")
+        if round_robin:
+            tournament.pairing = {"seed": seed}
+            tournament.schedule = berger_schedule(list(tournament.players), round_rng(seed, 0))
+            tournament.number_of_rounds = len(tournament.schedule["rounds"])
+            matches, bye = schedule_round(tournament.schedule, 0)
+            tournament.matches_history = [[white[0], black[0]] for white, black in matches]
+            tournament.player_history.record_round(matches, bye)
+        else:
+            strategy = config.PAIRING_STRATEGY if config.PAIRING_STRATEGY in PAIRING_STRATEGIES else "backtracking"
+            tournament.pairing = {"seed": seed, "strategy": strategy}
+            tournament.number_of_rounds = len(tournament.players) - 1
+            if accelerated:
+                player_repository = get_player_repository()
+                ratings = {}
+                for player_id in tournament.players:
+                    player = player_repository.get(player_id)
+                    ratings[player_id] = player.elo if player is not None else 0
+                tournament.pairing["acceleration"] = acceleration_settings(ratings)
+                matches, bye, points = pair_next_round(
+                    tournament.players, PlayedPairs(), 1, tournament.pairing, tournament.player_history)
+                tournament.player_history.record_round(matches, bye, points)
+                tournament.matches_history = [[white[0], black[0]] for white, black in matches]
+            else:
+                matches, tournament.matches_history = generate_first_round_matches(
+                    tournament.players, tournament.player_history, round_rng(seed, 1))
+                paired = {player_id for pair in tournament.matches_history for player_id in pair}
+                bye = next((player_id for player_id in tournament.players if player_id not in paired), None)
+        first_round = TournamentRound(round_number=1, matches=matches, status="En cours", bye=bye)
         tournament.rounds.append(first_round)
-        self.save_tournaments_to_json()
+        self.commit()
 
     def tournament_round_status_update(self, index, round_index):
         """
@@ -308,10 +428,7 @@ class TournamentController:
         bool | None
             True if all matches have results, otherwise None.
         """
-        self.tournaments.clear()
-        self.load_tournaments_from_json()
-        tournament = self.tournaments[index]
-        round = tournament.rounds[round_index]
+        round = self.get_tournament(index).rounds[round_index]
         matches_count = len(round.matches)
         matches_over = 0
         for match in round.matches:
@@ -320,12 +437,13 @@ class TournamentController:
 
         if matches_over == matches_count:
             return True
-        self.save_tournaments_to_json()
 
     def close_tournament_round(self, index, round_index):
         """
         Mark a specific tournament round as finished and set its end timestamp.
 
+        The change is recorded as a repository event.
+
         Parameters
         ----------
         index : int
@@ -334,19 +452,26 @@ class TournamentController:
             Round index to close.
         """
         now = datetime.now()
-        self.tournaments.clear()
-        self.load_tournaments_from_json()
-        tournament = self.tournaments[index]
+        tournament = self.get_tournament(index)
         round = tournament.rounds[round_index]
         round.end_date = now.strftime("%Y-%m-%d")
         round.end_time = now.strftime("%H:%M:%S")
         round.status = "Terminé"
-        self.save_tournaments_to_json()
+        self.repository.record(tournament, {
+            "type": "round_close",
+            "round_index": round_index,
+            "end_date": round.end_date,
+            "end_time": round.end_time,
+            "status": round.status,
+        })
 
     def put_tournament_round_match_results(self, index, round_index, match_number, result1):
         """
         Record the result of a specific match in a round.
 
+        The result is recorded as a repository event instead of rewriting
+        the whole store.
+
         Parameters
         ----------
         index : int
@@ -358,18 +483,26 @@ class TournamentController:
         result1 : str | float
             Result from the white player's perspective ("1", "0", "0.5", etc.).
         """
-        self.tournaments.clear()
-        self.load_tournaments_from_json()
-        tournament = self.tournaments[index]
+        tournament = self.get_tournament(index)
         round = tournament.rounds[round_index]
         match = round.matches[int(match_number)]
         round.matches[int(match_number)] = inscribe_match_results(match, result1)
-        self.save_tournaments_to_json()
+        self.repository.record(tournament, {
+            "type": "result",
+            "round_index": round_index,
+            "match_index": int(match_number),
+            "scores": [match[0][1], match[1][1]],
+        })
 
     def update_tournament_round_players_points(self, index, round_index):
         """
         Update players' accumulated points from a completed round.
 
+        The player exempted from the round, if any, scores BYE_POINTS. The
+        round is then applied to the tie-break aggregates and the score
+        index of the tournament (Tournament.tie_breaks()), which the next
+        pairing and the standings read.
+
         Parameters
         ----------
         index : int
@@ -377,32 +510,267 @@ class TournamentController:
         round_index : int
             Round index whose match results should be applied.
         """
-        self.tournaments.clear()
-        self.load_tournaments_from_json()
-        tournament = self.tournaments[index]
+        tournament = self.get_tournament(index)
         round = tournament.rounds[round_index]
         for match in round.matches:
             tournament.players[match[0][0]] += match[0][1]
             tournament.players[match[1][0]] += match[1][1]
-        self.save_tournaments_to_json()
+        if round.bye is not None:
+            tournament.players[round.bye] += BYE_POINTS
+        tournament.tie_breaks()
+        self.repository.record(tournament, {"type": "points", "players": dict(tournament.players)})
 
     def initiate_next_tournament_round(self, index):
         """
         Generate pairings and append the next round to the tournament.
 
+        A round robin reads the round from its precomputed schedule.
+        Otherwise every player is paired by the Swiss engine
+        (utils.tournament_utils.pair_next_round, with the strategy and the round generator of
+        the tournament's pairing seed; config.PAIRING_STRATEGY and the
+        random module for tournaments started without a seed) from the
+        player history of the tournament, which gives the colours and, with
+        an odd number of players, the exempted player among those who have
+        not had a bye yet. The round is then added to the player history and
+        recorded as a repository event. During the accelerated rounds of an
+        accelerated tournament the round is paired on the points plus the
+        virtual points of group A (utils.pairing_utils.pairing_points); the
+        other rounds are paired on the score groups of the live standings
+        (Tournament.score_groups()).
+
         Parameters
         ----------
         index : int
             Tournament index.
         """
-        self.tournaments.clear()
-        self.load_tournaments_from_json()
-        tournament = self.tournaments[index]
+        tournament = self.get_tournament(index)
+        history_length = len(tournament.matches_history)
+        matches, bye, points = pair_next_round(**self._pairing_job(tournament))
+        next_round = self._append_round(tournament, matches, bye, points)
+        self.repository.record(tournament, {
+            "type": "pairing",
+            "current_round": tournament.current_round,
+            "round": next_round.to_dict(),
+            "history": tournament.matches_history[history_length:],
+        })
+
+    def initiate_next_rounds(self, tournament_ids, workers=None):
+        """
+        Pair the next round of several tournaments at once.
+
+        The rounds are paired concurrently in a pool of worker processes
+        (utils.tournament_utils.pair_next_rounds), exactly as
+        initiate_next_tournament_round() would pair them one by one, then
+        every new round is appended and the tournaments are written in a
+        single commit.
+
+        A tournament is only paired if it is running, its last round is
+        finished and it has rounds left; the others are returned as skipped.
+
+        Parameters
+        ----------
+        tournament_ids : iterable
+            Ids of the tournaments (e.g. the sections of a festival).
+        workers : int | None
+            Number of worker processes (defaults to the number of CPUs).
+
+        Returns
+        -------
+        tuple (paired, skipped)
+            paired: one dict per paired tournament, {"tournament_id",
+            "name", "round", "boards", "seconds"}, seconds being its pairing
+            time; skipped: the ids that are unknown or not ready.
+        """
+        tournaments = []
+        skipped = []
+        for tournament_id in dict.fromkeys(tournament_ids):
+            tournament = self.repository.get(tournament_id)
+            if (tournament is None or tournament.status != "En cours" or not tournament.rounds
+                    or tournament.rounds[-1].status != "Terminé"
+                    or len(tournament.rounds) >= tournament.number_of_rounds):
+                skipped.append(tournament_id)
+            else:
+                tournaments.append(tournament)
+        results = pair_next_rounds([self._pairing_job(tournament) for tournament in tournaments], workers)
+        paired = []
+        for tournament, (matches, bye, points, seconds) in zip(tournaments, results):
+            next_round = self._append_round(tournament, matches, bye, points)
+            self.repository.mark_dirty(tournament)
+            paired.append({
+                "tournament_id": tournament.tournament_id,
+                "name": tournament.name,
+                "round": next_round.name,
+                "boards": len(matches),
+                "seconds": seconds,
+            })
+        if paired:
+            self.commit()
+        return paired, skipped
+
+    def _pairing_job(self, tournament):
+        """
+        Return the arguments of pair_next_round() for the next round of a tournament.
+
+        Parameters
+        ----------
+        tournament : Tournament
+            The tournament to pair.
+
+        Returns
+        -------
+        dict
+            Keyword arguments of utils.tournament_utils.pair_next_round().
+        """
+        return {
+            "players": tournament.players,
+            "played": tournament.played_pairs(),
+            "round_number": len(tournament.rounds) + 1,
+            "pairing": tournament.pairing,
+            "history": tournament.player_history,
+            "schedule": tournament.schedule,
+            "strategy": config.PAIRING_STRATEGY,
+            "score_groups": tournament.score_groups() if tournament.schedule is None else None,
+        }
+
+    def _append_round(self, tournament, matches, bye, points):
+        """
+        Append a newly paired round to a tournament.
+
+        The round is added to the player history and the matches history,
+        and current_round moves to it.
+
+        Parameters
+        ----------
+        tournament : Tournament
+            The paired tournament.
+        matches : list of tuple
+            Matches of the round ([white_id, ""], [black_id, ""]).
+        bye : str | None
+            The player exempted from the round.
+        points : dict
+            The points the round was paired on.
+
+        Returns
+        -------
+        TournamentRound
+            The new round.
+        """
         tournament.current_round += 1
-        matches, tournament.matches_history = generate_round_matches(tournament.players, tournament.matches_history)
-        next_round = TournamentRound(round_number=tournament.current_round, matches=matches, status="En cours")
+        tournament.player_history.record_round(matches, bye, points)
+        tournament.matches_history.extend([white[0], black[0]] for white, black in matches)
+        next_round = TournamentRound(
+            round_number=tournament.current_round, matches=matches, status="En cours", bye=bye)
         tournament.rounds.append(next_round)
-        self.save_tournaments_to_json()
+        return next_round
+
+    def forecast_tournament(self, index, simulations=10000, workers=None, seed=None):
+        """
+        Forecast the final standings of a tournament (Monte Carlo).
+
+        The remaining games are simulated from the players' ELO
+        (utils.forecast_utils): the results still missing in the current
+        round, then the rounds left, paired with the configured strategy or
+        read from the round-robin schedule.
+
+        Parameters
+        ----------
+        index : int
+            Tournament index.
+        simulations : int
+            Number of simulated tournaments.
+        workers : int | None
+            Number of worker processes (defaults to the number of CPUs).
+        seed : int | None
+            Seed making the forecast reproducible.
+
+        Returns
+        -------
+        list[tuple]
+            (player_id, current points, forecast) sorted by decreasing win
+            probability, forecast being {"win", "podium", "points"}.
+        """
+        tournament = self.get_tournament(index)
+        points = dict(tournament.players)
+        pending = []
+        current = tournament.rounds[-1] if tournament.rounds else None
+        if current is not None and current.status != "Terminé":
+            for match in current.matches:
+                if match[0][1] == "":
+                    pending.append(match)
+                else:
+                    points[match[0][0]] += match[0][1]
+                    points[match[1][0]] += match[1][1]
+            if current.bye is not None:
+                points[current.bye] += BYE_POINTS
+        player_repository = get_player_repository()
+        ratings = {}
+        for player_id in points:
+            player = player_repository.get(player_id)
+            if player is not None:
+                ratings[player_id] = player.elo
+        strategy = (tournament.pairing or {}).get("strategy", config.PAIRING_STRATEGY)
+        forecast = forecast_standings(
+            points, ratings, tournament.matches_history,
+            rounds_left=max(0, tournament.number_of_rounds - len(tournament.rounds)),
+            pending_matches=pending,
+            byes=[player_id for player_id in points if tournament.player_history.had_bye(player_id)],
+            schedule=tournament.schedule,
+            next_round=len(tournament.rounds),
+            simulations=simulations, workers=workers, seed=seed,
+            strategy=strategy if strategy in PAIRING_STRATEGIES else "backtracking",
+            acceleration=(tournament.pairing or {}).get("acceleration"),
+        )
+        return sorted(((player_id, points[player_id], forecast[player_id]) for player_id in points),
+                      key=lambda row: (row[2]["win"], row[2]["podium"], row[2]["points"]), reverse=True)
+
+    def replay_tournament_pairings(self, index):
+        """
+        Pair every stored round of a tournament again and compare.
+
+        Each round is regenerated from the pairing seed of the tournament and
+        the stored state before it (see utils.tournament_utils.replay_rounds),
+        which checks that the published pairings are those of the engine.
+
+        Parameters
+        ----------
+        index : int
+            Tournament index.
+
+        Returns
+        -------
+        list[dict] | None
+            The rounds paired differently (empty if every round was
+            reproduced), or None for a tournament without pairing seed.
+        """
+        tournament = self.get_tournament(index)
+        if "seed" not in (tournament.pairing or {}):
+            return None
+        return replay_rounds(tournament.players, tournament.rounds, tournament.pairing, tournament.schedule)
+
+    def get_standings(self, index, order=None, limit=None):
+        """
+        Return the standings of a tournament, tie-breaks included.
+
+        Parameters
+        ----------
+        index : int
+            Tournament index.
+        order : sequence of str | None
+            Names of utils.tie_break_utils.TIE_BREAKS compared after the
+            points; defaults to config.TIE_BREAK_ORDER.
+        limit : int | None
+            Number of leading rows (e.g. the podium), or None for every
+            player.
+
+        Returns
+        -------
+        tuple (labels, rows)
+            The labels of the tie-breaks used, and the {"rank", "player_id",
+            "points", "tie_breaks"} rows of Tournament.standings(), best
+            first.
+        """
+        order = tuple(order) if order else parse_tie_break_order(config.TIE_BREAK_ORDER)
+        return [TIE_BREAKS[name] for name in order], self.get_tournament(index).standings(order, limit)
 
     def close_tournament(self, index):
         """
@@ -413,8 +781,6 @@ class TournamentController:
         index : int
             Tournament index.
         """
-        self.tournaments.clear()
-        self.load_tournaments_from_json()
-        tournament = self.tournaments[index]
+        tournament = self._get_tournament_for_update(index)
         tournament.status = "Terminé"
-        self.save_tournaments_to_json()
+        self.commit()
@@ -1,3 +1,26 @@
+def coefficient_k(games_played, elo):
+    """
+    Return the K coefficient of a player.
+
+    Parameters
+    ----------
+    games_played : int
+        Number of games played by the player.
+    elo : int | float
+        Current ELO rating of the player.
+
+    Returns
+    -------
+    int
+        40 if games_played < 30, 20 if elo < 2400, 10 otherwise.
+    """
+    if games_played < 30:
+        return 40
+    if elo < 2400:
+        return 20
+    return 10
+
+
 class ChessPlayer:
     """Represent a chess player with personal information, rating and activity.
 
@@ -17,6 +40,10 @@ class ChessPlayer:
         Coefficient K used for ELO updates (determined by experience / rating).
     games_played : int
         Number of games recorded for this player in the application.
+    glicko : list | None
+        Glicko-2 state [rating, deviation, volatility], set once the player
+        played a tournament rated with Glicko-2 (see
+        utils.rating_engine_utils), None otherwise.
 
     Methods
     -------
@@ -32,7 +59,7 @@ class ChessPlayer:
         Class method: construct a ChessPlayer from a dict (deserialization).
     """
 
-    def __init__(self, surname, name, date_of_birth, id, elo, coef_k=40, games_played=0):
+    def __init__(self, surname, name, date_of_birth, id, elo, coef_k=40, games_played=0, glicko=None):
         """
         Initialize a ChessPlayer instance.
 
@@ -48,6 +75,8 @@ class ChessPlayer:
             Federation chess identifier (unique).
         elo : int | float
             Initial ELO rating for the player.
+        glicko : list | None
+            Glicko-2 state [rating, deviation, volatility], if any.
 
         Notes
         -----
@@ -61,6 +90,7 @@ class ChessPlayer:
         self.elo = elo
         self.coef_k = coef_k
         self.games_played = games_played
+        self.glicko = glicko
 
     def modify_elo(self, new_elo):
         """
@@ -80,12 +110,7 @@ class ChessPlayer:
             * coef_k = 10 if elo >= 2400
         """
         self.elo = new_elo
-        if self.games_played < 30:
-            self.coef_k = 40
-        elif self.elo < 2400:
-            self.coef_k = 20
-        else:
-            self.coef_k = 10
+        self.coef_k = coefficient_k(self.games_played, self.elo)
 
     def modify_games_played(self, new_games_played):
         """
@@ -102,9 +127,10 @@ class ChessPlayer:
         """
         Return a dictionary representation of the player.
 
-        Useful for JSON serialization in order to save data.
+        Useful for JSON serialization in order to save data. The "glicko"
+        key is only present for players with a Glicko-2 state.
         """
-        return {
+        data = {
             "surname": self.surname,
             "name": self.name,
             "date_of_birth": self.date_of_birth,
@@ -113,6 +139,9 @@ class ChessPlayer:
             "coef_k": self.coef_k,
             "games_played": self.games_played
         }
+        if self.glicko is not None:
+            data["glicko"] = self.glicko
+        return data
 
     @classmethod
     def from_dict(cls, data):
@@ -128,5 +157,6 @@ class ChessPlayer:
             id=data["federation_chess_id"],
             elo=data["elo"],
             coef_k=data["coef_k"],
-            games_played=data["games_played"]
+            games_played=data["games_played"],
+            glicko=data.get("glicko")
         )
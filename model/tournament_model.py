@@ -1,7 +1,40 @@
 from datetime import datetime
+from utils.history_utils import PlayerHistory
+from utils.pairing_utils import PlayedPairs
+from utils.tie_break_utils import TieBreaks
 from utils.unique_id_generator import generate_unique_id
 
 
+def _lazy_field(name):
+    """
+    Build the property of a Tournament field that can be decoded on demand.
+
+    Parameters
+    ----------
+    name : str
+        Name of the field (one of Tournament.LAZY_FIELDS).
+
+    Returns
+    -------
+    property
+        Property storing its value in the "_<name>" attribute and
+        materialising it on first read when it is still deferred.
+    """
+    attribute = "_" + name
+
+    def getter(self):
+        if name in self._deferred:
+            self._materialise(name)
+        return getattr(self, attribute)
+
+    def setter(self, value):
+        if name in self._deferred:
+            self._deferred = self._deferred - {name}
+        setattr(self, attribute, value)
+
+    return property(getter, setter)
+
+
 class Tournament:
     """Represent a tournament with metadata, players, rounds and match history.
 
@@ -31,15 +64,59 @@ class Tournament:
         Tournament status (e.g. "À venir", "En cours", "Terminé").
     tournament_id : str
         Unique tournament identifier.
+    schedule : dict | None
+        Precomputed round-robin schedule (see utils.round_robin_utils), or
+        None for tournaments paired round by round.
+    pairing : dict | None
+        Pairing settings of a Swiss tournament: {"seed": int, "strategy":
+        str}. Each round is paired with a random generator derived from the
+        seed (utils.pairing_utils.round_rng), so it can be reproduced. None
+        for round robins and tournaments started before seeding.
+    rating_engine : str | None
+        Rating system applied to the players when the tournament ends, a
+        key of utils.rating_engine_utils.RATING_ENGINES; None for the
+        classic ELO.
+    player_history : PlayerHistory
+        Colours, byes and downfloats of the players (see
+        utils.history_utils), updated with each new round.
+    players_count : int
+        Number of registered players, read from the header while the
+        players are deferred.
 
     Methods
     -------
     to_dict():
         Return a serializable dictionary representation of the tournament.
-    from_dict(data):
+    from_dict(data, lazy=False):
         Create a Tournament instance from a dictionary (deserialisation).
+    from_header(data, load_body):
+        Create a Tournament whose players, rounds and matches history are
+        decoded on first access.
+    is_materialised():
+        Return True once every deferred field has been decoded.
+    played_pairs():
+        Return the index of the pairs of players who already met.
+    tie_breaks():
+        Return the tie-break aggregates of the finished rounds.
+    standings(order=None, limit=None):
+        Return the standings sorted by points and tie-breaks.
+    score_groups():
+        Return the live score groups the next round is paired on.
+
+    Notes
+    -----
+    players, rounds, matches_history and player_history are properties. On a lazily loaded
+    tournament each of them is decoded the first time it is read; until
+    then only the header fields (name, status, dates...) are in memory.
     """
 
+    LAZY_FIELDS = ("players", "rounds", "matches_history", "player_history")
+
+    players = _lazy_field("players")
+    rounds = _lazy_field("rounds")
+    matches_history = _lazy_field("matches_history")
+    player_history = _lazy_field("player_history")
+
     def __init__(
         self,
         name,
@@ -54,6 +131,10 @@ class Tournament:
         matches_history=None,
         status="À venir",
         tournament_id=None,
+        schedule=None,
+        player_history=None,
+        pairing=None,
+        rating_engine=None,
     ):
         """
         Initialize a Tournament instance.
@@ -71,7 +152,22 @@ class Tournament:
             matches_history (list | None): Historical match records.
             status (str): Tournament status.
             tournament_id (str | None): Uniquely generated ID.
+            schedule (dict | None): Precomputed round-robin schedule.
+            player_history (PlayerHistory | None): History of the players;
+                rebuilt from the rounds if omitted.
+            pairing (dict | None): Pairing seed and strategy of a Swiss tournament.
+            rating_engine (str | None): Rating system of the tournament
+                (None for the classic ELO).
         """
+        self._deferred = frozenset()
+        self._load_body = None
+        self._body = None
+        self._played_pairs = None
+        self._played_pairs_source = None
+        self._played_pairs_count = 0
+        self._tie_breaks = None
+        self._tie_breaks_source = None
+        self._players_count = None
         self.name = name
         self.location = location
         self.start_date = start_date if start_date else ""
@@ -84,6 +180,10 @@ class Tournament:
         self.description = description
         self.status = status
         self.tournament_id = tournament_id if tournament_id else generate_unique_id()
+        self.schedule = schedule
+        self.pairing = pairing
+        self.rating_engine = rating_engine
+        self.player_history = player_history if player_history is not None else PlayerHistory.from_rounds(self.rounds)
 
     def to_dict(self):
         """
@@ -92,8 +192,18 @@ class Tournament:
         Useful for JSON serialization in order to save data.
 
         Converts rounds to dictionaries if they are TournamentRound instances.
+        Rounds that were never accessed are returned in their stored form
+        without being decoded. The "schedule" key is only present for
+        tournaments with a round-robin schedule, the "pairing" key for
+        seeded Swiss tournaments, the "rating_engine" key for tournaments
+        not rated with the classic ELO, the "player_history" key once a
+        round was paired.
         """
-        return {
+        if "rounds" in self._deferred:
+            rounds = self._read_body()["rounds"]
+        else:
+            rounds = self.rounds if not self.rounds else [r.to_dict() for r in self.rounds]
+        data = {
             "name": self.name,
             "location": self.location,
             "start_date": self.start_date,
@@ -101,23 +211,42 @@ class Tournament:
             "number_of_rounds": self.number_of_rounds,
             "current_round": self.current_round,
             "matches_history": self.matches_history,
-            "rounds": self.rounds if not self.rounds else [r.to_dict() for r in self.rounds],
+            "rounds": rounds,
             "players": self.players,
             "description": self.description,
             "status": self.status,
             "tournament_id": self.tournament_id,
         }
+        if self.schedule is not None:
+            data["schedule"] = self.schedule
+        if self.pairing is not None:
+            data["pairing"] = self.pairing
+        if self.rating_engine is not None:
+            data["rating_engine"] = self.rating_engine
+        if "player_history" in self._deferred:
+            player_history = self._read_body().get("player_history")
+        else:
+            player_history = self.player_history.to_dict() if len(self.player_history) else None
+        if player_history is not None:
+            data["player_history"] = player_history
+        return data
 
     @classmethod
-    def from_dict(cls, data):
+    def from_dict(cls, data, lazy=False):
         """
         Create a Tournament instance from a dictionary.
 
         Expects keys matching the structure produced by to_dict(). Rounds are
-        reconstructed as TournamentRound objects via TournamentRound.r_from_dict.
+        reconstructed as TournamentRound objects via TournamentRound.r_from_dict
+        and the player history via PlayerHistory.from_dict (or from the
+        rounds for data stored without it).
+        With lazy=True only the header is read now and the rounds are
+        reconstructed when first accessed (see from_header()).
 
         Useful for JSON deserialization in order to load data.
         """
+        if lazy:
+            return cls.from_header(data, lambda: data)
         return cls(
             name=data["name"],
             location=data["location"],
@@ -131,7 +260,180 @@ class Tournament:
             description=data["description"],
             status=data["status"],
             tournament_id=data["tournament_id"],
+            schedule=data.get("schedule"),
+            pairing=data.get("pairing"),
+            rating_engine=data.get("rating_engine"),
+            player_history=PlayerHistory.from_dict(data["player_history"]) if "player_history" in data else None,
+        )
+
+    @classmethod
+    def from_header(cls, data, load_body):
+        """
+        Create a Tournament from its header fields only.
+
+        Args:
+            data (dict): Record holding at least the header keys of to_dict()
+                (everything except players, rounds, matches_history and
+                player_history), and optionally "players_count" (or
+                "players") to count the players without loading the body.
+            load_body (callable): Function returning a dict with the
+                "players", "rounds" (as dicts), "matches_history" and
+                optionally "player_history" keys. It is called once, on the
+                first access to one of them.
+
+        Returns:
+            Tournament: The tournament with its deferred fields pending.
+        """
+        tournament = cls(
+            name=data["name"],
+            location=data["location"],
+            start_date=data["start_date"],
+            end_date=data["end_date"],
+            current_round=data["current_round"],
+            number_of_rounds=data["number_of_rounds"],
+            description=data["description"],
+            status=data["status"],
+            tournament_id=data["tournament_id"],
+            schedule=data.get("schedule"),
+            pairing=data.get("pairing"),
+            rating_engine=data.get("rating_engine"),
         )
+        tournament._load_body = load_body
+        tournament._body = None
+        tournament._deferred = frozenset(cls.LAZY_FIELDS)
+        if "players_count" in data:
+            tournament._players_count = data["players_count"]
+        elif "players" in data:
+            tournament._players_count = len(data["players"])
+        return tournament
+
+    @property
+    def players_count(self):
+        """
+        Return the number of registered players.
+
+        While the players are deferred the count stored with the header is
+        returned, so listing tournaments does not decode their bodies.
+        """
+        if "players" in self._deferred and self._players_count is not None:
+            return self._players_count
+        return len(self.players)
+
+    def played_pairs(self):
+        """
+        Return the index of the pairs of players who already met.
+
+        The index is built from matches_history on first use, then only the
+        pairs appended to matches_history since the previous call are added,
+        so keeping it up to date costs O(boards) per round. It is rebuilt if
+        matches_history is replaced.
+
+        Returns:
+            PlayedPairs: O(1) rematch checks for the pairing engine.
+        """
+        history = self.matches_history
+        if (self._played_pairs is None or self._played_pairs_source is not history
+                or self._played_pairs_count > len(history)):
+            self._played_pairs = PlayedPairs()
+            self._played_pairs_source = history
+            self._played_pairs_count = 0
+        if self._played_pairs_count < len(history):
+            self._played_pairs.add_all(history[self._played_pairs_count:])
+            self._played_pairs_count = len(history)
+        return self._played_pairs
+
+    def tie_breaks(self):
+        """
+        Return the tie-break aggregates of the finished rounds.
+
+        The aggregates are built from the rounds on first use, then only the
+        rounds finished since the previous call are applied
+        (TieBreaks.record_round), so the standings stay up to date at the
+        cost of one round per round. They are rebuilt if the rounds or the
+        players are replaced.
+
+        Returns:
+            TieBreaks: Points and tie-breaks of the players.
+        """
+        rounds = self.rounds
+        finished = 0
+        while finished < len(rounds) and rounds[finished].status == "Terminé":
+            finished += 1
+        if (self._tie_breaks is None or self._tie_breaks_source is not rounds
+                or self._tie_breaks.rounds_recorded > finished or len(self._tie_breaks) < len(self.players)):
+            self._tie_breaks = TieBreaks(self.players)
+            self._tie_breaks_source = rounds
+        for round in rounds[self._tie_breaks.rounds_recorded:finished]:
+            self._tie_breaks.record_round(round.matches, round.bye)
+        return self._tie_breaks
+
+    def standings(self, order=None, limit=None):
+        """
+        Return the standings of the tournament.
+
+        Args:
+            order (sequence | None): Names of utils.tie_break_utils.TIE_BREAKS
+                compared after the points (default DEFAULT_TIE_BREAK_ORDER).
+            limit (int | None): Number of leading rows to return, or None for
+                every player.
+
+        Returns:
+            list: {"rank", "player_id", "points", "tie_breaks"} rows, best
+            first (see TieBreaks.standings()).
+        """
+        return self.tie_breaks().standings(order, limit)
+
+    def score_groups(self):
+        """
+        Return the score groups of the live standings.
+
+        The groups are read from the score index kept up to date round by
+        round (TieBreaks.scores), instead of grouping the players by points
+        again.
+
+        Returns:
+            list | None: (points, player ids) pairs, highest points first,
+            each group in registration order, as expected by the pairing
+            functions (utils.pairing_utils); None while a round is not
+            finished, the index then lagging behind the points.
+        """
+        tie_breaks = self.tie_breaks()
+        if tie_breaks.rounds_recorded < len(self.rounds):
+            return None
+        return list(tie_breaks.scores.score_groups())
+
+    def is_materialised(self):
+        """
+        Return True if no field is waiting to be decoded.
+        """
+        return not self._deferred
+
+    def _read_body(self):
+        """
+        Return the stored players, rounds and matches history, loading them once.
+        """
+        if self._body is None:
+            self._body = self._load_body()
+        return self._body
+
+    def _materialise(self, name):
+        """
+        Decode a deferred field from the stored body.
+
+        Args:
+            name (str): One of LAZY_FIELDS.
+        """
+        if name == "player_history":
+            stored = self._read_body().get(name)
+            value = PlayerHistory.from_dict(stored) if stored is not None else PlayerHistory.from_rounds(self.rounds)
+        else:
+            value = self._read_body()[name]
+        if name == "rounds":
+            value = [TournamentRound.from_dict(r) for r in value]
+        setattr(self, name, value)
+        if not self._deferred:
+            self._body = None
+            self._load_body = None
 
 
 class TournamentRound:
@@ -155,6 +457,8 @@ class TournamentRound:
         List of match records for the round (each match is expected to be serializable).
     status : str
         Round status string.
+    bye : str | None
+        Id of the player exempted from this round (odd number of players).
 
     Methods
     -------
@@ -174,7 +478,8 @@ class TournamentRound:
         name=None,
         end_date=None,
         end_time=None,
-        status=None
+        status=None,
+        bye=None
     ):
         """
         Initialize a TournamentRound.
@@ -189,6 +494,7 @@ class TournamentRound:
             end_date (str | None): End date string.
             end_time (str | None): End time string.
             status (str | None): Round status.
+            bye (str | None): Id of the player exempted from the round.
         """
         self.name = f'Round {round_number}' if round_number else ""
         self.round_id = round_id if round_id else generate_unique_id()
@@ -201,16 +507,18 @@ class TournamentRound:
         self.end_time = end_time
         self.matches = matches if matches is not None else []
         self.status = status if status else ""
+        self.bye = bye
 
     def to_dict(self):
         """
         Return a dictionary representation of the round.
 
-        Keeps match data as-is (expects matches to be serializable).
+        Keeps match data as-is (expects matches to be serializable). The
+        "bye" key is only present for a round with an exempted player.
 
         Useful for JSON serialization in order to save data.
         """
-        return {
+        data = {
             "name": self.name,
             "round_id": self.round_id,
             "start_date": self.start_date,
@@ -220,6 +528,9 @@ class TournamentRound:
             "matches": self.matches,
             "status": self.status,
         }
+        if self.bye is not None:
+            data["bye"] = self.bye
+        return data
 
     @classmethod
     def from_dict(cls, data):
@@ -238,4 +549,81 @@ class TournamentRound:
             end_time=data["end_time"],
             matches=data["matches"],
             status=data["status"],
+            bye=data.get("bye"),
+        )
+
+
+class TournamentSummary:
+    """Lightweight header of a tournament used for listings.
+
+    Holds the fields shown in the tournaments list without the players,
+    rounds and matches history, so a listing does not need to decode them.
+
+    Attributes
+    ----------
+    tournament_id, name, location, start_date, end_date, number_of_rounds,
+    current_round, description, status :
+        Same meaning as on Tournament.
+    players_count : int
+        Number of players subscribed to the tournament.
+
+    Methods
+    -------
+    to_dict():
+        Return a serializable dictionary representation of the summary.
+    from_dict(data):
+        Create a TournamentSummary from a dictionary.
+    from_tournament(tournament):
+        Build the summary of a Tournament instance.
+    """
+
+    FIELDS = (
+        "tournament_id", "name", "location", "start_date", "end_date",
+        "number_of_rounds", "current_round", "players_count", "description", "status",
+    )
+
+    def __init__(self, **fields):
+        """
+        Initialize a TournamentSummary.
+
+        Args:
+            **fields: Values for the names listed in FIELDS (missing ones
+                default to an empty string, or 0 for players_count).
+        """
+        for field in self.FIELDS:
+            setattr(self, field, fields.get(field, 0 if field == "players_count" else ""))
+
+    def to_dict(self):
+        """
+        Return a dictionary representation of the summary.
+
+        Useful for JSON serialization in order to save data.
+        """
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Create a TournamentSummary instance from a dictionary.
+
+        Useful for JSON deserialization in order to load data.
+        """
+        return cls(**{field: data[field] for field in cls.FIELDS if field in data})
+
+    @classmethod
+    def from_tournament(cls, tournament):
+        """
+        Build the summary of a Tournament instance.
+        """
+        return cls(
+            tournament_id=tournament.tournament_id,
+            name=tournament.name,
+            location=tournament.location,
+            start_date=tournament.start_date,
+            end_date=tournament.end_date,
+            number_of_rounds=tournament.number_of_rounds,
+            current_round=tournament.current_round,
+            players_count=tournament.players_count,
+            description=tournament.description,
+            status=tournament.status,
         )
@@ -0,0 +1 @@
+"""Repository package initialization."""
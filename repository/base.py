@@ -0,0 +1,520 @@
+"""
+Storage-independent part of the session repositories.
+
+This module exposes:
+- BaseRepository: identity map, dirty tracking and commit protocol shared by
+  every backend. Backends implement _read_records(), _read_signature() and
+  _flush().
+- BasePlayerRepository / BaseTournamentRepository: the interfaces used by
+  ChessPlayerController and TournamentController.
+- write_text_atomically(filepath, content) / write_bytes_atomically(filepath,
+  content): replace a file without ever leaving it truncated.
+"""
+
+import gc
+import json
+import os
+from abc import ABC, abstractmethod
+import config
+from model.player_model import ChessPlayer
+from model.tournament_model import Tournament, TournamentSummary
+
+
+def write_bytes_atomically(filepath, content):
+    """
+    Write content to a temporary file and atomically rename it to filepath.
+
+    Parameters
+    ----------
+    filepath : str
+        Destination path.
+    content : bytes
+        Data to write.
+    """
+    temporary_path = filepath + ".tmp"
+    with open(temporary_path, "wb") as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary_path, filepath)
+
+
+def write_text_atomically(filepath, content):
+    """
+    Write text to a temporary file and atomically rename it to filepath.
+
+    Parameters
+    ----------
+    filepath : str
+        Destination path.
+    content : str
+        Text to write (UTF-8).
+    """
+    write_bytes_atomically(filepath, content.encode("utf-8"))
+
+
+class BaseRepository(ABC):
+    """Identity-mapped, write-behind store of model objects.
+
+    Attributes
+    ----------
+    model : type
+        Model class providing from_dict() and to_dict().
+    key_attribute : str
+        Name of the natural key attribute used by the identity map.
+    filepath : str
+        Location of the backing store (JSON file or SQLite database).
+    reload_if_changed : bool
+        When True, the store signature is checked on every access and the
+        repository is refreshed if another process modified it.
+    items : list
+        Ordered list of objects (the order used by the index-based menus).
+    identity_map : dict
+        Mapping key -> object. A record loaded from the store always maps to
+        the same object for the whole session.
+    dirty : set
+        Objects modified or added since the last commit.
+    removed : list
+        Objects removed since the last commit.
+    cache_hits : int
+        Number of checks that found the store unchanged and reused the
+        objects already in memory.
+    cache_misses : int
+        Number of (re)loads of the store.
+
+    Methods
+    -------
+    ensure_loaded():
+        Load the store on first access (and on changes when opted in).
+    refresh():
+        Reload the store only if its signature changed since the last load.
+    cache_stats():
+        Return the hit/miss counters of the load cache.
+    get(key):
+        Return the object registered under key or None.
+    get_at(index):
+        Return the object at a position of the ordered list.
+    count():
+        Return the number of stored objects.
+    keys():
+        Return a set-like view of the keys of the stored objects.
+    add(item):
+        Register a new object and mark it dirty.
+    remove(index):
+        Remove and return the object at the given index.
+    mark_dirty(item):
+        Flag an object as modified so the next commit persists it.
+    rekey(item, old_key):
+        Keep the identity map consistent after a key change.
+    commit(filepath=None):
+        Write pending changes; returns True if something was written.
+    """
+
+    model = None
+    key_attribute = None
+
+    def __init__(self, filepath, reload_if_changed=False):
+        """
+        Initialize an empty, not yet loaded repository.
+
+        Parameters
+        ----------
+        filepath : str
+            Location of the backing store.
+        reload_if_changed : bool
+            Opt-in check of the store signature before each access.
+        """
+        self.filepath = filepath
+        self.reload_if_changed = reload_if_changed
+        self.items = []
+        self.identity_map = {}
+        self.dirty = set()
+        self.removed = []
+        self.loaded = False
+        self._signature = None
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @abstractmethod
+    def _read_signature(self):
+        """
+        Return a value that changes whenever the backing store changes.
+        """
+
+    @abstractmethod
+    def _read_records(self):
+        """
+        Return the ordered list of records (dicts) held by the store.
+        """
+
+    @abstractmethod
+    def _flush(self):
+        """
+        Persist the dirty and removed objects to the store.
+        """
+
+    def _decode(self, record):
+        """
+        Build an object from a record of the store.
+        """
+        return self.model.from_dict(record)
+
+    def _bind(self, item, record):
+        """
+        Hook called for every object (re)loaded from record.
+        """
+
+    def _after_load(self):
+        """
+        Hook called at the end of every (re)load.
+        """
+
+    def _key(self, item):
+        """
+        Return the identity map key of an object.
+        """
+        return getattr(item, self.key_attribute)
+
+    def _load(self):
+        """
+        (Re)load the store into the identity map.
+
+        Records whose key is already mapped update the existing object in
+        place, so references held by callers stay valid. Objects with
+        uncommitted changes keep their in-memory values.
+
+        The cyclic garbage collector is paused while the records are decoded:
+        a load only allocates objects that stay alive, so its collections
+        would be pure overhead.
+        """
+        self.cache_misses += 1
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self._load_records()
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    def _load_records(self):
+        """
+        Decode the records of the store into the identity map (see _load()).
+        """
+        items = []
+        identity_map = {}
+        for record in self._read_records():
+            key = record[self.key_attribute]
+            item = None
+            if key not in identity_map:
+                item = self.identity_map.get(key)
+            if item is None:
+                item = self._decode(record)
+            elif item not in self.dirty:
+                vars(item).update(vars(self._decode(record)))
+            self._bind(item, record)
+            items.append(item)
+            identity_map.setdefault(key, item)
+        for item in self.dirty:
+            if self._key(item) not in identity_map:
+                items.append(item)
+                identity_map[self._key(item)] = item
+        self.items[:] = items
+        self.identity_map = identity_map
+        self._signature = self._read_signature()
+        self.loaded = True
+        self._after_load()
+
+    def ensure_loaded(self):
+        """
+        Load the store on first access.
+
+        When reload_if_changed is enabled the store signature is compared with
+        the one recorded at the last load/commit and the repository is
+        refreshed if it changed.
+
+        Returns
+        -------
+        list
+            The ordered list of objects.
+        """
+        if not self.loaded:
+            self._load()
+        elif self.reload_if_changed:
+            self.refresh()
+        return self.items
+
+    def refresh(self):
+        """
+        Reload the store if it changed since the last load or commit.
+
+        The signature of the store ((st_mtime_ns, st_size) for files) is
+        compared with the one recorded at the last load/commit; when it is
+        the same the objects already decoded are kept and a cache hit is
+        counted.
+
+        Returns
+        -------
+        bool
+            True if the store was (re)loaded.
+        """
+        if self.loaded and self._read_signature() == self._signature:
+            self.cache_hits += 1
+            return False
+        self._load()
+        return True
+
+    def cache_stats(self):
+        """
+        Return the counters of the load cache.
+
+        Returns
+        -------
+        dict
+            {"hits": int, "misses": int}
+        """
+        return {"hits": self.cache_hits, "misses": self.cache_misses}
+
+    def get(self, key):
+        """
+        Return the object registered under key.
+
+        Parameters
+        ----------
+        key : str
+            Natural key of the object.
+
+        Returns
+        -------
+        object | None
+            The matching object, or None if not found.
+        """
+        self.ensure_loaded()
+        return self.identity_map.get(key)
+
+    def get_at(self, index):
+        """
+        Return the object at a position of the ordered list.
+
+        Parameters
+        ----------
+        index : int
+            Position of the object.
+
+        Returns
+        -------
+        object
+            The requested object (IndexError if out of range).
+        """
+        return self.ensure_loaded()[index]
+
+    def count(self):
+        """
+        Return the number of stored objects.
+        """
+        return len(self.ensure_loaded())
+
+    def keys(self):
+        """
+        Return the keys of the stored objects.
+
+        Returns
+        -------
+        KeysView
+            Set-like view of the identity map (O(1) membership tests).
+        """
+        self.ensure_loaded()
+        return self.identity_map.keys()
+
+    def add(self, item):
+        """
+        Register a new object and mark it dirty.
+
+        Parameters
+        ----------
+        item : object
+            The object to add.
+        """
+        self.ensure_loaded()
+        self.items.append(item)
+        self.identity_map.setdefault(self._key(item), item)
+        self.dirty.add(item)
+
+    def remove(self, index):
+        """
+        Remove the object at the given index.
+
+        Parameters
+        ----------
+        index : int
+            Position of the object in the ordered list.
+
+        Returns
+        -------
+        object
+            The removed object.
+        """
+        self.ensure_loaded()
+        item = self.items.pop(index)
+        key = self._key(item)
+        if self.identity_map.get(key) is item:
+            del self.identity_map[key]
+            for other in self.items:
+                if self._key(other) == key:
+                    self.identity_map[key] = other
+                    break
+        self.dirty.discard(item)
+        self.removed.append(item)
+        return item
+
+    def mark_dirty(self, item):
+        """
+        Flag an object as modified.
+
+        Parameters
+        ----------
+        item : object
+            An object held by this repository.
+        """
+        self.dirty.add(item)
+
+    def rekey(self, item, old_key):
+        """
+        Update the identity map after an object's key changed.
+
+        Parameters
+        ----------
+        item : object
+            The object whose key attribute was modified.
+        old_key : str
+            The key the object was registered under.
+        """
+        if self.identity_map.get(old_key) is item:
+            del self.identity_map[old_key]
+        self.identity_map.setdefault(self._key(item), item)
+        self.mark_dirty(item)
+
+    def has_changes(self):
+        """
+        Return True if there are uncommitted changes.
+        """
+        return bool(self.dirty) or bool(self.removed)
+
+    def commit(self, filepath=None):
+        """
+        Persist the uncommitted changes.
+
+        Parameters
+        ----------
+        filepath : str | None
+            Optional JSON export destination. When it differs from the
+            backing store every object is written there unconditionally and
+            the pending changes are kept for the store.
+
+        Returns
+        -------
+        bool
+            True if something was written.
+        """
+        if filepath is not None and filepath != self.filepath:
+            self.export_to_json(filepath)
+            return True
+        if not self.has_changes():
+            return False
+        self._flush()
+        self.dirty.clear()
+        self.removed.clear()
+        self._signature = self._read_signature()
+        return True
+
+    def export_to_json(self, filepath):
+        """
+        Write every object to a JSON file in the application's format.
+
+        Parameters
+        ----------
+        filepath : str
+            Destination path for the JSON file.
+        """
+        self.ensure_loaded()
+        data = [item.to_dict() for item in self.items]
+        write_text_atomically(filepath, json.dumps(data, ensure_ascii=False, indent=4))
+
+
+class BasePlayerRepository(BaseRepository):
+    """Interface of the session store of ChessPlayer instances.
+
+    Objects are keyed by federation_chess_id; `players` is the ordered list.
+    """
+
+    model = ChessPlayer
+    key_attribute = "federation_chess_id"
+
+    @property
+    def players(self):
+        """
+        Ordered list of ChessPlayer instances.
+        """
+        return self.items
+
+
+class BaseTournamentRepository(BaseRepository):
+    """Interface of the session store of Tournament instances.
+
+    Objects are keyed by tournament_id; `tournaments` is the ordered list.
+
+    Attributes
+    ----------
+    lazy : bool
+        When True (config.LAZY_TOURNAMENTS) tournaments are loaded with their
+        header only; players, rounds and matches history are decoded on
+        first access (see Tournament.from_header).
+
+    Methods
+    -------
+    summaries():
+        Return the TournamentSummary of every tournament, in order.
+    record(tournament, event):
+        Persist a workflow event already applied to the tournament in memory
+        (see repository.journal for the event formats).
+    """
+
+    model = Tournament
+    key_attribute = "tournament_id"
+    lazy = config.LAZY_TOURNAMENTS
+
+    @property
+    def tournaments(self):
+        """
+        Ordered list of Tournament instances.
+        """
+        return self.items
+
+    def _decode(self, record):
+        """
+        Build a tournament from a record, deferring its body in lazy mode.
+        """
+        return self.model.from_dict(record, lazy=self.lazy)
+
+    def summaries(self):
+        """
+        Return the headers of the tournaments used by listings.
+
+        Returns
+        -------
+        list[TournamentSummary]
+            One summary per tournament, in order.
+        """
+        return [TournamentSummary.from_tournament(tournament) for tournament in self.ensure_loaded()]
+
+    @abstractmethod
+    def record(self, tournament, event):
+        """
+        Persist an event describing a change already applied in memory.
+
+        Parameters
+        ----------
+        tournament : Tournament
+            The modified tournament.
+        event : dict
+            Event without its tournament_id.
+        """
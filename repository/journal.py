@@ -0,0 +1,152 @@
+"""
+Append-only journal of tournament events.
+
+Recording a match result used to rewrite the whole tournaments file. The
+journal instead appends one small JSON line per event and fsyncs it, so the
+cost of an entry does not depend on the size of the archive. Entries are
+replayed on top of the snapshot when the tournaments are loaded, and the
+journal is emptied once the snapshot has been rewritten (compaction).
+
+This module exposes:
+- ResultJournal: append, read and truncate a journal file.
+- apply_event(tournament, event): replay one event on a Tournament.
+
+Event formats
+-------------
+Every event stores absolute values so that replaying it on a snapshot which
+already contains it is harmless:
+
+- {"type": "result", "tournament_id", "round_index", "match_index", "scores": [s1, s2]}
+- {"type": "round_close", "tournament_id", "round_index", "end_date", "end_time", "status"}
+- {"type": "points", "tournament_id", "players": {player_id: points}}
+- {"type": "pairing", "tournament_id", "current_round", "round": {...}, "history": [[p1, p2], ...]}
+"""
+
+import json
+import os
+from model.tournament_model import TournamentRound
+
+
+class ResultJournal:
+    """Append-only, fsync'd journal file of tournament events.
+
+    Attributes
+    ----------
+    filepath : str
+        Path of the journal file (one JSON document per line).
+    entries_count : int
+        Number of entries currently stored in the journal.
+
+    Methods
+    -------
+    append(event):
+        Write an event at the end of the journal and fsync it.
+    read():
+        Return the list of valid events stored in the journal.
+    truncate():
+        Empty the journal once its events are part of the snapshot.
+    """
+
+    def __init__(self, filepath="data/journal.log"):
+        """
+        Initialize the journal.
+
+        Parameters
+        ----------
+        filepath : str
+            Path of the journal file; created on the first append.
+        """
+        self.filepath = filepath
+        self.entries_count = 0
+
+    def append(self, event):
+        """
+        Append an event to the journal and force it to disk.
+
+        Parameters
+        ----------
+        event : dict
+            JSON-serializable event (see module docstring).
+        """
+        line = json.dumps(event, ensure_ascii=False, separators=(",", ":"))
+        with open(self.filepath, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.entries_count += 1
+
+    def read(self):
+        """
+        Read the events stored in the journal.
+
+        Returns
+        -------
+        list[dict]
+            Events in append order. A trailing line truncated by a crash is
+            ignored.
+        """
+        events = []
+        try:
+            with open(self.filepath, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        events.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        break
+        except FileNotFoundError:
+            pass
+        self.entries_count = len(events)
+        return events
+
+    def truncate(self):
+        """
+        Empty the journal.
+        """
+        if os.path.exists(self.filepath):
+            with open(self.filepath, "w", encoding="utf-8") as f:
+                f.flush()
+                os.fsync(f.fileno())
+        self.entries_count = 0
+
+
+def apply_event(tournament, event):
+    """
+    Replay a journal event on a tournament.
+
+    Parameters
+    ----------
+    tournament : Tournament
+        The tournament identified by event["tournament_id"].
+    event : dict
+        The event to apply.
+
+    Notes
+    -----
+    Pairing events whose round_id is already present are skipped, which keeps
+    the replay idempotent. Replaying a pairing also adds the round to the
+    player history (colours, bye and floats from the points at that time).
+    """
+    event_type = event["type"]
+    if event_type == "result":
+        match = tournament.rounds[event["round_index"]].matches[event["match_index"]]
+        match[0][1] = event["scores"][0]
+        match[1][1] = event["scores"][1]
+    elif event_type == "round_close":
+        round = tournament.rounds[event["round_index"]]
+        round.end_date = event["end_date"]
+        round.end_time = event["end_time"]
+        round.status = event["status"]
+    elif event_type == "points":
+        tournament.players.update(event["players"])
+    elif event_type == "pairing":
+        round_id = event["round"]["round_id"]
+        if any(round.round_id == round_id for round in tournament.rounds):
+            return
+        # Read the history before adding the round: a history rebuilt from
+        # the rounds must not already count it.
+        player_history = tournament.player_history
+        round = TournamentRound.from_dict(event["round"])
+        player_history.record_round(round.matches, round.bye, tournament.players)
+        tournament.rounds.append(round)
+        tournament.current_round = event["current_round"]
+        tournament.matches_history.extend(event["history"])
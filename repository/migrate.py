@@ -0,0 +1,126 @@
+"""
+One-shot migration of the JSON data files to another storage backend.
+
+Usage
+-----
+From the project root:
+
+    python -m repository.migrate [--target sqlite] [--players data/players.json]
+        [--tournaments data/tournaments.json] [--database data/ajedrez.db] [--force]
+
+    python -m repository.migrate --target sharded [--tournaments data/tournaments.json]
+        [--directory data/tournaments] [--force]
+
+Then select the backend with the AJEDREZ_STORAGE environment variable
+(see config.py). Pending entries of the tournaments journal are replayed
+before the migration.
+"""
+
+import argparse
+import os
+import config
+from repository.player_repository import JsonPlayerRepository
+from repository.tournament_repository import JsonTournamentRepository
+from repository.sqlite_repository import SqlitePlayerRepository, SqliteTournamentRepository, CHILD_TABLES
+from repository.sharded_repository import convert_to_shards
+
+
+def migrate_json_to_sqlite(players_path, tournaments_path, database_path, force=False):
+    """
+    Copy every player and tournament from the JSON files into a database.
+
+    Parameters
+    ----------
+    players_path : str
+        Source players JSON file.
+    tournaments_path : str
+        Source tournaments JSON file.
+    database_path : str
+        Destination SQLite database (created if needed).
+    force : bool
+        Empty the destination tables when they already contain data.
+
+    Returns
+    -------
+    tuple (players_count, tournaments_count) | None
+        Number of migrated records, or None if the database already holds
+        data and force is False.
+    """
+    players = JsonPlayerRepository(players_path).ensure_loaded()
+    tournaments = JsonTournamentRepository(tournaments_path).ensure_loaded()
+
+    player_repository = SqlitePlayerRepository(database_path)
+    tournament_repository = SqliteTournamentRepository(database_path)
+    connection = player_repository.connection
+    existing = sum(connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                   for table in ("players", "tournaments"))
+    if existing and not force:
+        return None
+    with connection:
+        for table in ("players", "tournaments") + CHILD_TABLES:
+            connection.execute(f"DELETE FROM {table}")
+
+    player_repository.ensure_loaded()
+    for player in players:
+        player_repository.add(player)
+    player_repository.commit()
+
+    tournament_repository.ensure_loaded()
+    for tournament in tournaments:
+        tournament_repository.add(tournament)
+    tournament_repository.commit()
+    return len(players), len(tournaments)
+
+
+def migrate_json_to_shards(tournaments_path, directory, force=False):
+    """
+    Split the tournaments JSON file into one file per tournament.
+
+    Parameters
+    ----------
+    tournaments_path : str
+        Source tournaments JSON file.
+    directory : str
+        Destination directory of the sharded layout.
+    force : bool
+        Replace an existing manifest.
+
+    Returns
+    -------
+    int | None
+        Number of converted tournaments, or None if the directory already
+        holds a manifest and force is False.
+    """
+    if os.path.exists(os.path.join(directory, "manifest.json")) and not force:
+        return None
+    return convert_to_shards(tournaments_path, directory)
+
+
+def main():
+    """
+    Parse the command line and run the migration.
+    """
+    parser = argparse.ArgumentParser(description="Migration des fichiers JSON vers un autre stockage.")
+    parser.add_argument("--target", choices=("sqlite", "sharded"), default="sqlite")
+    parser.add_argument("--players", default=config.PLAYERS_FILE)
+    parser.add_argument("--tournaments", default=config.TOURNAMENTS_FILE)
+    parser.add_argument("--database", default=config.DATABASE_PATH)
+    parser.add_argument("--directory", default=config.TOURNAMENTS_DIRECTORY)
+    parser.add_argument("--force", action="store_true", help="écraser une destination déjà remplie")
+    args = parser.parse_args()
+    if args.target == "sharded":
+        count = migrate_json_to_shards(args.tournaments, args.directory, args.force)
+        if count is None:
+            print(f"Le dossier {args.directory} contient déjà un manifeste (utilisez --force pour l'écraser).")
+        else:
+            print(f"{count} tournoi(s) répartis dans {args.directory}.")
+        return
+    counts = migrate_json_to_sqlite(args.players, args.tournaments, args.database, args.force)
+    if counts is None:
+        print(f"La base {args.database} contient déjà des données (utilisez --force pour l'écraser).")
+    else:
+        print(f"{counts[0]} joueur(s) et {counts[1]} tournoi(s) migrés vers {args.database}.")
+
+
+if __name__ == "__main__":
+    main()
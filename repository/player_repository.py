@@ -0,0 +1,76 @@
+"""
+JSON file persistence of ChessPlayer objects.
+
+This module exposes:
+- JsonPlayerRepository: loads the players JSON file once per session and
+  only writes it back when there are pending changes.
+"""
+
+import json
+import config
+from repository.base import BasePlayerRepository, write_text_atomically
+from repository.snapshot import file_signature, load_json_records, snapshot_path_for, write_snapshot
+
+
+class JsonPlayerRepository(BasePlayerRepository):
+    """Player repository backed by a JSON file (data/players.json).
+
+    The identity map, dirty tracking and commit protocol are provided by
+    BaseRepository; this class reads and writes the whole file, which is the
+    unit of storage of the JSON format.
+
+    Attributes
+    ----------
+    snapshot_path : str | None
+        Binary snapshot loaded instead of the file while it is up to date
+        (see repository.snapshot), or None when snapshots are disabled.
+    """
+
+    def __init__(self, filepath="data/players.json", reload_if_changed=False, snapshot=None):
+        """
+        Initialize an empty, not yet loaded repository.
+
+        Parameters
+        ----------
+        filepath : str
+            JSON file backing the repository.
+        reload_if_changed : bool
+            Opt-in check of the file (mtime, size) before each access.
+        snapshot : bool | None
+            Use a binary snapshot; defaults to config.USE_SNAPSHOTS.
+        """
+        super().__init__(filepath, reload_if_changed)
+        if snapshot is None:
+            snapshot = config.USE_SNAPSHOTS
+        self.snapshot_path = snapshot_path_for(filepath) if snapshot else None
+
+    def _read_signature(self):
+        """
+        Return the (st_mtime_ns, st_size) signature of the backing file.
+
+        Returns
+        -------
+        tuple | None
+            The signature, or None if the file does not exist.
+        """
+        return file_signature(self.filepath)
+
+    def _read_records(self):
+        """
+        Decode the backing file, or its snapshot when up to date.
+
+        Returns
+        -------
+        list[dict]
+            Player records; empty if the file is missing or invalid.
+        """
+        return load_json_records(self.filepath, self.snapshot_path)
+
+    def _flush(self):
+        """
+        Rewrite the backing file with the ordered players list.
+        """
+        data = [player.to_dict() for player in self.players]
+        write_text_atomically(self.filepath, json.dumps(data, ensure_ascii=False, indent=4))
+        if self.snapshot_path is not None:
+            write_snapshot(self.snapshot_path, data, file_signature(self.filepath))
@@ -0,0 +1,125 @@
+"""
+Storage of the rating history used to recompute the ratings.
+
+This module exposes:
+- RatingHistory: the ratings before the archive of finished tournaments (the
+  base), the archive replayed last and its rating checkpoints, stored in one
+  JSON file (config.RATING_HISTORY_FILE).
+
+File format
+-----------
+{
+    "every": 10,
+    "base": {player_id: [elo, coef_k, games_played]},
+    "archive": [[tournament_id, digest], ...],
+    "checkpoints": [{"position": n, "ratings": {player_id: [elo, coef_k, games_played]}}, ...]
+}
+
+See utils.rating_history_utils for the meaning of the archive and of the
+checkpoints.
+"""
+
+import json
+import os
+import config
+from repository.base import write_text_atomically
+from utils.rating_history_utils import CHECKPOINT_EVERY
+
+
+class RatingHistory:
+    """Base ratings, archive and checkpoints of the rating recomputation.
+
+    Attributes
+    ----------
+    filepath : str
+        Path of the JSON file.
+    every : int
+        Tournaments between two checkpoints.
+    base : dict
+        Mapping player_id -> [elo, coef_k, games_played] before the archive.
+    archive : list
+        [tournament_id, digest] pairs of the archive at the last replay.
+    checkpoints : list of dict
+        Checkpoints of the last replay, by increasing position.
+
+    Methods
+    -------
+    exists():
+        Return True when the history file has been written.
+    load():
+        Read the history file, if any.
+    save():
+        Write the history file atomically.
+    record_base(ratings):
+        Add the states of players not yet in the base.
+    """
+
+    def __init__(self, filepath=None):
+        """
+        Initialize an empty history.
+
+        Parameters
+        ----------
+        filepath : str | None
+            Path of the JSON file (default config.RATING_HISTORY_FILE).
+        """
+        self.filepath = filepath or config.RATING_HISTORY_FILE
+        self.every = CHECKPOINT_EVERY
+        self.base = {}
+        self.archive = []
+        self.checkpoints = []
+
+    def exists(self):
+        """Return True when the history file has been written."""
+        return os.path.exists(self.filepath)
+
+    def load(self):
+        """
+        Read the history file; the history stays empty when there is none.
+
+        Returns
+        -------
+        RatingHistory
+            self, for chaining.
+        """
+        if not self.exists():
+            return self
+        with open(self.filepath, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        self.every = data.get("every", CHECKPOINT_EVERY)
+        self.base = data.get("base", {})
+        self.archive = data.get("archive", [])
+        self.checkpoints = data.get("checkpoints", [])
+        return self
+
+    def save(self):
+        """Write the history file atomically."""
+        directory = os.path.dirname(self.filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = {"every": self.every, "base": self.base, "archive": self.archive, "checkpoints": self.checkpoints}
+        write_text_atomically(self.filepath, json.dumps(data, ensure_ascii=False))
+
+    def record_base(self, ratings):
+        """
+        Add the states of players who are not yet in the base.
+
+        Called before a tournament is settled: a player's first archived
+        tournament starts from the rating they have at that moment.
+
+        Parameters
+        ----------
+        ratings : dict
+            Mapping player_id -> [elo, coef_k, games_played].
+
+        Returns
+        -------
+        bool
+            True when a player was added.
+        """
+        added = False
+        for player_id, state in ratings.items():
+            if player_id not in self.base:
+                self.base[player_id] = list(state)
+                added = True
+        return added
@@ -0,0 +1,133 @@
+"""
+Session registry of repositories.
+
+Controllers are created on demand by the views; they all share the
+repositories returned here so the data is loaded once per session.
+
+This module exposes:
+- get_player_repository(filepath=None, reload_if_changed=False)
+- get_tournament_repository(filepath=None, reload_if_changed=False)
+- commit_repositories(): flush every repository of the session (also
+  registered to run at interpreter exit).
+- load_cache_stats(): hit/miss counters of the session repositories.
+
+The backend is selected by config.STORAGE_BACKEND ("json", "sharded" or
+"sqlite"). An explicit filepath always designates a JSON file.
+"""
+
+import atexit
+import os
+import config
+from repository.player_repository import JsonPlayerRepository
+from repository.tournament_repository import JsonTournamentRepository
+from repository.sqlite_repository import SqlitePlayerRepository, SqliteTournamentRepository
+from repository.sharded_repository import ShardedTournamentRepository
+
+_repositories = {}
+
+
+def _get_repository(kind, filepath, reload_if_changed):
+    """
+    Return the session repository of a kind, creating it on first use.
+
+    Parameters
+    ----------
+    kind : str
+        "players" or "tournaments".
+    filepath : str | None
+        Explicit JSON file, or None for the configured backend.
+    reload_if_changed : bool
+        Enable the change check on the shared repository (never disables it
+        once enabled by another caller).
+
+    Returns
+    -------
+    BaseRepository
+        The shared repository.
+    """
+    if filepath is None and config.STORAGE_BACKEND == "sqlite":
+        backend = "sqlite"
+        filepath = config.DATABASE_PATH
+    elif filepath is None and config.STORAGE_BACKEND == "sharded" and kind == "tournaments":
+        backend = "sharded"
+        filepath = config.TOURNAMENTS_DIRECTORY
+    else:
+        backend = "json"
+        if filepath is None:
+            filepath = config.PLAYERS_FILE if kind == "players" else config.TOURNAMENTS_FILE
+    key = (kind, backend, os.path.abspath(filepath))
+    repository = _repositories.get(key)
+    if repository is None:
+        if backend == "sqlite":
+            factory = SqlitePlayerRepository if kind == "players" else SqliteTournamentRepository
+        elif backend == "sharded":
+            factory = ShardedTournamentRepository
+        else:
+            factory = JsonPlayerRepository if kind == "players" else JsonTournamentRepository
+        repository = factory(filepath, reload_if_changed)
+        _repositories[key] = repository
+    elif reload_if_changed:
+        repository.reload_if_changed = True
+    return repository
+
+
+def get_player_repository(filepath=None, reload_if_changed=False):
+    """
+    Return the session player repository.
+
+    Parameters
+    ----------
+    filepath : str | None
+        JSON file to use instead of the configured backend.
+    reload_if_changed : bool
+        Opt-in refresh when the store changed on disk.
+
+    Returns
+    -------
+    BasePlayerRepository
+        The repository shared by every controller of the session.
+    """
+    return _get_repository("players", filepath, reload_if_changed)
+
+
+def get_tournament_repository(filepath=None, reload_if_changed=False):
+    """
+    Return the session tournament repository.
+
+    Parameters
+    ----------
+    filepath : str | None
+        JSON file to use instead of the configured backend.
+    reload_if_changed : bool
+        Opt-in refresh when the store changed on disk.
+
+    Returns
+    -------
+    BaseTournamentRepository
+        The repository shared by every controller of the session.
+    """
+    return _get_repository("tournaments", filepath, reload_if_changed)
+
+
+def commit_repositories():
+    """
+    Flush every session repository that holds pending changes.
+    """
+    for repository in _repositories.values():
+        repository.commit()
+
+
+def load_cache_stats():
+    """
+    Return the load cache counters of every session repository.
+
+    Returns
+    -------
+    dict
+        Mapping "kind:path" -> {"hits": int, "misses": int}.
+    """
+    return {f"{kind}:{path}": repository.cache_stats()
+            for (kind, _backend, path), repository in _repositories.items()}
+
+
+atexit.register(commit_repositories)
@@ -0,0 +1,351 @@
+"""
+Per-tournament JSON files with a lightweight manifest.
+
+Layout of the tournaments directory (data/tournaments by default):
+
+- manifest.json: ordered list of TournamentSummary dicts (name, status,
+  dates, counts...). Listings and counts only read this file.
+- <tournament_id>.json: the full to_dict() representation of one tournament.
+
+Editing a live tournament rewrites its own file (and the manifest when its
+header changed), never the files of finished tournaments.
+
+This module exposes:
+- ShardedTournamentRepository
+- convert_to_shards(tournaments_path, directory): split a single-file
+  tournaments.json into this layout.
+"""
+
+import json
+import os
+from model.tournament_model import TournamentSummary
+from repository.base import BaseTournamentRepository, write_text_atomically
+from repository.tournament_repository import JsonTournamentRepository
+
+
+class ShardedTournamentRepository(BaseTournamentRepository):
+    """Tournament repository storing one JSON file per tournament.
+
+    Before the first full load, get(), get_at(), count() and summaries() only
+    read the manifest and the shard files they need.
+
+    Attributes
+    ----------
+    manifest_path : str
+        Path of the manifest file inside the directory.
+    """
+
+    def __init__(self, filepath="data/tournaments", reload_if_changed=False):
+        """
+        Initialize the repository.
+
+        Parameters
+        ----------
+        filepath : str
+            Directory holding the manifest and the tournament files.
+        reload_if_changed : bool
+            Opt-in refresh when a file of the directory changed on disk.
+        """
+        super().__init__(filepath, reload_if_changed)
+        self.manifest_path = os.path.join(filepath, "manifest.json")
+        self._manifest = None
+
+    def _shard_path(self, tournament_id):
+        """
+        Return the path of the file of a tournament.
+        """
+        return os.path.join(self.filepath, f"{tournament_id}.json")
+
+    def _read_signature(self):
+        """
+        Return the modification time of the directory.
+
+        Every write replaces a file through a rename, which updates it.
+        """
+        try:
+            return os.stat(self.filepath).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _read_manifest(self):
+        """
+        Return the cached manifest entries, reading the file if needed.
+
+        Returns
+        -------
+        list[dict]
+            TournamentSummary dicts in listing order.
+        """
+        if self._manifest is None:
+            try:
+                with open(self.manifest_path, "r", encoding="utf-8") as f:
+                    self._manifest = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self._manifest = []
+        return self._manifest
+
+    def _read_shard(self, tournament_id):
+        """
+        Decode the file of a tournament.
+
+        Returns
+        -------
+        dict | None
+            The tournament record, or None if the file is missing or invalid.
+        """
+        try:
+            with open(self._shard_path(tournament_id), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _read_records(self):
+        """
+        Read every tournament listed in the manifest.
+
+        Returns
+        -------
+        list[dict]
+            Tournament records in manifest order.
+        """
+        self._manifest = None
+        records = []
+        for entry in self._read_manifest():
+            record = self._read_shard(entry["tournament_id"])
+            if record is not None:
+                records.append(record)
+        return records
+
+    def _after_load(self):
+        """
+        Rebuild the manifest cache from the loaded tournaments.
+        """
+        self._manifest = [TournamentSummary.from_tournament(t).to_dict() for t in self.items]
+
+    def _fetch(self, tournament_id):
+        """
+        Return a tournament by id, reading only its file if needed.
+        """
+        tournament = self.identity_map.get(tournament_id)
+        if tournament is None:
+            record = self._read_shard(tournament_id)
+            if record is not None:
+                tournament = self._decode(record)
+                self.identity_map[tournament_id] = tournament
+        return tournament
+
+    def get(self, key):
+        """
+        Return the tournament registered under key.
+
+        Parameters
+        ----------
+        key : str
+            Tournament id.
+
+        Returns
+        -------
+        Tournament | None
+            The matching tournament, or None if not found.
+        """
+        if not self.loaded:
+            return self._fetch(key)
+        return super().get(key)
+
+    def get_at(self, index):
+        """
+        Return the tournament at a position of the manifest.
+
+        Parameters
+        ----------
+        index : int
+            Position of the tournament.
+
+        Returns
+        -------
+        Tournament
+            The requested tournament (IndexError if out of range).
+        """
+        if self.loaded:
+            return super().get_at(index)
+        return self._fetch(self._read_manifest()[index]["tournament_id"])
+
+    def count(self):
+        """
+        Return the number of tournaments listed in the manifest.
+        """
+        if self.loaded:
+            return super().count()
+        return len(self._read_manifest())
+
+    def summaries(self):
+        """
+        Return the headers of the tournaments without reading their files.
+
+        Tournaments already in memory are summarized from their current
+        state so pending changes are reflected.
+
+        Returns
+        -------
+        list[TournamentSummary]
+            One summary per tournament, in order.
+        """
+        if self.loaded:
+            return super().summaries()
+        summaries = []
+        for entry in self._read_manifest():
+            tournament = self.identity_map.get(entry["tournament_id"])
+            if tournament is not None:
+                summaries.append(TournamentSummary.from_tournament(tournament))
+            else:
+                summaries.append(TournamentSummary.from_dict(entry))
+        return summaries
+
+    def add(self, tournament):
+        """
+        Register a new tournament without loading the other files.
+
+        Parameters
+        ----------
+        tournament : Tournament
+            The tournament to add.
+        """
+        if self.loaded:
+            super().add(tournament)
+        else:
+            self.identity_map.setdefault(tournament.tournament_id, tournament)
+            self.dirty.add(tournament)
+        self._read_manifest().append(TournamentSummary.from_tournament(tournament).to_dict())
+
+    def remove(self, index):
+        """
+        Remove the tournament at a position of the manifest.
+
+        Parameters
+        ----------
+        index : int
+            Position of the tournament.
+
+        Returns
+        -------
+        Tournament
+            The removed tournament.
+        """
+        if self.loaded:
+            tournament = super().remove(index)
+            self._read_manifest().pop(index)
+            return tournament
+        tournament = self.get_at(index)
+        self._read_manifest().pop(index)
+        self.identity_map.pop(tournament.tournament_id, None)
+        self.dirty.discard(tournament)
+        self.removed.append(tournament)
+        return tournament
+
+    def _write_shard(self, tournament):
+        """
+        Write the file of a tournament.
+        """
+        os.makedirs(self.filepath, exist_ok=True)
+        write_text_atomically(
+            self._shard_path(tournament.tournament_id),
+            json.dumps(tournament.to_dict(), ensure_ascii=False, indent=4))
+
+    def _write_manifest(self, force=False):
+        """
+        Refresh the entries of in-memory tournaments and write the manifest.
+
+        Parameters
+        ----------
+        force : bool
+            Write the file even if no entry changed (after adds/removals).
+
+        Returns
+        -------
+        bool
+            True if the manifest content changed and was written.
+        """
+        manifest = []
+        for entry in self._read_manifest():
+            tournament = self.identity_map.get(entry["tournament_id"])
+            if tournament is not None:
+                entry = TournamentSummary.from_tournament(tournament).to_dict()
+            manifest.append(entry)
+        if not force and manifest == self._manifest and os.path.exists(self.manifest_path):
+            return False
+        self._manifest = manifest
+        os.makedirs(self.filepath, exist_ok=True)
+        write_text_atomically(self.manifest_path, json.dumps(manifest, ensure_ascii=False, indent=4))
+        return True
+
+    def _flush(self):
+        """
+        Delete the files of removed tournaments, write dirty ones and the manifest.
+        """
+        for tournament in self.removed:
+            try:
+                os.remove(self._shard_path(tournament.tournament_id))
+            except FileNotFoundError:
+                pass
+        for tournament in self.dirty:
+            self._write_shard(tournament)
+        self._write_manifest(force=True)
+
+    def record(self, tournament, event):
+        """
+        Persist an event by rewriting the file of its tournament only.
+
+        The manifest is rewritten only when the tournament header changed
+        (e.g. current_round after a pairing).
+
+        Parameters
+        ----------
+        tournament : Tournament
+            The modified tournament.
+        event : dict
+            Event without its tournament_id (see repository.journal).
+        """
+        if tournament.tournament_id not in {entry["tournament_id"] for entry in self._read_manifest()}:
+            self.mark_dirty(tournament)
+            return
+        self._write_shard(tournament)
+        self.dirty.discard(tournament)
+        self._write_manifest()
+        self._signature = self._read_signature()
+
+
+def convert_to_shards(tournaments_path, directory):
+    """
+    Split a single-file tournaments JSON into per-tournament files.
+
+    Pending journal entries of the source are replayed first. An existing
+    layout in directory is replaced: the manifest is rebuilt from the source
+    only, and the files of tournaments it no longer lists are deleted.
+
+    Parameters
+    ----------
+    tournaments_path : str
+        Source tournaments JSON file.
+    directory : str
+        Destination directory (created if needed).
+
+    Returns
+    -------
+    int
+        Number of converted tournaments.
+    """
+    tournaments = JsonTournamentRepository(tournaments_path).ensure_loaded()
+    repository = ShardedTournamentRepository(directory)
+    stale = {entry["tournament_id"] for entry in repository._read_manifest()}
+    repository._manifest = []
+    for tournament in tournaments:
+        repository.add(tournament)
+        stale.discard(tournament.tournament_id)
+    repository.commit()
+    repository._write_manifest(force=True)
+    for tournament_id in stale:
+        try:
+            os.remove(repository._shard_path(tournament_id))
+        except FileNotFoundError:
+            pass
+    return len(tournaments)
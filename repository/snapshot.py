@@ -0,0 +1,168 @@
+"""
+Binary snapshots of the JSON data files.
+
+Decoding the pretty-printed JSON files is the main cost of a startup with a
+large archive. Next to each JSON file a binary snapshot holding the same
+records (pickle protocol 5) is kept and loaded instead while it is fresh.
+The JSON file stays the reference and the human-readable format: the
+snapshot is only used when it was written for the current version of the
+file, otherwise the JSON file is decoded and the snapshot rebuilt.
+
+File layout
+-----------
+A fixed header followed by the pickled list of records:
+
+- magic (6 bytes, b"AJSNAP") and format version (uint16);
+- (st_mtime_ns, st_size) of the JSON file the snapshot was written for;
+- SHA-256 digest of the payload.
+
+This module exposes:
+- snapshot_path_for(filepath): location of the snapshot of a JSON file.
+- read_snapshot(snapshot_path, source_signature): records or None.
+- write_snapshot(snapshot_path, records, source_signature).
+- file_signature(filepath): (st_mtime_ns, st_size) of a file or None.
+- load_json_records(filepath, snapshot_path=None): decode a JSON data file,
+  through its snapshot when fresh.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import struct
+from repository.base import write_bytes_atomically
+
+MAGIC = b"AJSNAP"
+VERSION = 1
+HEADER = struct.Struct("<6sHqq32s")
+
+
+def file_signature(filepath):
+    """
+    Return the (st_mtime_ns, st_size) signature of a file.
+
+    Returns
+    -------
+    tuple | None
+        The signature, or None if the file does not exist.
+    """
+    try:
+        stat = os.stat(filepath)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def snapshot_path_for(filepath):
+    """
+    Return the path of the snapshot of a JSON file.
+
+    Parameters
+    ----------
+    filepath : str
+        Path of the JSON file (e.g. data/tournaments.json).
+
+    Returns
+    -------
+    str
+        Path of the snapshot (e.g. data/tournaments.snapshot).
+    """
+    return os.path.splitext(filepath)[0] + ".snapshot"
+
+
+def read_snapshot(snapshot_path, source_signature):
+    """
+    Load the records of a snapshot if it matches the JSON file.
+
+    Parameters
+    ----------
+    snapshot_path : str
+        Path of the snapshot.
+    source_signature : tuple | None
+        Current (st_mtime_ns, st_size) of the JSON file.
+
+    Returns
+    -------
+    list | None
+        The records, or None if the snapshot is missing, stale, of another
+        format version or corrupted.
+    """
+    if source_signature is None:
+        return None
+    try:
+        with open(snapshot_path, "rb") as f:
+            content = f.read()
+    except OSError:
+        return None
+    if len(content) < HEADER.size:
+        return None
+    magic, version, mtime_ns, size, digest = HEADER.unpack_from(content)
+    if magic != MAGIC or version != VERSION or (mtime_ns, size) != tuple(source_signature):
+        return None
+    payload = memoryview(content)[HEADER.size:]
+    if hashlib.sha256(payload).digest() != digest:
+        return None
+    try:
+        return pickle.loads(payload)
+    except (pickle.UnpicklingError, EOFError, ValueError):
+        return None
+
+
+def write_snapshot(snapshot_path, records, source_signature):
+    """
+    Write the snapshot of the records of a JSON file.
+
+    Failures are ignored: the snapshot is only a cache of the JSON file.
+
+    Parameters
+    ----------
+    snapshot_path : str
+        Path of the snapshot.
+    records : list
+        Records held by the JSON file.
+    source_signature : tuple | None
+        (st_mtime_ns, st_size) of the JSON file; nothing is written if None.
+    """
+    if source_signature is None:
+        return
+    payload = pickle.dumps(records, protocol=5)
+    header = HEADER.pack(MAGIC, VERSION, source_signature[0], source_signature[1],
+                         hashlib.sha256(payload).digest())
+    try:
+        write_bytes_atomically(snapshot_path, header + payload)
+    except OSError:
+        pass
+
+
+def load_json_records(filepath, snapshot_path=None):
+    """
+    Return the records of a JSON data file.
+
+    The snapshot is used when it matches the file; otherwise the file is
+    decoded and, if snapshot_path is given, the snapshot is rebuilt.
+
+    Parameters
+    ----------
+    filepath : str
+        JSON file holding a list of records.
+    snapshot_path : str | None
+        Snapshot of the file, or None to always decode the JSON.
+
+    Returns
+    -------
+    list
+        The records; empty if the file is missing or invalid.
+    """
+    signature = file_signature(filepath)
+    if snapshot_path is not None:
+        records = read_snapshot(snapshot_path, signature)
+        if records is not None:
+            return records
+    try:
+        with open(filepath, "r", encoding="utf-8") as f:
+            records = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return []
+    if snapshot_path is not None:
+        write_snapshot(snapshot_path, records, signature)
+    return records
@@ -0,0 +1,640 @@
+"""
+SQLite persistence of players and tournaments (stdlib sqlite3).
+
+Players, tournaments, registrations, rounds, matches, the pairing history and
+the colour history of the players are stored in normalized tables. Point lookups use the indexes on
+federation_chess_id and tournament_id, a commit only touches the rows of the
+dirty objects, and recording a result updates a single match row.
+
+This module exposes:
+- connect(database_path): open a database and create the schema if needed.
+- player_values(player): the column values of a player row.
+- tournament_values(tournament): the column values of a tournament row.
+- SqlitePlayerRepository
+- SqliteTournamentRepository
+"""
+
+import json
+import sqlite3
+from repository.base import BasePlayerRepository, BaseTournamentRepository
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    surname TEXT,
+    name TEXT,
+    date_of_birth TEXT,
+    federation_chess_id TEXT,
+    elo NUMERIC,
+    coef_k INTEGER,
+    games_played INTEGER,
+    glicko TEXT
+);
+CREATE INDEX IF NOT EXISTS players_federation_chess_id ON players (federation_chess_id);
+
+CREATE TABLE IF NOT EXISTS tournaments (
+    id INTEGER PRIMARY KEY,
+    tournament_id TEXT,
+    name TEXT,
+    location TEXT,
+    start_date TEXT,
+    end_date TEXT,
+    number_of_rounds INTEGER,
+    current_round INTEGER,
+    description TEXT,
+    status TEXT,
+    schedule TEXT,
+    pairing TEXT,
+    rating_engine TEXT
+);
+CREATE INDEX IF NOT EXISTS tournaments_tournament_id ON tournaments (tournament_id);
+CREATE INDEX IF NOT EXISTS tournaments_status ON tournaments (status);
+
+CREATE TABLE IF NOT EXISTS tournament_players (
+    tournament_row INTEGER,
+    position INTEGER,
+    player_id TEXT,
+    points REAL,
+    PRIMARY KEY (tournament_row, position)
+);
+CREATE INDEX IF NOT EXISTS tournament_players_player ON tournament_players (tournament_row, player_id);
+
+CREATE TABLE IF NOT EXISTS rounds (
+    tournament_row INTEGER,
+    round_index INTEGER,
+    name TEXT,
+    round_id TEXT,
+    start_date TEXT,
+    start_time TEXT,
+    end_date TEXT,
+    end_time TEXT,
+    status TEXT,
+    bye TEXT,
+    PRIMARY KEY (tournament_row, round_index)
+);
+CREATE INDEX IF NOT EXISTS rounds_status ON rounds (status);
+
+CREATE TABLE IF NOT EXISTS matches (
+    tournament_row INTEGER,
+    round_index INTEGER,
+    match_index INTEGER,
+    white_id TEXT,
+    white_score REAL,
+    black_id TEXT,
+    black_score REAL,
+    PRIMARY KEY (tournament_row, round_index, match_index)
+);
+
+CREATE TABLE IF NOT EXISTS matches_history (
+    tournament_row INTEGER,
+    position INTEGER,
+    player1 TEXT,
+    player2 TEXT,
+    PRIMARY KEY (tournament_row, position)
+);
+
+CREATE TABLE IF NOT EXISTS player_histories (
+    tournament_row INTEGER,
+    position INTEGER,
+    player_id TEXT,
+    colours TEXT,
+    floats INTEGER,
+    PRIMARY KEY (tournament_row, position)
+);
+"""
+
+PLAYER_COLUMNS = (
+    "surname", "name", "date_of_birth", "federation_chess_id", "elo", "coef_k", "games_played", "glicko",
+)
+TOURNAMENT_COLUMNS = (
+    "tournament_id", "name", "location", "start_date", "end_date",
+    "number_of_rounds", "current_round", "description", "status", "schedule", "pairing", "rating_engine",
+)
+# Tournament columns holding a JSON document (absent from to_dict() when NULL).
+JSON_COLUMNS = ("schedule", "pairing")
+# Player columns holding a JSON document (absent from to_dict() when NULL).
+PLAYER_JSON_COLUMNS = ("glicko",)
+# Columns added after the first version of the schema: table -> columns.
+ADDED_COLUMNS = {
+    "players": ("glicko",),
+    "tournaments": ("schedule", "pairing", "rating_engine"),
+    "rounds": ("bye",),
+}
+ROUND_COLUMNS = ("name", "round_id", "start_date", "start_time", "end_date", "end_time", "status", "bye")
+CHILD_TABLES = ("tournament_players", "rounds", "matches", "matches_history", "player_histories")
+
+
+def connect(database_path):
+    """
+    Open a SQLite database and create the schema if needed.
+
+    Databases created with an older schema get the ADDED_COLUMNS in place.
+
+    Parameters
+    ----------
+    database_path : str
+        Path of the database file.
+
+    Returns
+    -------
+    sqlite3.Connection
+        The open connection.
+    """
+    connection = sqlite3.connect(database_path)
+    connection.executescript(SCHEMA)
+    for table, columns in ADDED_COLUMNS.items():
+        existing = {row[1] for row in connection.execute(f"PRAGMA table_info({table})")}
+        with connection:
+            for column in columns:
+                if column not in existing:
+                    connection.execute(f"ALTER TABLE {table} ADD COLUMN {column} TEXT")
+    return connection
+
+
+def player_values(player):
+    """
+    Return the PLAYER_COLUMNS values of a player, JSON columns encoded.
+
+    Parameters
+    ----------
+    player : ChessPlayer
+        Player to store.
+
+    Returns
+    -------
+    list
+        One value per column of PLAYER_COLUMNS (NULL for absent keys).
+    """
+    data = player.to_dict()
+    for column in PLAYER_JSON_COLUMNS:
+        if column in data:
+            data[column] = json.dumps(data[column])
+    return [data.get(column) for column in PLAYER_COLUMNS]
+
+
+def tournament_values(tournament):
+    """
+    Return the TOURNAMENT_COLUMNS values of a tournament, JSON columns encoded.
+
+    Parameters
+    ----------
+    tournament : Tournament
+        Tournament to store.
+
+    Returns
+    -------
+    list
+        One value per column of TOURNAMENT_COLUMNS (NULL for absent keys).
+    """
+    data = tournament.to_dict()
+    for column in JSON_COLUMNS:
+        if column in data:
+            data[column] = json.dumps(data[column])
+    return [data.get(column) for column in TOURNAMENT_COLUMNS]
+
+
+class SqliteRepositoryMixin:
+    """Connection handling shared by the SQLite repositories.
+
+    Attributes
+    ----------
+    connection : sqlite3.Connection
+        Connection to the database.
+    """
+
+    def _open(self):
+        """
+        Open the connection and prepare the row id mapping.
+        """
+        self.connection = connect(self.filepath)
+        self._row_ids = {}
+
+    def _read_signature(self):
+        """
+        Return the data version of the database.
+
+        PRAGMA data_version changes whenever another connection commits.
+        """
+        return self.connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def _bind(self, item, record):
+        """
+        Remember the row id an object was loaded from.
+        """
+        self._row_ids[item] = record["_row_id"]
+
+    def _fetch_one(self, key):
+        """
+        Load a single object by key through its index, without loading the rest.
+
+        Parameters
+        ----------
+        key : str
+            Natural key of the object.
+
+        Returns
+        -------
+        object | None
+            The object (registered in the identity map), or None.
+        """
+        item = self.identity_map.get(key)
+        if item is None:
+            records = self._read_records(key)
+            if records:
+                item = self._decode(records[0])
+                self._bind(item, records[0])
+                self.identity_map[key] = item
+        return item
+
+    def get(self, key):
+        """
+        Return the object registered under key.
+
+        Before the first full load the lookup is an indexed SELECT.
+
+        Parameters
+        ----------
+        key : str
+            Natural key of the object.
+
+        Returns
+        -------
+        object | None
+            The matching object, or None if not found.
+        """
+        if not self.loaded:
+            return self._fetch_one(key)
+        return super().get(key)
+
+
+class SqlitePlayerRepository(SqliteRepositoryMixin, BasePlayerRepository):
+    """Player repository backed by the players table of a SQLite database."""
+
+    def __init__(self, filepath="data/ajedrez.db", reload_if_changed=False):
+        """
+        Initialize the repository and open the database.
+
+        Parameters
+        ----------
+        filepath : str
+            SQLite database path.
+        reload_if_changed : bool
+            Opt-in refresh when another connection modified the database.
+        """
+        super().__init__(filepath, reload_if_changed)
+        self._open()
+
+    def _read_records(self, federation_id=None):
+        """
+        Read player rows in insertion order.
+
+        Parameters
+        ----------
+        federation_id : str | None
+            Restrict the query to the first player with this federation ID.
+
+        Returns
+        -------
+        list[dict]
+            Player records with their "_row_id".
+        """
+        query = f"SELECT id, {', '.join(PLAYER_COLUMNS)} FROM players"
+        parameters = ()
+        if federation_id is not None:
+            query += " WHERE federation_chess_id = ?"
+            parameters = (federation_id,)
+        query += " ORDER BY id"
+        if federation_id is not None:
+            query += " LIMIT 1"
+        records = []
+        for row in self.connection.execute(query, parameters):
+            record = dict(zip(PLAYER_COLUMNS, row[1:]))
+            record["_row_id"] = row[0]
+            for column in PLAYER_JSON_COLUMNS:
+                if record[column] is None:
+                    del record[column]
+                else:
+                    record[column] = json.loads(record[column])
+            records.append(record)
+        return records
+
+    def _flush(self):
+        """
+        Delete removed rows, update dirty rows and insert new players.
+        """
+        with self.connection:
+            for player in self.removed:
+                row_id = self._row_ids.pop(player, None)
+                if row_id is not None:
+                    self.connection.execute("DELETE FROM players WHERE id = ?", (row_id,))
+            assignments = ", ".join(f"{column} = ?" for column in PLAYER_COLUMNS)
+            for player in self.dirty:
+                row_id = self._row_ids.get(player)
+                if row_id is not None:
+                    values = player_values(player)
+                    self.connection.execute(f"UPDATE players SET {assignments} WHERE id = ?", values + [row_id])
+            placeholders = ", ".join("?" for _ in PLAYER_COLUMNS)
+            for player in self.players:
+                if player in self.dirty and player not in self._row_ids:
+                    values = player_values(player)
+                    cursor = self.connection.execute(
+                        f"INSERT INTO players ({', '.join(PLAYER_COLUMNS)}) VALUES ({placeholders})", values)
+                    self._row_ids[player] = cursor.lastrowid
+
+
+class SqliteTournamentRepository(SqliteRepositoryMixin, BaseTournamentRepository):
+    """Tournament repository backed by normalized SQLite tables."""
+
+    def __init__(self, filepath="data/ajedrez.db", reload_if_changed=False):
+        """
+        Initialize the repository and open the database.
+
+        Parameters
+        ----------
+        filepath : str
+            SQLite database path.
+        reload_if_changed : bool
+            Opt-in refresh when another connection modified the database.
+        """
+        super().__init__(filepath, reload_if_changed)
+        self._open()
+
+    def _read_records(self, tournament_id=None):
+        """
+        Rebuild tournament records from the normalized tables.
+
+        Parameters
+        ----------
+        tournament_id : str | None
+            Restrict the query to the first tournament with this id.
+
+        Returns
+        -------
+        list[dict]
+            Tournament records in the to_dict() format, with their "_row_id"
+            and "players_count".
+            In lazy mode a full load only returns the headers; the other
+            tables are read per tournament on first access (see _decode()).
+        """
+        query = (f"SELECT id, {', '.join(TOURNAMENT_COLUMNS)}, "
+                 "(SELECT COUNT(*) FROM tournament_players WHERE tournament_row = tournaments.id) "
+                 "FROM tournaments")
+        parameters = ()
+        if tournament_id is not None:
+            query += " WHERE tournament_id = ? ORDER BY id LIMIT 1"
+            parameters = (tournament_id,)
+        else:
+            query += " ORDER BY id"
+        records = {}
+        for row in self.connection.execute(query, parameters):
+            record = dict(zip(TOURNAMENT_COLUMNS, row[1:]))
+            record["_row_id"] = row[0]
+            record["players_count"] = row[-1]
+            for column in JSON_COLUMNS:
+                if record[column] is None:
+                    del record[column]
+                else:
+                    record[column] = json.loads(record[column])
+            records[row[0]] = record
+        if not records or (self.lazy and tournament_id is None):
+            return list(records.values())
+        condition = ""
+        parameters = ()
+        if tournament_id is not None:
+            condition = " WHERE tournament_row = ?"
+            parameters = (next(iter(records)),)
+        self._read_bodies(records, condition, parameters)
+        return list(records.values())
+
+    def _read_bodies(self, records, condition, parameters):
+        """
+        Add the registrations, rounds and histories of the child tables to records.
+
+        The "player_history" key is only set for tournaments with rows in
+        player_histories (the model rebuilds it from the rounds otherwise).
+
+        Parameters
+        ----------
+        records : dict
+            Mapping tournament row id -> record, completed in place.
+        condition : str
+            Optional WHERE clause on tournament_row.
+        parameters : tuple
+            Parameters of the condition.
+        """
+        for record in records.values():
+            record.update(players={}, rounds=[], matches_history=[])
+        for tournament_row, player_id, points in self.connection.execute(
+                f"SELECT tournament_row, player_id, points FROM tournament_players{condition} "
+                "ORDER BY tournament_row, position", parameters):
+            records[tournament_row]["players"][player_id] = points
+        rounds = {}
+        for row in self.connection.execute(
+                f"SELECT tournament_row, round_index, {', '.join(ROUND_COLUMNS)} FROM rounds{condition} "
+                "ORDER BY tournament_row, round_index", parameters):
+            round_data = dict(zip(ROUND_COLUMNS, row[2:]))
+            if round_data["bye"] is None:
+                del round_data["bye"]
+            round_data["matches"] = []
+            records[row[0]]["rounds"].append(round_data)
+            rounds[(row[0], row[1])] = round_data
+        for tournament_row, round_index, white_id, white_score, black_id, black_score in self.connection.execute(
+                "SELECT tournament_row, round_index, white_id, white_score, black_id, black_score "
+                f"FROM matches{condition} ORDER BY tournament_row, round_index, match_index", parameters):
+            rounds[(tournament_row, round_index)]["matches"].append([[white_id, white_score], [black_id, black_score]])
+        for tournament_row, player1, player2 in self.connection.execute(
+                f"SELECT tournament_row, player1, player2 FROM matches_history{condition} "
+                "ORDER BY tournament_row, position", parameters):
+            records[tournament_row]["matches_history"].append([player1, player2])
+        for tournament_row, player_id, colours, floats in self.connection.execute(
+                f"SELECT tournament_row, player_id, colours, floats FROM player_histories{condition} "
+                "ORDER BY tournament_row, position", parameters):
+            player_history = records[tournament_row].setdefault("player_history", {"colours": {}, "floats": {}})
+            player_history["colours"][player_id] = colours
+            if floats:
+                player_history["floats"][player_id] = floats
+
+    def _read_body(self, tournament_row):
+        """
+        Return the players, rounds and histories of one tournament row.
+        """
+        records = {tournament_row: {}}
+        self._read_bodies(records, " WHERE tournament_row = ?", (tournament_row,))
+        return records[tournament_row]
+
+    def _decode(self, record):
+        """
+        Build a tournament, reading its child rows on first access if the
+        record only holds the header.
+        """
+        if "rounds" in record:
+            return super()._decode(record)
+        tournament_row = record["_row_id"]
+        return self.model.from_header(record, lambda: self._read_body(tournament_row))
+
+    def _insert_children(self, tournament_row, tournament):
+        """
+        Insert the registrations, rounds, matches and histories of a tournament.
+
+        Parameters
+        ----------
+        tournament_row : int
+            Row id of the tournament.
+        tournament : Tournament
+            The tournament to store.
+        """
+        self.connection.executemany(
+            "INSERT INTO tournament_players (tournament_row, position, player_id, points) VALUES (?, ?, ?, ?)",
+            [(tournament_row, position, player_id, points)
+             for position, (player_id, points) in enumerate(tournament.players.items())])
+        for round_index, round in enumerate(tournament.rounds):
+            self._insert_round(tournament_row, round_index, round)
+        self._insert_history(tournament_row, 0, tournament.matches_history)
+        self._insert_player_history(tournament_row, tournament)
+
+    def _insert_round(self, tournament_row, round_index, round):
+        """
+        Insert a round and its matches.
+
+        Parameters
+        ----------
+        tournament_row : int
+            Row id of the tournament.
+        round_index : int
+            Position of the round in the tournament.
+        round : TournamentRound | dict
+            The round (or its to_dict() representation).
+        """
+        round_data = round if isinstance(round, dict) else round.to_dict()
+        self.connection.execute(
+            f"INSERT INTO rounds (tournament_row, round_index, {', '.join(ROUND_COLUMNS)}) "
+            f"VALUES (?, ?, {', '.join('?' for _ in ROUND_COLUMNS)})",
+            [tournament_row, round_index] + [round_data.get(column) for column in ROUND_COLUMNS])
+        self.connection.executemany(
+            "INSERT INTO matches (tournament_row, round_index, match_index, white_id, white_score, black_id, "
+            "black_score) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(tournament_row, round_index, match_index, match[0][0], match[0][1], match[1][0], match[1][1])
+             for match_index, match in enumerate(round_data["matches"])])
+
+    def _insert_history(self, tournament_row, start, pairs):
+        """
+        Insert pairing history entries starting at a given position.
+
+        Parameters
+        ----------
+        tournament_row : int
+            Row id of the tournament.
+        start : int
+            Position of the first pair.
+        pairs : list
+            Pairs [p1, p2] to insert.
+        """
+        self.connection.executemany(
+            "INSERT INTO matches_history (tournament_row, position, player1, player2) VALUES (?, ?, ?, ?)",
+            [(tournament_row, start + offset, pair[0], pair[1]) for offset, pair in enumerate(pairs)])
+
+    def _insert_player_history(self, tournament_row, tournament):
+        """
+        Insert the colour sequences and downfloats of the players of a tournament.
+
+        Parameters
+        ----------
+        tournament_row : int
+            Row id of the tournament.
+        tournament : Tournament
+            The tournament to store.
+        """
+        player_history = tournament.player_history.to_dict()
+        self.connection.executemany(
+            "INSERT INTO player_histories (tournament_row, position, player_id, colours, floats) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [(tournament_row, position, player_id, colours, player_history["floats"].get(player_id, 0))
+             for position, (player_id, colours) in enumerate(player_history["colours"].items())])
+
+    def _delete_children(self, tournament_row):
+        """
+        Delete every child row of a tournament.
+
+        Parameters
+        ----------
+        tournament_row : int
+            Row id of the tournament.
+        """
+        for table in CHILD_TABLES:
+            self.connection.execute(f"DELETE FROM {table} WHERE tournament_row = ?", (tournament_row,))
+
+    def _flush(self):
+        """
+        Delete removed tournaments, rewrite the rows of dirty ones and insert
+        new tournaments.
+
+        Only the tournaments touched since the last commit are written,
+        including those fetched by key (get()) without loading the others.
+        """
+        with self.connection:
+            for tournament in self.removed:
+                row_id = self._row_ids.pop(tournament, None)
+                if row_id is not None:
+                    self._delete_children(row_id)
+                    self.connection.execute("DELETE FROM tournaments WHERE id = ?", (row_id,))
+            assignments = ", ".join(f"{column} = ?" for column in TOURNAMENT_COLUMNS)
+            placeholders = ", ".join("?" for _ in TOURNAMENT_COLUMNS)
+            for tournament in self.dirty:
+                row_id = self._row_ids.get(tournament)
+                if row_id is not None:
+                    values = tournament_values(tournament)
+                    self.connection.execute(f"UPDATE tournaments SET {assignments} WHERE id = ?", values + [row_id])
+                    self._delete_children(row_id)
+                    self._insert_children(row_id, tournament)
+            for tournament in self.tournaments:
+                if tournament in self.dirty and tournament not in self._row_ids:
+                    cursor = self.connection.execute(
+                        f"INSERT INTO tournaments ({', '.join(TOURNAMENT_COLUMNS)}) VALUES ({placeholders})",
+                        tournament_values(tournament))
+                    self._row_ids[tournament] = cursor.lastrowid
+                    self._insert_children(cursor.lastrowid, tournament)
+
+    def record(self, tournament, event):
+        """
+        Apply an event as row-level statements.
+
+        A tournament which is not stored yet or already has pending changes
+        is only marked dirty and written with the next commit.
+
+        Parameters
+        ----------
+        tournament : Tournament
+            The modified tournament.
+        event : dict
+            Event without its tournament_id (see repository.journal).
+        """
+        row_id = self._row_ids.get(tournament)
+        if row_id is None or tournament in self.dirty:
+            self.mark_dirty(tournament)
+            return
+        event_type = event["type"]
+        with self.connection:
+            if event_type == "result":
+                self.connection.execute(
+                    "UPDATE matches SET white_score = ?, black_score = ? "
+                    "WHERE tournament_row = ? AND round_index = ? AND match_index = ?",
+                    (event["scores"][0], event["scores"][1], row_id, event["round_index"], event["match_index"]))
+            elif event_type == "round_close":
+                self.connection.execute(
+                    "UPDATE rounds SET end_date = ?, end_time = ?, status = ? "
+                    "WHERE tournament_row = ? AND round_index = ?",
+                    (event["end_date"], event["end_time"], event["status"], row_id, event["round_index"]))
+            elif event_type == "points":
+                self.connection.executemany(
+                    "UPDATE tournament_players SET points = ? WHERE tournament_row = ? AND player_id = ?",
+                    [(points, row_id, player_id) for player_id, points in event["players"].items()])
+            elif event_type == "pairing":
+                self.connection.execute(
+                    "UPDATE tournaments SET current_round = ? WHERE id = ?", (event["current_round"], row_id))
+                self._insert_round(row_id, len(tournament.rounds) - 1, event["round"])
+                start = len(tournament.matches_history) - len(event["history"])
+                self._insert_history(row_id, start, event["history"])
+                self.connection.execute("DELETE FROM player_histories WHERE tournament_row = ?", (row_id,))
+                self._insert_player_history(row_id, tournament)
+            else:
+                self.mark_dirty(tournament)
@@ -0,0 +1,190 @@
+"""
+JSON file persistence of Tournament objects.
+
+This module exposes:
+- JsonTournamentRepository: loads the tournaments JSON file once per session
+  and writes back only the tournaments marked dirty, in one coalesced flush.
+
+Notes
+-----
+The file keeps the exact layout of json.dump(data, indent=4). Each tournament
+is encoded separately and its text is cached, so a flush only re-encodes the
+dirty tournaments before writing the concatenated document.
+
+Match results, round closing, points and pairings are recorded in an
+append-only ResultJournal (data/journal.log) instead of rewriting the file.
+The journal is replayed on load and compacted into the snapshot on commit,
+which replaces the file atomically so a crash never leaves it truncated.
+
+A binary copy of the file (repository.snapshot) is written with each flush
+and loaded at startup instead of the JSON while it is up to date.
+"""
+
+import json
+import os
+import config
+from repository.base import BaseTournamentRepository, write_text_atomically
+from repository.journal import ResultJournal, apply_event
+from repository.snapshot import file_signature, load_json_records, snapshot_path_for, write_snapshot
+
+
+class JsonTournamentRepository(BaseTournamentRepository):
+    """Tournament repository backed by a JSON file and an event journal.
+
+    Attributes
+    ----------
+    journal : ResultJournal
+        Journal of the events recorded since the last commit.
+    compact_every : int
+        Number of journal entries that triggers a commit (compaction).
+    snapshot_path : str | None
+        Binary snapshot of the file, or None when snapshots are disabled.
+    """
+
+    def __init__(self, filepath="data/tournaments.json", reload_if_changed=False, journal=None, compact_every=500,
+                 snapshot=None):
+        """
+        Initialize an empty, not yet loaded repository.
+
+        Parameters
+        ----------
+        filepath : str
+            JSON file backing the repository.
+        reload_if_changed : bool
+            Opt-in check of the file (mtime, size) before each access.
+        journal : ResultJournal | None
+            Event journal; defaults to journal.log next to filepath.
+        compact_every : int
+            Journal size that triggers an automatic compaction.
+        snapshot : bool | None
+            Use a binary snapshot; defaults to config.USE_SNAPSHOTS.
+        """
+        super().__init__(filepath, reload_if_changed)
+        if journal is None:
+            journal = ResultJournal(os.path.join(os.path.dirname(filepath), "journal.log"))
+        self.journal = journal
+        self.compact_every = compact_every
+        if snapshot is None:
+            snapshot = config.USE_SNAPSHOTS
+        self.snapshot_path = snapshot_path_for(filepath) if snapshot else None
+        self._encoded = {}
+
+    def _read_signature(self):
+        """
+        Return the (st_mtime_ns, st_size) signature of the backing file.
+
+        Returns
+        -------
+        tuple | None
+            The signature, or None if the file does not exist.
+        """
+        return file_signature(self.filepath)
+
+    def _read_records(self):
+        """
+        Decode the backing file, or its snapshot when up to date.
+
+        Returns
+        -------
+        list[dict]
+            Tournament records; empty if the file is missing or invalid.
+        """
+        return load_json_records(self.filepath, self.snapshot_path)
+
+    def _after_load(self):
+        """
+        Drop cached encodings and replay the journal.
+
+        Replayed tournaments are marked dirty so the next commit compacts
+        them into the snapshot.
+        """
+        self._encoded.clear()
+        pending = set(self.dirty)
+        for event in self.journal.read():
+            tournament = self.identity_map.get(event["tournament_id"])
+            if tournament is not None and tournament not in pending:
+                apply_event(tournament, event)
+                self.mark_dirty(tournament)
+
+    def record(self, tournament, event):
+        """
+        Journal an event describing a change already applied in memory.
+
+        The tournament is marked dirty; once the journal holds compact_every
+        entries the repository is committed, which empties the journal.
+
+        Parameters
+        ----------
+        tournament : Tournament
+            The modified tournament.
+        event : dict
+            Event without its tournament_id (see repository.journal).
+        """
+        event["tournament_id"] = tournament.tournament_id
+        self.journal.append(event)
+        self.mark_dirty(tournament)
+        if self.journal.entries_count >= self.compact_every:
+            self.commit()
+
+    def remove(self, index):
+        """
+        Remove the tournament at the given index.
+
+        Parameters
+        ----------
+        index : int
+            Position of the tournament in the ordered list.
+
+        Returns
+        -------
+        Tournament
+            The removed tournament.
+        """
+        tournament = super().remove(index)
+        self._encoded.pop(tournament, None)
+        return tournament
+
+    def has_changes(self):
+        """
+        Return True if there are uncommitted changes or journal entries.
+        """
+        return super().has_changes() or self.journal.entries_count > 0
+
+    def _encode(self, tournament):
+        """
+        Return the cached JSON text of a tournament, encoding it if needed.
+
+        The text is indented as an element of the top-level list.
+
+        Parameters
+        ----------
+        tournament : Tournament
+            The tournament to encode.
+
+        Returns
+        -------
+        str
+            JSON text of the tournament.
+        """
+        text = self._encoded.get(tournament)
+        if text is None:
+            text = json.dumps(tournament.to_dict(), ensure_ascii=False, indent=4)
+            text = "    " + text.replace("\n", "\n    ")
+            self._encoded[tournament] = text
+        return text
+
+    def _flush(self):
+        """
+        Rewrite the snapshot, re-encoding only dirty tournaments, then empty
+        the journal.
+        """
+        for tournament in self.dirty:
+            self._encoded.pop(tournament, None)
+        if self.tournaments:
+            content = "[\n" + ",\n".join(self._encode(t) for t in self.tournaments) + "\n]"
+        else:
+            content = "[]"
+        write_text_atomically(self.filepath, content)
+        if self.snapshot_path is not None:
+            write_snapshot(self.snapshot_path, [t.to_dict() for t in self.tournaments], file_signature(self.filepath))
+        self.journal.truncate()
@@ -0,0 +1,30 @@
+"""
+Tests of the Monte Carlo forecast of the standings.
+"""
+
+import pytest
+from utils.forecast_utils import forecast_standings
+
+POINTS = {"AB12345": 1.0, "CD23456": 1.0, "EF34567": 0.5, "GH45678": 0.5, "IJ56789": 0.0, "KL67890": 0.0}
+RATINGS = {"AB12345": 2100, "CD23456": 1850, "EF34567": 1700, "GH45678": 1650, "IJ56789": 1500}
+
+
+def forecast(workers):
+    """
+    Return a seeded forecast of three rounds left, split in eight chunks.
+    """
+    return forecast_standings(
+        POINTS, RATINGS, [["AB12345", "IJ56789"], ["CD23456", "KL67890"], ["EF34567", "GH45678"]],
+        rounds_left=3, next_round=1, simulations=400, workers=workers, seed=2026, chunks=8)
+
+
+def test_the_forecast_does_not_depend_on_the_number_of_workers():
+    assert forecast(1) == forecast(2)
+
+
+def test_win_probabilities_sum_to_one():
+    probabilities = forecast(1)
+
+    assert sum(entry["win"] for entry in probabilities.values()) == pytest.approx(1.0)
+    assert sum(entry["podium"] for entry in probabilities.values()) == pytest.approx(3.0)
+    assert all(entry["points"] >= POINTS[player_id] for player_id, entry in probabilities.items())
@@ -0,0 +1,76 @@
+"""
+Tests of the tournament events journal.
+"""
+
+import os
+from controller.tournament_controller import TournamentController
+from repository.journal import ResultJournal
+from repository.tournament_repository import JsonTournamentRepository
+
+
+def start_tournament(tournaments_path, compact_every=500):
+    """
+    Store a started Swiss tournament of four players and return its controller.
+    """
+    controller = TournamentController(JsonTournamentRepository(tournaments_path, compact_every=compact_every,
+                                                               snapshot=False))
+    controller.add_tournament("Open", "Lyon", "01/02/2026", "02/02/2026", "Open du samedi")
+    controller.subscribe_players(0, ["AB12345", "CD23456", "EF34567", "GH45678"])
+    controller.start_tournament(0, round_robin=False)
+    controller.commit()
+    return controller
+
+
+def reload_results(tournaments_path):
+    """
+    Return the scores of the first round read by a new session.
+    """
+    repository = JsonTournamentRepository(tournaments_path, snapshot=False)
+    repository.ensure_loaded()
+    return [(match[0][1], match[1][1]) for match in repository.tournaments[0].rounds[0].matches]
+
+
+def test_results_are_replayed_after_a_crash(tmp_path):
+    tournaments_path = str(tmp_path / "tournaments.json")
+    controller = start_tournament(tournaments_path)
+    controller.put_tournament_round_match_results(0, 0, 0, 1.0)
+    controller.put_tournament_round_match_results(0, 0, 1, 0.5)
+
+    # No commit: the session stops with the results only in the journal.
+    assert len(ResultJournal(str(tmp_path / "journal.log")).read()) == 2
+    assert reload_results(tournaments_path) == [(1.0, 0.0), (0.5, 0.5)]
+
+
+def test_a_torn_last_line_is_skipped(tmp_path):
+    tournaments_path = str(tmp_path / "tournaments.json")
+    journal_path = str(tmp_path / "journal.log")
+    controller = start_tournament(tournaments_path)
+    controller.put_tournament_round_match_results(0, 0, 0, 1.0)
+    controller.put_tournament_round_match_results(0, 0, 1, 0.5)
+
+    # A crash in the middle of the second append.
+    with open(journal_path, "rb+") as f:
+        f.truncate(os.path.getsize(journal_path) - 10)
+
+    assert len(ResultJournal(journal_path).read()) == 1
+    assert reload_results(tournaments_path) == [(1.0, 0.0), ("", "")]
+
+
+def test_the_journal_is_compacted_at_the_threshold(tmp_path):
+    tournaments_path = str(tmp_path / "tournaments.json")
+    journal_path = str(tmp_path / "journal.log")
+    controller = start_tournament(tournaments_path, compact_every=3)
+    controller.put_tournament_round_match_results(0, 0, 0, 1.0)
+    controller.put_tournament_round_match_results(0, 0, 1, 0.5)
+    assert controller.repository.journal.entries_count == 2
+
+    controller.close_tournament_round(0, 0)
+
+    assert controller.repository.journal.entries_count == 0
+    assert os.path.getsize(journal_path) == 0
+    repository = JsonTournamentRepository(tournaments_path, journal=ResultJournal(str(tmp_path / "none.log")),
+                                          snapshot=False)
+    repository.ensure_loaded()
+    round = repository.tournaments[0].rounds[0]
+    assert [(match[0][1], match[1][1]) for match in round.matches] == [(1.0, 0.0), (0.5, 0.5)]
+    assert round.status == "Terminé"
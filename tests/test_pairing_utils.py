@@ -0,0 +1,117 @@
+"""
+Tests of the Swiss pairing engine and of the accelerated pairing.
+"""
+
+import random
+import pytest
+import utils.pairing_utils as pairing_utils
+from utils.history_utils import PlayerHistory
+from utils.pairing_utils import (
+    ACCELERATED_POINTS, BYE_POINTS, PlayedPairs, acceleration_settings, pair_swiss_round, pairing_points,
+)
+
+
+def test_swiss_rounds_with_an_odd_number_of_players():
+    rng = random.Random(3)
+    players = {f"GH{number:05d}": 0.0 for number in range(11)}
+    played = PlayedPairs()
+    history = PlayerHistory()
+    byes = []
+    for round_number in range(1, 8):
+        matches, bye = pair_swiss_round(players, played, rng=random.Random(round_number), history=history)
+
+        paired = [player for white, black in matches for player in (white[0], black[0])]
+        assert bye is not None and bye not in byes
+        assert sorted(paired + [bye]) == sorted(players)
+        for white, black in matches:
+            assert black[0] not in played.opponents(white[0])
+
+        byes.append(bye)
+        history.record_round(matches, bye)
+        for white, black in matches:
+            played.add(white[0], black[0])
+            result = rng.choice([1.0, 0.5, 0.0])
+            players[white[0]] += result
+            players[black[0]] += 1 - result
+        players[bye] += BYE_POINTS
+    assert len(set(byes)) == 7
+
+
+def test_backtracking_avoids_a_rematch_the_first_choice_leads_to():
+    # A takes B first, which leaves C and D, who already met.
+    players = {"A": 3.0, "B": 2.0, "C": 1.0, "D": 0.0}
+    matches, bye = pair_swiss_round(players, [["C", "D"]], rng=random.Random(0))
+
+    assert bye is None
+    assert {frozenset((white[0], black[0])) for white, black in matches} == {frozenset("AC"), frozenset("BD")}
+
+
+def test_greedy_fallback_once_the_search_budget_runs_out(monkeypatch):
+    monkeypatch.setattr(pairing_utils, "SEARCH_BUDGET_PER_PLAYER", -1000)
+    players = {"A": 3.0, "B": 2.0, "C": 1.0, "D": 0.0}
+    matches, bye = pair_swiss_round(players, [["C", "D"]], rng=random.Random(0))
+
+    # The search gives up at its first backtrack: players are paired in
+    # ranking order, C and D meeting again.
+    assert bye is None
+    assert [(white[0], black[0]) for white, black in matches] == [("A", "B"), ("C", "D")]
+
+
+@pytest.mark.parametrize("count", [4, 5])
+def test_everybody_is_paired_when_no_pairing_avoids_rematches(count):
+    players = {f"P{number}": 0.0 for number in range(count)}
+    everybody_met = [[player, other] for player in players for other in players if player < other]
+    matches, bye = pair_swiss_round(players, everybody_met, rng=random.Random(1))
+
+    paired = [player for white, black in matches for player in (white[0], black[0])]
+    assert sorted(paired + ([bye] if bye is not None else [])) == sorted(players)
+    assert (bye is not None) == (count % 2 == 1)
+
+
+def make_open(count):
+    """
+    Return the ratings and the points of an open of count players.
+    """
+    rng = random.Random(count)
+    ratings = {f"KL{number:05d}": 1200 + number * 25 for number in range(count)}
+    points = {player: rng.choice([0.0, 0.5, 1.0]) for player in ratings}
+    return ratings, points
+
+
+def test_group_a_holds_the_best_rated_half_rounded_to_an_even_count():
+    for count, size in ((8, 4), (10, 6), (11, 6), (13, 8)):
+        ratings, _ = make_open(count)
+        acceleration = acceleration_settings(ratings)
+
+        best = sorted(ratings, key=ratings.get, reverse=True)
+        assert acceleration["players"] == best[:size]
+        assert acceleration["points"] == list(ACCELERATED_POINTS)
+
+
+def test_virtual_points_only_in_the_accelerated_rounds():
+    ratings, points = make_open(12)
+    acceleration = acceleration_settings(ratings, (1.0, 0.5))
+    group_a = set(acceleration["players"])
+    stored = dict(points)
+
+    for round_number, bonus in ((1, 1.0), (2, 0.5)):
+        paired_on = pairing_points(points, acceleration, round_number)
+        assert paired_on is not points
+        assert paired_on == {player: points[player] + (bonus if player in group_a else 0.0) for player in points}
+    for round_number in (0, 3, 4, 9):
+        assert pairing_points(points, acceleration, round_number) is points
+    assert pairing_points(points, None, 1) is points
+    assert points == stored
+
+
+def test_first_accelerated_round_keeps_group_a_apart():
+    ratings, _ = make_open(16)
+    acceleration = acceleration_settings(ratings)
+    group_a = set(acceleration["players"])
+    points = {player: 0.0 for player in ratings}
+
+    matches, bye = pair_swiss_round(pairing_points(points, acceleration, 1), [], rng=random.Random(2))
+
+    assert bye is None
+    for white, black in matches:
+        assert (white[0] in group_a) == (black[0] in group_a)
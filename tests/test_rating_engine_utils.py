@@ -0,0 +1,68 @@
+"""
+Tests of the rating engines.
+"""
+
+import pytest
+from model.player_model import coefficient_k
+from utils.rating_engine_utils import EloEngine, Glicko2Engine
+from utils.tournament_utils import calculate_elo
+
+
+def test_glicko2_rates_the_example_of_glickman():
+    # Example of http://www.glicko.net/glicko/glicko2.pdf: a 1500 player
+    # (RD 200, volatility 0.06) beats a 1400 player and loses to a 1550 and
+    # a 1700 player in one rating period.
+    states = {
+        "1": [1500.0, 200.0, 0.06, 0],
+        "2": [1400.0, 30.0, 0.06, 0],
+        "3": [1550.0, 100.0, 0.06, 0],
+        "4": [1700.0, 300.0, 0.06, 0],
+    }
+    rounds_matches = [
+        [(["1", 1.0], ["2", 0.0])],
+        [(["3", 1.0], ["1", 0.0])],
+        [(["1", 0.0], ["4", 1.0])],
+    ]
+
+    Glicko2Engine().rate_period(rounds_matches, states)
+
+    rating, deviation, volatility, games_played = states["1"]
+    assert rating == pytest.approx(1464.06, abs=0.01)
+    assert deviation == pytest.approx(151.52, abs=0.01)
+    assert volatility == pytest.approx(0.05999, abs=0.00001)
+    assert games_played == 3
+
+
+def test_glicko2_only_widens_the_deviation_without_games():
+    states = {"1": [1500.0, 200.0, 0.06, 0], "2": [1500.0, 200.0, 0.06, 0], "3": [1600.0, 80.0, 0.06, 4]}
+
+    Glicko2Engine().rate_period([[(["1", 0.5], ["2", 0.5])]], states)
+
+    rating, deviation, volatility, games_played = states["3"]
+    assert (rating, volatility, games_played) == (1600.0, 0.06, 4)
+    assert deviation > 80.0
+
+
+def test_elo_engine_matches_calculate_elo_game_by_game():
+    states = {"1": [1500, 40, 0], "2": [1620, 40, 0], "3": [2450, 10, 40], "4": [2390, 20, 35]}
+    rounds_matches = [
+        [(["1", 1.0], ["2", 0.0]), (["3", 0.5], ["4", 0.5])],
+        [(["2", 0.0], ["3", 1.0]), (["4", 1.0], ["1", 0.0])],
+        [(["1", 0.5], ["3", 0.5]), (["4", ""], ["2", ""])],
+    ]
+    expected = {player_id: list(state) for player_id, state in states.items()}
+    for matches in rounds_matches:
+        before = {player_id: state[0] for player_id, state in expected.items()}
+        for (player1_id, result1), (player2_id, result2) in matches:
+            if result1 == "":
+                continue
+            for player_id, opponent_id, score in ((player1_id, player2_id, result1),
+                                                  (player2_id, player1_id, result2)):
+                state = expected[player_id]
+                state[0] = calculate_elo(before[player_id], before[opponent_id], state[1], score)
+                state[2] += 1
+                state[1] = coefficient_k(state[2], state[0])
+
+    EloEngine().rate_period(rounds_matches, states)
+
+    assert states == expected
@@ -0,0 +1,48 @@
+"""
+Tests of the batch ELO ratings.
+"""
+
+import random
+import pytest
+from utils.rating_utils import rate_games
+from utils.tournament_utils import calculate_elo
+
+
+def random_games(rng, player_count, game_count):
+    """
+    Return random ratings and the parallel arrays of game_count games.
+    """
+    ratings = [rng.randint(1000, 2800) for _ in range(player_count)]
+    players, opponents, scores, k_factors = [], [], [], []
+    for _ in range(game_count):
+        player, opponent = rng.sample(range(player_count), 2)
+        score = rng.choice([1.0, 0.5, 0.0])
+        for rated, other, result in ((player, opponent, score), (opponent, player, 1 - score)):
+            players.append(rated)
+            opponents.append(other)
+            scores.append(result)
+            k_factors.append(rng.choice([10, 20, 40]))
+    return ratings, players, opponents, scores, k_factors
+
+
+def test_one_game_per_player_is_calculate_elo():
+    rng = random.Random(5)
+    ratings, players, opponents, scores, k_factors = random_games(rng, 2, 1)
+
+    new_ratings = rate_games(ratings, players, opponents, scores, k_factors, use_numpy=False)
+
+    for player, opponent, score, k_factor in zip(players, opponents, scores, k_factors):
+        assert new_ratings[player] == calculate_elo(ratings[player], ratings[opponent], k_factor, score)
+
+
+def test_numpy_path_matches_the_python_path():
+    pytest.importorskip("numpy")
+    rng = random.Random(8)
+    for _ in range(50):
+        games = random_games(rng, rng.randint(2, 300), rng.randint(1, 2000))
+
+        expected = rate_games(*games, use_numpy=False)
+        vectorised = rate_games(*games, use_numpy=True)
+
+        assert vectorised == expected
+        assert all(isinstance(rating, int) for rating in vectorised)
@@ -0,0 +1,59 @@
+"""
+Tests of the Berger round-robin schedules.
+"""
+
+import random
+from itertools import combinations
+import pytest
+from utils.round_robin_utils import berger_schedule, schedule_round
+
+
+def play_schedule(count):
+    """
+    Return the schedule, the rounds (matches, bye) and the colours of each player.
+    """
+    players = [f"IJ{number:05d}" for number in range(count)]
+    schedule = berger_schedule(players, random.Random(count))
+    rounds = [schedule_round(schedule, index) for index in range(len(schedule["rounds"]))]
+    colours = {player: "" for player in players}
+    for matches, _ in rounds:
+        for white, black in matches:
+            colours[white[0]] += "W"
+            colours[black[0]] += "B"
+    return schedule, rounds, colours
+
+
+@pytest.mark.parametrize("count", range(3, 21))
+def test_every_pair_meets_exactly_once(count):
+    schedule, rounds, _ = play_schedule(count)
+    players = schedule["order"]
+
+    assert len(rounds) == count - 1 + count % 2
+    pairs = [frozenset((white[0], black[0])) for matches, _ in rounds for white, black in matches]
+    assert sorted(pairs, key=sorted) == sorted((frozenset(pair) for pair in combinations(players, 2)), key=sorted)
+    for matches, bye in rounds:
+        seated = [player for white, black in matches for player in (white[0], black[0])]
+        assert sorted(seated + ([bye] if bye is not None else [])) == sorted(players)
+
+
+@pytest.mark.parametrize("count", range(3, 21))
+def test_colours_alternate_and_balance(count):
+    _, _, colours = play_schedule(count)
+
+    for sequence in colours.values():
+        assert "WWW" not in sequence and "BBB" not in sequence
+        assert abs(sequence.count("W") - sequence.count("B")) <= 1
+
+
+@pytest.mark.parametrize("count", range(3, 21))
+def test_byes_rotate_through_every_player_of_an_odd_count(count):
+    schedule, rounds, _ = play_schedule(count)
+    byes = [bye for _, bye in rounds]
+
+    if count % 2:
+        # The seed facing the dummy moves by half a circle each round.
+        half = (count + 1) // 2
+        assert byes == [schedule["order"][round_index * half % count] for round_index in range(count)]
+        assert sorted(byes) == sorted(schedule["order"])
+    else:
+        assert byes == [None] * len(rounds)
@@ -0,0 +1,44 @@
+"""
+Regression tests of the sharded tournaments repository.
+"""
+
+import json
+import os
+from model.tournament_model import Tournament
+from repository.sharded_repository import ShardedTournamentRepository, convert_to_shards
+from repository.tournament_repository import JsonTournamentRepository
+
+
+def write_tournaments(tournaments_path, names):
+    """
+    Write a tournaments JSON file holding one tournament per name.
+    """
+    repository = JsonTournamentRepository(tournaments_path)
+    repository.ensure_loaded()
+    for name in names:
+        repository.add(Tournament(name, "Nantes", "01/03/2026", "02/03/2026", "Tournoi rapide"))
+    repository.commit()
+    return [tournament.tournament_id for tournament in repository.tournaments]
+
+
+def test_convert_to_shards_replaces_an_existing_layout(tmp_path):
+    directory = str(tmp_path / "tournaments")
+    old_ids = write_tournaments(str(tmp_path / "old.json"), ["Rapide", "Blitz", "Classique"])
+    convert_to_shards(str(tmp_path / "old.json"), directory)
+    new_ids = write_tournaments(str(tmp_path / "new.json"), ["Rapide", "Blitz"])
+
+    assert convert_to_shards(str(tmp_path / "new.json"), directory) == 2
+    convert_to_shards(str(tmp_path / "new.json"), directory)
+
+    with open(os.path.join(directory, "manifest.json"), "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    assert [entry["tournament_id"] for entry in manifest] == new_ids
+    assert [entry["name"] for entry in manifest] == ["Rapide", "Blitz"]
+    assert sorted(os.listdir(directory)) == sorted(["manifest.json"] + [f"{tid}.json" for tid in new_ids])
+    for tournament_id, name in zip(new_ids, ["Rapide", "Blitz"]):
+        with open(os.path.join(directory, f"{tournament_id}.json"), "r", encoding="utf-8") as f:
+            shard = json.load(f)
+        assert (shard["tournament_id"], shard["name"]) == (tournament_id, name)
+    for tournament_id in set(old_ids) - set(new_ids):
+        assert not os.path.exists(os.path.join(directory, f"{tournament_id}.json"))
+    assert ShardedTournamentRepository(directory).count() == 2
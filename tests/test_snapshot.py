@@ -0,0 +1,48 @@
+"""
+Tests of the binary snapshots of the JSON data files.
+"""
+
+import json
+import os
+from repository.snapshot import file_signature, load_json_records, read_snapshot, write_snapshot
+
+
+def write_json(filepath, records):
+    """
+    Write a JSON data file holding records.
+    """
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(records, f, indent=4)
+
+
+def test_a_stale_snapshot_falls_back_to_the_json_file(tmp_path):
+    json_path = str(tmp_path / "players.json")
+    snapshot_path = str(tmp_path / "players.snapshot")
+    write_json(json_path, [{"name": "Snapshot"}])
+    write_snapshot(snapshot_path, [{"name": "Snapshot"}], file_signature(json_path))
+
+    # The JSON file is edited after the snapshot was written.
+    write_json(json_path, [{"name": "Source"}, {"name": "Ajout"}])
+    mtime_ns = os.stat(snapshot_path).st_mtime_ns + 1_000_000_000
+    os.utime(json_path, ns=(mtime_ns, mtime_ns))
+
+    assert load_json_records(json_path, snapshot_path) == [{"name": "Source"}, {"name": "Ajout"}]
+    assert read_snapshot(snapshot_path, file_signature(json_path)) == [{"name": "Source"}, {"name": "Ajout"}]
+
+
+def test_a_snapshot_with_a_wrong_digest_falls_back_to_the_json_file(tmp_path):
+    json_path = str(tmp_path / "players.json")
+    snapshot_path = str(tmp_path / "players.snapshot")
+    write_json(json_path, [{"name": "Source"}])
+    write_snapshot(snapshot_path, [{"name": "Snapshot"}], file_signature(json_path))
+    assert load_json_records(json_path, snapshot_path) == [{"name": "Snapshot"}]
+
+    # Corrupt the last byte of the payload, keeping the header intact.
+    with open(snapshot_path, "rb+") as f:
+        f.seek(-1, os.SEEK_END)
+        last = f.read(1)
+        f.seek(-1, os.SEEK_END)
+        f.write(bytes([last[0] ^ 0xFF]))
+
+    assert read_snapshot(snapshot_path, file_signature(json_path)) is None
+    assert load_json_records(json_path, snapshot_path) == [{"name": "Source"}]
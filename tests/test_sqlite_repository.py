@@ -0,0 +1,55 @@
+"""
+Regression tests of the SQLite repositories.
+"""
+
+from controller.tournament_controller import TournamentController
+from repository.sqlite_repository import SqliteTournamentRepository
+
+
+def start_swiss_tournament(database_path):
+    """
+    Store a Swiss tournament of four players whose first round is finished.
+    """
+    controller = TournamentController(SqliteTournamentRepository(database_path))
+    controller.add_tournament("Open", "Lyon", "01/02/2026", "02/02/2026", "Open du samedi")
+    controller.subscribe_players(0, ["AB12345", "CD23456", "EF34567", "GH45678"])
+    controller.start_tournament(0, round_robin=False)
+    for match_number in range(controller.get_tournament_round_matches_count(0, 0)):
+        controller.put_tournament_round_match_results(0, 0, match_number, 1.0)
+    controller.close_tournament_round(0, 0)
+    controller.update_tournament_round_players_points(0, 0)
+    controller.commit()
+    return controller.get_tournament(0).tournament_id
+
+
+def test_batch_pairing_of_a_fetched_tournament_is_written(tmp_path):
+    database_path = str(tmp_path / "ajedrez.db")
+    tournament_id = start_swiss_tournament(database_path)
+
+    # A fresh session only fetches the tournament by key (identity map).
+    paired, skipped = TournamentController(SqliteTournamentRepository(database_path)).initiate_next_rounds(
+        [tournament_id], workers=1)
+    assert [entry["tournament_id"] for entry in paired] == [tournament_id]
+    assert skipped == []
+
+    reloaded = SqliteTournamentRepository(database_path).get(tournament_id)
+    assert len(reloaded.rounds) == 2
+    assert reloaded.current_round == 2
+
+
+def test_summaries_of_lazy_tournaments_only_read_the_headers(tmp_path):
+    database_path = str(tmp_path / "ajedrez.db")
+    start_swiss_tournament(database_path)
+    controller = TournamentController(SqliteTournamentRepository(database_path))
+    controller.add_tournament("Rapide", "Lyon", "08/02/2026", "08/02/2026", "Rapide du dimanche")
+    controller.subscribe_players(1, ["AB12345", "CD23456"])
+
+    repository = SqliteTournamentRepository(database_path)
+    repository.lazy = True
+    queries = []
+    repository.connection.set_trace_callback(queries.append)
+    summaries = repository.summaries()
+
+    assert [summary.players_count for summary in summaries] == [4, 2]
+    assert len([query for query in queries if query.startswith("SELECT")]) == 1
+    assert not any(tournament.is_materialised() for tournament in repository.tournaments)
@@ -0,0 +1,45 @@
+"""
+Tests of the live score index.
+"""
+
+import random
+import pytest
+from utils.standings_utils import ScoreIndex
+
+
+def brute_rank(points, player):
+    """Return 1 + the number of players with more points."""
+    return 1 + sum(1 for other in points.values() if other > points[player])
+
+
+@pytest.mark.parametrize("unit", [0.5, 0.25])
+def test_rank_and_top_follow_the_points(unit):
+    rng = random.Random(11)
+    players = [f"EF{number:05d}" for number in rng.sample(range(100000), 40)]
+    index = ScoreIndex()
+    points = {}
+    for player in players:
+        index.add_player(player)
+        points[player] = 0.0
+    for _ in range(400):
+        player = rng.choice(players)
+        scored = rng.choice([0.0, unit, 1.0, 2 * unit])
+        index.add_points(player, scored)
+        points[player] += scored
+
+        assert all(index.rank(other) == brute_rank(points, other) for other in players)
+        expected = sorted(players, key=lambda other: (-points[other], players.index(other)))
+        k = rng.randint(0, 45)
+        assert index.top(k) == expected[:k]
+
+
+def test_equal_points_share_a_rank():
+    index = ScoreIndex()
+    for player in ("A", "B", "C", "D"):
+        index.add_player(player)
+    index.add_points("B", 1.0)
+    index.add_points("C", 1.0)
+    index.add_points("D", 0.5)
+
+    assert [index.rank(player) for player in ("A", "B", "C", "D")] == [4, 1, 1, 3]
+    assert index.top(3) == ["B", "C", "D"]
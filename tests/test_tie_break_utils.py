@@ -0,0 +1,46 @@
+"""
+Tests of the standings read from the live score index.
+"""
+
+import random
+from utils.tie_break_utils import TieBreaks
+
+
+def play_rounds(players, rounds, rng):
+    """
+    Record random rounds (byes included) and return the tie-breaks.
+    """
+    tie_breaks = TieBreaks(players)
+    for _ in range(rounds):
+        shuffled = list(players)
+        rng.shuffle(shuffled)
+        bye = shuffled.pop() if len(shuffled) % 2 else None
+        matches = []
+        for white, black in zip(shuffled[::2], shuffled[1::2]):
+            result = rng.choice([1.0, 0.5, 0.0])
+            matches.append(([white, result], [black, 1 - result]))
+        tie_breaks.record_round(matches, bye)
+    return tie_breaks
+
+
+def test_score_groups_follow_the_points_in_registration_order():
+    rng = random.Random(4)
+    players = [f"AB{number:05d}" for number in rng.sample(range(100000), 25)]
+    tie_breaks = play_rounds(players, 6, rng)
+
+    expected = sorted(players, key=lambda player: (-tie_breaks.points(player), players.index(player)))
+    groups = list(tie_breaks.scores.score_groups())
+    assert [player for _, group in groups for player in group] == expected
+    assert all(tie_breaks.points(player) == score for score, group in groups for player in group)
+
+
+def test_limited_standings_are_the_head_of_the_standings():
+    rng = random.Random(9)
+    players = [f"CD{number:05d}" for number in range(17)]
+    tie_breaks = play_rounds(players, 5, rng)
+
+    standings = tie_breaks.standings()
+    keys = [(row["points"],) + row["tie_breaks"] for row in standings]
+    assert keys == sorted(keys, reverse=True)
+    for limit in (0, 1, 3, 16, 17, 30):
+        assert tie_breaks.standings(limit=limit) == standings[:limit]
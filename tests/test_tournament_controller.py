@@ -0,0 +1,56 @@
+"""
+Tests of the tournament controller.
+"""
+
+import shutil
+from controller.tournament_controller import TournamentController
+from repository.tournament_repository import JsonTournamentRepository
+
+PLAYER_IDS = ["AB12345", "CD23456", "EF34567", "GH45678", "IJ56789", "KL67890"]
+
+
+def start_swiss_tournaments(tournaments_path, sizes):
+    """
+    Store one Swiss tournament per size whose first round is finished.
+    """
+    controller = TournamentController(JsonTournamentRepository(tournaments_path, snapshot=False))
+    for index, size in enumerate(sizes):
+        controller.add_tournament(f"Open {size}", "Lyon", "01/02/2026", "02/02/2026", "Open du samedi")
+        controller.subscribe_players(index, PLAYER_IDS[:size])
+        controller.start_tournament(index, round_robin=False)
+        for match_number in range(controller.get_tournament_round_matches_count(index, 0)):
+            controller.put_tournament_round_match_results(index, 0, match_number, [1.0, 0.5, 0.0][match_number % 3])
+        controller.close_tournament_round(index, 0)
+        controller.update_tournament_round_players_points(index, 0)
+    controller.commit()
+    return [tournament.tournament_id for tournament in controller.tournaments]
+
+
+def rounds_of(controller):
+    """
+    Return the matches and bye of every round of every tournament.
+    """
+    return [[(round.matches, round.bye) for round in tournament.rounds] for tournament in controller.tournaments]
+
+
+def test_batch_pairing_pairs_like_one_tournament_at_a_time(tmp_path):
+    batch_path = str(tmp_path / "batch.json")
+    single_path = str(tmp_path / "single.json")
+    tournament_ids = start_swiss_tournaments(batch_path, [4, 5, 6])
+    shutil.copy(batch_path, single_path)
+
+    batch = TournamentController(JsonTournamentRepository(batch_path, snapshot=False))
+    commits = []
+    commit = batch.repository.commit
+    batch.repository.commit = lambda *args: commits.append(args) or commit(*args)
+    paired, skipped = batch.initiate_next_rounds(tournament_ids, workers=2)
+
+    single = TournamentController(JsonTournamentRepository(single_path, snapshot=False))
+    for index in range(len(tournament_ids)):
+        single.initiate_next_tournament_round(index)
+
+    assert [entry["tournament_id"] for entry in paired] == tournament_ids
+    assert skipped == []
+    assert len(commits) == 1
+    assert rounds_of(batch) == rounds_of(single)
+    assert all(len(tournament.rounds) == 2 for tournament in batch.tournaments)
@@ -0,0 +1,253 @@
+"""
+Monte Carlo forecast of the final standings of a tournament.
+
+The remaining games of a tournament are played many times at random: each
+result is drawn from the expected score of the ELO formula used by
+calculate_elo (utils.tournament_utils), the following rounds being paired
+by the pairing engine of the tournament (Swiss strategy, with its virtual
+points when accelerated, or the round-robin schedule). Counting how often each player finishes first or on the podium
+gives their probabilities.
+
+Simulations are split in chunks run by a ProcessPoolExecutor, each chunk
+with its own random generator derived from the seed, so the forecast scales
+with the number of cores and is reproducible for a given seed and chunking.
+
+This module exposes:
+- simulate_game(expected, draw_rate, rng): draw the result of a game.
+- forecast_standings(...): win and podium probabilities of every player.
+
+Notes
+-----
+Ties on points are shared: the players tied for first each get an equal part
+of the win, and likewise for the places of the podium. Colours have no
+influence on the simulated results and are not tracked.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import os
+import random
+from utils.pairing_utils import BYE_POINTS, PAIRING_STRATEGIES, PlayedPairs, pairing_points
+from utils.round_robin_utils import schedule_round
+from utils.tournament_utils import expected_score
+
+# Probability of a draw between players of equal strength; it decreases as
+# the expected score moves away from 0.5.
+DRAW_RATE = 0.3
+# Rating used for players without a known ELO.
+DEFAULT_RATING = 1500
+# Chunks of simulations given to each worker (balances the load).
+CHUNKS_PER_WORKER = 4
+
+
+def simulate_game(expected: float, draw_rate: float, rng: random.Random) -> float:
+    """
+    Draw the result of a game from the expected score of the white player.
+
+    Parameters
+    ----------
+    expected : float
+        Expected score of the white player (see expected_score()).
+    draw_rate : float
+        Probability of a draw between players of equal strength.
+    rng : random.Random
+        Source of randomness.
+
+    Returns
+    -------
+    float
+        1.0, 0.5 or 0.0 for the white player; the mean of the result is the
+        expected score.
+    """
+    draw = draw_rate * (1 - abs(2 * expected - 1))
+    value = rng.random()
+    if value < expected - draw / 2:
+        return 1.0
+    if value < expected + draw / 2:
+        return 0.5
+    return 0.0
+
+
+def _simulate(spec: Dict[str, Any], count: int, seed: int) -> Tuple[List[float], List[float], List[float]]:
+    """
+    Run a chunk of simulations.
+
+    Parameters
+    ----------
+    spec : dict
+        State of the tournament, as built by forecast_standings().
+    count : int
+        Number of simulations.
+    seed : int
+        Seed of the random generator of the chunk.
+
+    Returns
+    -------
+    tuple of list
+        Wins, podium places and final points summed over the simulations,
+        aligned with spec["order"].
+    """
+    rng = random.Random(seed)
+    order = spec["order"]
+    slots = {player_id: slot for slot, player_id in enumerate(order)}
+    ratings = spec["ratings"]
+    draw_rate = spec["draw_rate"]
+    podium_size = spec["podium_size"]
+    schedule = spec["schedule"]
+    acceleration = spec["acceleration"]
+    pair_round = PAIRING_STRATEGIES[spec["strategy"]]
+    base_played = PlayedPairs(spec["previous_matches"])
+    wins = [0.0] * len(order)
+    podiums = [0.0] * len(order)
+    totals = [0.0] * len(order)
+
+    def play(matches, points):
+        for (white, _), (black, _) in matches:
+            result = simulate_game(expected_score(ratings[white], ratings[black]), draw_rate, rng)
+            points[white] += result
+            points[black] += 1 - result
+
+    for _ in range(count):
+        points = dict(spec["points"])
+        played = base_played.copy()
+        byes = set(spec["byes"])
+        play(spec["pending_matches"], points)
+        for offset in range(spec["rounds_left"]):
+            if schedule is not None:
+                matches, bye = schedule_round(schedule, spec["next_round"] + offset)
+            else:
+                round_points = pairing_points(points, acceleration, spec["next_round"] + offset + 1)
+                matches, bye = pair_round(round_points, played, byes, rng)
+                played.add_all([white[0], black[0]] for white, black in matches)
+            play(matches, points)
+            if bye is not None:
+                points[bye] += BYE_POINTS
+                byes.add(bye)
+
+        standings = sorted(points.items(), key=lambda item: item[1], reverse=True)
+        start = 0
+        while start < len(standings) and start < podium_size:
+            end = start
+            while end < len(standings) and standings[end][1] == standings[start][1]:
+                end += 1
+            size = end - start
+            for player_id, _points in standings[start:end]:
+                slot = slots[player_id]
+                if start == 0:
+                    wins[slot] += 1 / size
+                podiums[slot] += (min(end, podium_size) - start) / size
+            start = end
+        for player_id, player_points in points.items():
+            totals[slots[player_id]] += player_points
+    return wins, podiums, totals
+
+
+def forecast_standings(
+    players: Dict[str, float],
+    ratings: Dict[str, float],
+    previous_matches: Iterable[List[Any]],
+    rounds_left: int,
+    pending_matches: Iterable[Tuple[List[Any], List[Any]]] = (),
+    byes: Iterable[Any] = (),
+    schedule: Optional[Dict[str, Any]] = None,
+    next_round: int = 0,
+    simulations: int = 10000,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    chunks: Optional[int] = None,
+    strategy: str = "backtracking",
+    acceleration: Optional[Dict[str, List[Any]]] = None,
+    draw_rate: float = DRAW_RATE,
+    podium_size: int = 3
+) -> Dict[str, Dict[str, float]]:
+    """
+    Forecast the final standings of a tournament by Monte Carlo simulation.
+
+    Parameters
+    ----------
+    players : dict
+        Mapping player_id -> points scored so far (including the known
+        results of the current round).
+    ratings : dict
+        Mapping player_id -> ELO (DEFAULT_RATING for missing players).
+    previous_matches : iterable
+        Pairs already played or scheduled, e.g. [[p1, p2], ...].
+    rounds_left : int
+        Number of rounds still to be paired and played.
+    pending_matches : iterable
+        Matches already paired whose result is unknown
+        ([white_id, score], [black_id, score]).
+    byes : iterable
+        Ids of the players who already received a bye.
+    schedule : dict | None
+        Round-robin schedule of the tournament (utils.round_robin_utils):
+        the remaining rounds are read from it instead of being paired.
+    next_round : int
+        Index of the first round left (rounds already paired); in the
+        schedule, and to select the virtual points of an accelerated pairing.
+    simulations : int
+        Number of simulated tournaments.
+    workers : int | None
+        Number of worker processes (defaults to the number of CPUs); 1 runs
+        the simulations in the current process.
+    seed : int | None
+        Seed making the forecast reproducible (random if None).
+    chunks : int | None
+        Number of chunks the simulations are split in, each with the
+        generator of seed + its position (defaults to CHUNKS_PER_WORKER per
+        worker, 1 with a single worker); the same seed and chunks give the
+        same forecast whatever the number of workers.
+    strategy : str
+        Key of utils.pairing_utils.PAIRING_STRATEGIES.
+    acceleration : dict | None
+        Accelerated pairing settings of the tournament (see
+        utils.pairing_utils.acceleration_settings()).
+    draw_rate : float
+        Probability of a draw between players of equal strength.
+    podium_size : int
+        Number of places on the podium.
+
+    Returns
+    -------
+    dict
+        Mapping player_id -> {"win": probability, "podium": probability,
+        "points": mean final points}.
+    """
+    order = list(players)
+    spec = {
+        "order": order,
+        "points": dict(players),
+        "ratings": {player_id: ratings.get(player_id) or DEFAULT_RATING for player_id in order},
+        "previous_matches": [list(pair) for pair in previous_matches],
+        "pending_matches": [([white[0], ""], [black[0], ""]) for white, black in pending_matches],
+        "rounds_left": rounds_left,
+        "byes": list(byes),
+        "schedule": schedule,
+        "next_round": next_round,
+        "strategy": strategy,
+        "acceleration": acceleration,
+        "draw_rate": draw_rate,
+        "podium_size": podium_size,
+    }
+    workers = workers or os.cpu_count() or 1
+    seed = seed if seed is not None else random.randrange(2 ** 32)
+    if chunks is None:
+        chunks = workers * CHUNKS_PER_WORKER if workers > 1 else 1
+    chunks = max(1, min(simulations, chunks))
+    counts = [simulations // chunks + (1 if chunk < simulations % chunks else 0) for chunk in range(chunks)]
+    seeds = [seed + chunk for chunk in range(chunks)]
+
+    if workers == 1:
+        results = [_simulate(spec, count, chunk_seed) for count, chunk_seed in zip(counts, seeds)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_simulate, [spec] * chunks, counts, seeds))
+
+    forecast = {}
+    for slot, player_id in enumerate(order):
+        forecast[player_id] = {
+            "win": sum(result[0][slot] for result in results) / simulations if simulations else 0.0,
+            "podium": sum(result[1][slot] for result in results) / simulations if simulations else 0.0,
+            "points": sum(result[2][slot] for result in results) / simulations if simulations else players[player_id],
+        }
+    return forecast
@@ -0,0 +1,290 @@
+"""
+Colour and bye history of the players of a tournament.
+
+The pairing needs, for every player, the colours they had, whether they were
+already exempted and how often they floated down. Instead of walking every
+round at each pairing, PlayerHistory keeps these values per player and is
+updated once per round and stored with the tournament.
+
+This module exposes:
+- PlayerHistory: compact per-player history (colour sequences, colour
+  balance and streak, bye flags, downfloats) and colour allocation.
+
+Storage
+-------
+Players get a slot in order of appearance; the per-player values live in
+arrays indexed by slot (array / bytearray), so a lookup or an update is O(1)
+and the memory stays small for thousands of players. The colour sequence of
+a player is a bytearray of one character per round: "W" (white), "B"
+(black) or "-" (bye). The serialized form (to_dict()) only holds the
+sequences and the non-zero downfloat counts:
+
+    {"colours": {player_id: "WB-W", ...}, "floats": {player_id: 1, ...}}
+"""
+
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from utils.pairing_utils import BYE_POINTS
+
+WHITE = ord("W")
+BLACK = ord("B")
+BYE = ord("-")
+
+
+class PlayerHistory:
+    """Compact colour, bye and float history of the players of a tournament.
+
+    Methods
+    -------
+    record_colour(player, white):
+        Append a game with white (white=True) or black to a player's sequence.
+    record_bye(player):
+        Record that a player was exempted from a round.
+    record_float(player):
+        Record that a player was paired with an opponent having fewer points.
+    record_round(matches, bye=None, points=None):
+        Record the colours, bye and downfloats of a new round.
+    colours(player):
+        Return the colour sequence of a player ("WB-W").
+    colour_balance(player), colour_streak(player), had_bye(player), floats(player):
+        O(1) lookups used by the pairing.
+    preference(player):
+        Return the colour wish of a player (> 0 for white, < 0 for black).
+    allocate(player1, player2):
+        Return (white, black) for a pairing, player1 being the higher ranked.
+    to_dict() / from_dict(data):
+        Serialize and rebuild the history.
+    from_rounds(rounds):
+        Rebuild the history of a tournament stored without it.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty history.
+        """
+        self._slots: Dict[Any, int] = {}
+        self._sequences: List[bytearray] = []
+        # Games with white minus games with black.
+        self._balance = array("h")
+        # Same colour in a row: +n for n whites, -n for n blacks.
+        self._streak = array("h")
+        self._floats = array("H")
+        self._byes = bytearray()
+
+    def __len__(self):
+        """
+        Return the number of players with a history.
+        """
+        return len(self._sequences)
+
+    def _slot(self, player: Any) -> int:
+        """
+        Return the slot of a player, creating it on first use.
+        """
+        slot = self._slots.get(player)
+        if slot is None:
+            slot = self._slots[player] = len(self._sequences)
+            self._sequences.append(bytearray())
+            self._balance.append(0)
+            self._streak.append(0)
+            self._floats.append(0)
+            self._byes.append(0)
+        return slot
+
+    def record_colour(self, player: Any, white: bool) -> None:
+        """
+        Append a game with white (white=True) or black to a player's sequence.
+        """
+        slot = self._slot(player)
+        step = 1 if white else -1
+        self._sequences[slot].append(WHITE if white else BLACK)
+        self._balance[slot] += step
+        streak = self._streak[slot]
+        self._streak[slot] = streak + step if streak * step > 0 else step
+
+    def record_bye(self, player: Any) -> None:
+        """
+        Record that a player was exempted from a round.
+        """
+        slot = self._slot(player)
+        self._sequences[slot].append(BYE)
+        self._byes[slot] = 1
+
+    def record_float(self, player: Any) -> None:
+        """
+        Record that a player was paired with an opponent having fewer points.
+        """
+        self._floats[self._slot(player)] += 1
+
+    def record_round(
+        self,
+        matches: Iterable[Tuple[List[Any], List[Any]]],
+        bye: Optional[Any] = None,
+        points: Optional[Dict[Any, float]] = None
+    ) -> None:
+        """
+        Record the colours, bye and downfloats of a new round.
+
+        Parameters
+        ----------
+        matches : iterable
+            Matches in the format ([white_id, score], [black_id, score]).
+        bye : player id | None
+            The player exempted from the round.
+        points : dict | None
+            Mapping player_id -> points before the round; when given, the
+            player with more points in a match is recorded as a floater.
+        """
+        for (white, _), (black, _) in matches:
+            self.record_colour(white, True)
+            self.record_colour(black, False)
+            if points is not None and points[white] != points[black]:
+                self.record_float(white if points[white] > points[black] else black)
+        if bye is not None:
+            self.record_bye(bye)
+
+    def colours(self, player: Any) -> str:
+        """
+        Return the colour sequence of a player, e.g. "WB-W".
+        """
+        slot = self._slots.get(player)
+        return "" if slot is None else self._sequences[slot].decode("ascii")
+
+    def colour_balance(self, player: Any) -> int:
+        """
+        Return the games with white minus the games with black of a player.
+        """
+        slot = self._slots.get(player)
+        return 0 if slot is None else self._balance[slot]
+
+    def colour_streak(self, player: Any) -> int:
+        """
+        Return the last colour repeated in a row: +n for n whites, -n for n blacks.
+        """
+        slot = self._slots.get(player)
+        return 0 if slot is None else self._streak[slot]
+
+    def had_bye(self, player: Any) -> bool:
+        """
+        Return True if the player was already exempted from a round.
+        """
+        slot = self._slots.get(player)
+        return slot is not None and self._byes[slot] == 1
+
+    def floats(self, player: Any) -> int:
+        """
+        Return the number of times a player floated down.
+        """
+        slot = self._slots.get(player)
+        return 0 if slot is None else self._floats[slot]
+
+    def preference(self, player: Any) -> int:
+        """
+        Return the colour wish of a player.
+
+        Returns
+        -------
+        int
+            Positive for white, negative for black, 0 without preference:
+            3 (absolute) after two games of the same colour in a row or a
+            balance of two, 2 (strong) for a balance of one, 1 (mild) to
+            alternate after the last game.
+        """
+        slot = self._slots.get(player)
+        if slot is None:
+            return 0
+        balance = self._balance[slot]
+        streak = self._streak[slot]
+        if balance <= -2 or streak <= -2:
+            return 3
+        if balance >= 2 or streak >= 2:
+            return -3
+        if balance:
+            return -2 if balance > 0 else 2
+        if streak:
+            return -1 if streak > 0 else 1
+        return 0
+
+    def allocate(self, player1: Any, player2: Any) -> Tuple[Any, Any]:
+        """
+        Return the colours of a pairing.
+
+        The strongest colour wish is granted; with equal wishes the higher
+        ranked player (player1) gets theirs, and without any wish player1
+        gets white.
+
+        Parameters
+        ----------
+        player1 : player id
+            The higher ranked player.
+        player2 : player id
+            The lower ranked player.
+
+        Returns
+        -------
+        tuple
+            (white_id, black_id).
+        """
+        wish1 = self.preference(player1)
+        wish2 = self.preference(player2)
+        if abs(wish1) >= abs(wish2):
+            return (player1, player2) if wish1 >= 0 else (player2, player1)
+        return (player2, player1) if wish2 > 0 else (player1, player2)
+
+    def to_dict(self) -> Dict[str, Dict[Any, Any]]:
+        """
+        Return a serializable representation of the history.
+        """
+        return {
+            "colours": {player: self._sequences[slot].decode("ascii") for player, slot in self._slots.items()},
+            "floats": {player: self._floats[slot] for player, slot in self._slots.items() if self._floats[slot]},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Dict[Any, Any]]) -> "PlayerHistory":
+        """
+        Rebuild a history from its to_dict() representation.
+        """
+        history = cls()
+        for player, sequence in data.get("colours", {}).items():
+            for colour in sequence:
+                if colour == "-":
+                    history.record_bye(player)
+                else:
+                    history.record_colour(player, colour == "W")
+        for player, count in data.get("floats", {}).items():
+            history._floats[history._slot(player)] = count
+        return history
+
+    @classmethod
+    def from_rounds(cls, rounds: Iterable[Any]) -> "PlayerHistory":
+        """
+        Rebuild the history of a tournament from its rounds.
+
+        Used once for tournaments stored before the history was kept; the
+        points before each round are recomputed from the results.
+
+        Parameters
+        ----------
+        rounds : iterable
+            Rounds in order (objects with matches and bye attributes, e.g.
+            TournamentRound).
+
+        Returns
+        -------
+        PlayerHistory
+            The history of the rounds.
+        """
+        history = cls()
+        points: Dict[Any, float] = {}
+        for round in rounds:
+            for (white, _), (black, _) in round.matches:
+                points.setdefault(white, 0.0)
+                points.setdefault(black, 0.0)
+            history.record_round(round.matches, round.bye, points)
+            for (white, white_score), (black, black_score) in round.matches:
+                points[white] += white_score or 0.0
+                points[black] += black_score or 0.0
+            if round.bye is not None:
+                points[round.bye] = points.get(round.bye, 0.0) + BYE_POINTS
+        return history
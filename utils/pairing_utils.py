@@ -0,0 +1,594 @@
+"""
+Swiss pairing engine.
+
+This module provides the pairing of the rounds following the first one:
+
+- pair_swiss_round(players, previous_matches, byes, rng, history): pair every
+  player of a round, giving a bye to one player when their number is odd.
+- pair_weighted_round(players, previous_matches, byes, rng, history): the
+  same, solved as a maximum-weight matching (large opens).
+- PlayedPairs: index of the pairs of players who already met (O(1) rematch
+  check), see Tournament.played_pairs().
+- PAIRING_STRATEGIES: the pairing functions by name (config.PAIRING_STRATEGY).
+- round_rng(seed, round_number): random generator of a round of a seeded
+  tournament, so its pairing can be reproduced.
+- acceleration_settings(ratings, virtual_points): accelerated pairing of
+  a large open (virtual points for the top half in the first rounds).
+- pairing_points(players, acceleration, round_number): the points a round
+  is paired on.
+
+Algorithm
+---------
+Players are ranked by points (highest first), players with the same points
+forming a score group shuffled at random. A tournament passes the score groups
+of its live standings (Tournament.score_groups()), which are not rebuilt
+from the points every round. The highest ranked unpaired player
+is paired first, trying opponents in this order:
+
+1. the players of its own score group, starting with the middle of the
+   group (top half against bottom half, as in the Dutch system) and going
+   down, then back up towards the top of the group;
+2. the players of the lower score groups, in ranking order (the player
+   floats down).
+
+Two players who already met are never paired. When a player cannot be
+paired, the previous choice is undone and the next opponent is tried
+(backtracking). The search is bounded; if the bound is reached (for example
+late in a round robin where few unplayed pairings remain) the round is
+completed greedily in ranking order, a player being paired again with a
+previous opponent only when they met every player left, so the pairing is
+always complete.
+
+Weighted matching
+-----------------
+pair_weighted_round() pairs the whole round at once instead: each possible
+pairing is an edge weighted by its cost (squared score difference, both
+players wishing the same colour, a player floating down again), and the round
+is the maximum-cardinality matching of maximum weight (utils.matching_utils).
+Previous opponents get no edge. Each player is only linked to the
+MATCHING_WINDOW closest players below them in the ranking that they have not
+met, which keeps the graph sparse enough for rounds of thousands of players;
+players left unpaired by the window (rare, late in an event) are completed
+greedily as above.
+
+With an odd number of players the bye goes to the lowest ranked player who
+has not had one yet, provided the others can then be paired. The exempted
+player scores BYE_POINTS for the round.
+
+Acceleration
+------------
+In a large open the first rounds would pair the top seeds against much
+weaker players. With an accelerated pairing (Baku system) the stronger half
+of the field (group A) gets virtual points during the first rounds, so the
+score groups keep the two halves apart until results separate the players.
+Virtual points only exist in the points passed to the pairing functions
+(pairing_points()); the points of the tournament and the standings are
+never changed.
+
+Given the PlayerHistory of the tournament (utils.history_utils), byes are
+read from its flags and colours are allocated from the players' colour
+wishes; otherwise the higher ranked player of each board gets white.
+"""
+
+from bisect import bisect_right
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+import random
+from utils.matching_utils import max_weight_matching
+
+# Points awarded to the player exempted from a round.
+BYE_POINTS = 1.0
+# Number of opponents the search may examine per player before falling back.
+SEARCH_BUDGET_PER_PLAYER = 200
+# Number of bye candidates tried before falling back.
+MAX_BYE_CANDIDATES = 8
+# Number of unplayed opponents below each player linked in the weighted pairing.
+MATCHING_WINDOW = 16
+# Costs of the weighted pairing: per squared half-point of score difference,
+# for two players due the same colour, per previous downfloat of a floater.
+SCORE_DIFFERENCE_COST = 100
+COLOUR_COST = 10
+FLOAT_COST = 20
+# Virtual points given to group A in each accelerated round (rounds 1, 2...).
+ACCELERATED_POINTS = (1.0, 1.0)
+
+
+class PlayedPairs:
+    """Index of the pairs of players who already met.
+
+    Maps each player to the set of their previous opponents, so checking a
+    pairing is a dict lookup followed by a set membership test.
+
+    Methods
+    -------
+    add(player1, player2):
+        Record that two players met.
+    add_all(pairs):
+        Record several pairings ([[p1, p2], ...]).
+    opponents(player):
+        Return the set of the previous opponents of a player.
+    have_met(player1, player2):
+        Return True if the two players already met.
+    copy():
+        Return an independent copy of the index.
+    """
+
+    _NO_OPPONENTS = frozenset()
+
+    def __init__(self, pairs=()):
+        """
+        Initialize the index.
+
+        Args:
+            pairs (iterable): Pairings already played, e.g. [[p1, p2], ...].
+        """
+        self._opponents: Dict[Any, Set[Any]] = {}
+        self.add_all(pairs)
+
+    def add(self, player1: Any, player2: Any) -> None:
+        """
+        Record that two players met.
+        """
+        self._opponents.setdefault(player1, set()).add(player2)
+        self._opponents.setdefault(player2, set()).add(player1)
+
+    def add_all(self, pairs: Iterable[List[Any]]) -> None:
+        """
+        Record several pairings.
+        """
+        for player1, player2 in pairs:
+            self.add(player1, player2)
+
+    def opponents(self, player: Any) -> Set[Any]:
+        """
+        Return the set of the previous opponents of a player.
+        """
+        return self._opponents.get(player, self._NO_OPPONENTS)
+
+    def have_met(self, player1: Any, player2: Any) -> bool:
+        """
+        Return True if the two players already met.
+        """
+        return player2 in self._opponents.get(player1, self._NO_OPPONENTS)
+
+    def copy(self) -> "PlayedPairs":
+        """
+        Return an independent copy of the index.
+        """
+        played = PlayedPairs()
+        played._opponents = {player: set(opponents) for player, opponents in self._opponents.items()}
+        return played
+
+
+def _rank_players(
+    players: Dict[str, float],
+    rng: random.Random,
+    score_groups: Optional[Iterable[Tuple[float, List[Any]]]] = None
+) -> List[Any]:
+    """
+    Return the player ids sorted by points, shuffled inside each score group.
+
+    Parameters
+    ----------
+    players : dict
+        Mapping player_id -> points.
+    rng : random.Random
+        Source of randomness for the order inside score groups.
+    score_groups : iterable | None
+        The (score, player ids) groups of players, highest score first and
+        each group in the order of players (Tournament.score_groups()), used
+        instead of grouping players again.
+
+    Returns
+    -------
+    list
+        Player ids, highest points first.
+    """
+    if score_groups is None:
+        groups: Dict[float, List[Any]] = {}
+        for player_id, points in players.items():
+            groups.setdefault(points, []).append(player_id)
+        score_groups = ((score, groups[score]) for score in sorted(groups, reverse=True))
+    ranked: List[Any] = []
+    for _, group in score_groups:
+        group = list(group)
+        rng.shuffle(group)
+        ranked.extend(group)
+    return ranked
+
+
+def _candidate_positions(remaining: List[Any], players: Dict[str, float]) -> Iterable[int]:
+    """
+    Return the positions in remaining of the opponents of remaining[0], in
+    order of preference.
+
+    Parameters
+    ----------
+    remaining : list
+        Unpaired player ids in ranking order.
+    players : dict
+        Mapping player_id -> points.
+
+    Returns
+    -------
+    iterator of int
+        Positions: same score group from the middle down, then up, then the
+        lower score groups.
+    """
+    # remaining is sorted by decreasing points: the group ends at the first
+    # player with fewer points.
+    group_size = bisect_right(remaining, -players[remaining[0]], key=lambda player: -players[player])
+    if group_size < 2:
+        return iter(range(1, len(remaining)))
+    half = group_size // 2
+    return chain(range(half, group_size), range(half - 1, 0, -1), range(group_size, len(remaining)))
+
+
+def _pair_without_rematch(
+    ranked: List[Any],
+    players: Dict[str, float],
+    played: PlayedPairs,
+    budget: List[int]
+) -> Optional[List[Tuple[Any, Any]]]:
+    """
+    Pair every ranked player without rematches, with bounded backtracking.
+
+    Parameters
+    ----------
+    ranked : list
+        Player ids in ranking order (even count).
+    players : dict
+        Mapping player_id -> points.
+    played : PlayedPairs
+        Pairs of players who already met.
+    budget : list of int
+        One-item list holding the number of opponents the search may still
+        examine; decremented in place so it can be shared between calls.
+
+    Returns
+    -------
+    list of tuple | None
+        Pairs (higher ranked, lower ranked) in board order, or None if no
+        pairing was found within the budget.
+    """
+    pairs: List[Tuple[Any, Any]] = []
+    # Each frame holds the unpaired players and the opponents left to try
+    # for the first of them; pairs[k] is the choice made in frame k.
+    frames: List[Tuple[List[Any], Iterable[int]]] = []
+    remaining = ranked
+    while remaining:
+        frames.append((remaining, _candidate_positions(remaining, players)))
+        while True:
+            remaining, positions = frames[-1]
+            player = remaining[0]
+            opponents = played.opponents(player)
+            position = None
+            for candidate in positions:
+                budget[0] -= 1
+                if remaining[candidate] not in opponents:
+                    position = candidate
+                    break
+            if position is not None:
+                break
+            frames.pop()
+            if not frames or budget[0] <= 0:
+                return None
+            pairs.pop()
+        pairs.append((player, remaining[position]))
+        remaining = remaining[1:position] + remaining[position + 1:]
+    return pairs
+
+
+def _pair_greedily(ranked: List[Any], played: PlayedPairs) -> List[Tuple[Any, Any]]:
+    """
+    Pair every ranked player, avoiding rematches when possible.
+
+    Each player in ranking order takes the first unpaired opponent they have
+    not met, or the next unpaired player if they met everybody left.
+
+    Parameters
+    ----------
+    ranked : list
+        Player ids in ranking order (even count).
+    played : PlayedPairs
+        Pairs of players who already met.
+
+    Returns
+    -------
+    list of tuple
+        Pairs (higher ranked, lower ranked) in board order.
+    """
+    remaining = list(ranked)
+    pairs: List[Tuple[Any, Any]] = []
+    while remaining:
+        player = remaining.pop(0)
+        opponents = played.opponents(player)
+        position = next((p for p, opponent in enumerate(remaining) if opponent not in opponents), 0)
+        pairs.append((player, remaining.pop(position)))
+    return pairs
+
+
+def _had_bye(player: Any, byes: Any, history: Optional[Any]) -> bool:
+    """
+    Return True if a player was already exempted.
+
+    Parameters
+    ----------
+    player : player id
+        The player.
+    byes : set
+        Ids of the exempted players, used without a history.
+    history : PlayerHistory | None
+        Colour and bye history of the players.
+    """
+    return history.had_bye(player) if history is not None else player in byes
+
+
+def _allocate_colours(
+    pairs: List[Tuple[Any, Any]],
+    history: Optional[Any]
+) -> List[Tuple[List[Any], List[Any]]]:
+    """
+    Return the matches of pairs (higher ranked, lower ranked).
+
+    Colours follow the wishes recorded in the history; without one the
+    higher ranked player gets white.
+    """
+    if history is not None:
+        pairs = [history.allocate(player1, player2) for player1, player2 in pairs]
+    return [([white, ""], [black, ""]) for white, black in pairs]
+
+
+def pair_swiss_round(
+    players: Dict[str, float],
+    previous_matches: Any,
+    byes: Iterable[Any] = (),
+    rng: Optional[random.Random] = None,
+    history: Optional[Any] = None,
+    score_groups: Optional[Iterable[Tuple[float, List[Any]]]] = None
+) -> Tuple[List[Tuple[List[Any], List[Any]]], Optional[Any]]:
+    """
+    Pair every player of a Swiss round.
+
+    Parameters
+    ----------
+    players : dict
+        Mapping player_id -> points.
+    previous_matches : PlayedPairs | iterable
+        Index of the pairs who already met (Tournament.played_pairs()), or
+        the pairs themselves, e.g. [[p1, p2], ...], indexed on the fly.
+    byes : iterable
+        Ids of the players who already received a bye.
+    rng : random.Random | None
+        Source of randomness for the order inside score groups (defaults to
+        the functions of the random module).
+    history : PlayerHistory | None
+        Colour and bye history of the players (Tournament.player_history);
+        replaces byes and allocates the colours.
+
+    score_groups : iterable | None
+        The score groups of players, highest score first, each in the order
+        of players (Tournament.score_groups()); built from players when
+        None.
+
+    Returns
+    -------
+    matches : list of tuple
+        Matches in the format ([white_id, ""], [black_id, ""]), in ranking
+        order of the boards.
+    bye : player id | None
+        The player exempted this round, or None for an even count.
+    """
+    rng = rng if rng is not None else random
+    played = previous_matches if isinstance(previous_matches, PlayedPairs) else PlayedPairs(previous_matches)
+    byes = set(byes) if history is None else byes
+    ranked = _rank_players(players, rng, score_groups)
+    budget = [SEARCH_BUDGET_PER_PLAYER * len(ranked) + 1000]
+
+    bye = None
+    pairs = None
+    if len(ranked) % 2:
+        candidates = [p for p in reversed(ranked) if not _had_bye(p, byes, history)] or list(reversed(ranked))
+        for candidate in candidates[:MAX_BYE_CANDIDATES]:
+            pairs = _pair_without_rematch([p for p in ranked if p != candidate], players, played, budget)
+            if pairs is not None:
+                bye = candidate
+                break
+            if budget[0] <= 0:
+                break
+        if pairs is None:
+            bye = candidates[0]
+        ranked = [p for p in ranked if p != bye]
+    else:
+        pairs = _pair_without_rematch(ranked, players, played, budget)
+    if pairs is None:
+        pairs = _pair_greedily(ranked, played)
+    return _allocate_colours(pairs, history), bye
+
+
+def _pairing_cost(player1: Any, player2: Any, players: Dict[str, float], history: Optional[Any]) -> int:
+    """
+    Return the cost of pairing two players in the weighted pairing.
+    """
+    difference = round(abs(players[player1] - players[player2]) * 2)
+    cost = SCORE_DIFFERENCE_COST * difference * difference
+    if history is not None:
+        wish1 = history.preference(player1)
+        wish2 = history.preference(player2)
+        if wish1 * wish2 > 0:
+            cost += COLOUR_COST * min(abs(wish1), abs(wish2))
+        if difference:
+            floater = player1 if players[player1] > players[player2] else player2
+            cost += FLOAT_COST * history.floats(floater)
+    return cost
+
+
+def pair_weighted_round(
+    players: Dict[str, float],
+    previous_matches: Any,
+    byes: Iterable[Any] = (),
+    rng: Optional[random.Random] = None,
+    history: Optional[Any] = None,
+    score_groups: Optional[Iterable[Tuple[float, List[Any]]]] = None
+) -> Tuple[List[Tuple[List[Any], List[Any]]], Optional[Any]]:
+    """
+    Pair every player of a Swiss round with a maximum-weight matching.
+
+    Parameters
+    ----------
+    players : dict
+        Mapping player_id -> points.
+    previous_matches : PlayedPairs | iterable
+        Index of the pairs who already met (Tournament.played_pairs()), or
+        the pairs themselves, e.g. [[p1, p2], ...], indexed on the fly.
+    byes : iterable
+        Ids of the players who already received a bye.
+    rng : random.Random | None
+        Source of randomness for the order inside score groups (defaults to
+        the functions of the random module).
+    history : PlayerHistory | None
+        Colour, bye and float history of the players
+        (Tournament.player_history); replaces byes, weighs the colour wishes
+        and downfloats and allocates the colours.
+
+    score_groups : iterable | None
+        The score groups of players, highest score first, each in the order
+        of players (Tournament.score_groups()); built from players when
+        None.
+
+    Returns
+    -------
+    matches : list of tuple
+        Matches in the format ([white_id, ""], [black_id, ""]).
+    bye : player id | None
+        The player exempted this round, or None for an even count.
+    """
+    rng = rng if rng is not None else random
+    played = previous_matches if isinstance(previous_matches, PlayedPairs) else PlayedPairs(previous_matches)
+    byes = set(byes) if history is None else byes
+    ranked = _rank_players(players, rng, score_groups)
+    count = len(ranked)
+
+    weighted_edges: List[Tuple[int, int, int]] = []
+    for position, player in enumerate(ranked):
+        opponents = played.opponents(player)
+        linked = 0
+        for other in range(position + 1, count):
+            if ranked[other] in opponents:
+                continue
+            weighted_edges.append((position, other, _pairing_cost(player, ranked[other], players, history)))
+            linked += 1
+            if linked == MATCHING_WINDOW:
+                break
+    if count % 2:
+        # A dummy vertex, after the players, stands for the bye: it is linked
+        # to the lowest ranked players who have not been exempted yet.
+        candidates = [p for p in range(count - 1, -1, -1) if not _had_bye(ranked[p], byes, history)]
+        lowest = players[ranked[-1]]
+        for rank_from_bottom, position in enumerate((candidates or range(count - 1, -1, -1))[:MATCHING_WINDOW]):
+            difference = round((players[ranked[position]] - lowest) * 2)
+            cost = SCORE_DIFFERENCE_COST * difference * difference + rank_from_bottom
+            weighted_edges.append((position, count, cost))
+
+    highest_cost = max((cost for _i, _j, cost in weighted_edges), default=0)
+    mate = max_weight_matching([(i, j, highest_cost + 1 - cost) for i, j, cost in weighted_edges],
+                               max_cardinality=True)
+    mate.extend([-1] * (count + 1 - len(mate)))
+
+    bye = ranked[mate[count]] if count % 2 and mate[count] >= 0 else None
+    pairs = [(ranked[p], ranked[mate[p]]) for p in range(count) if p < mate[p] < count]
+    unpaired = [ranked[p] for p in range(count) if mate[p] < 0]
+    if count % 2 and bye is None:
+        bye = next((p for p in reversed(unpaired) if not _had_bye(p, byes, history)), unpaired[-1])
+        unpaired.remove(bye)
+    pairs.extend(_pair_greedily(unpaired, played))
+    return _allocate_colours(pairs, history), bye
+
+
+def acceleration_settings(
+    ratings: Dict[Any, float],
+    virtual_points: Iterable[float] = ACCELERATED_POINTS
+) -> Dict[str, List[Any]]:
+    """
+    Return the accelerated pairing settings of a tournament.
+
+    Group A holds the best rated players: 2 * ceil(n / 4) of the n players,
+    an even number so that the group can be paired within itself.
+
+    Parameters
+    ----------
+    ratings : dict
+        Mapping player_id -> ELO at the start of the tournament (players
+        with equal ratings keep their order).
+    virtual_points : iterable
+        Virtual points of group A in each accelerated round, from round 1.
+
+    Returns
+    -------
+    dict
+        {"players": [group A ids], "points": [virtual points per round]},
+        stored as Tournament.pairing["acceleration"].
+    """
+    ranked = sorted(ratings, key=lambda player: ratings[player] or 0, reverse=True)
+    return {"players": ranked[:2 * -(-len(ranked) // 4)], "points": list(virtual_points)}
+
+
+def pairing_points(
+    players: Dict[Any, float],
+    acceleration: Optional[Dict[str, List[Any]]],
+    round_number: int
+) -> Dict[Any, float]:
+    """
+    Return the points a round is paired on.
+
+    Parameters
+    ----------
+    players : dict
+        Mapping player_id -> points scored.
+    acceleration : dict | None
+        Accelerated pairing settings (see acceleration_settings()), or None.
+    round_number : int
+        Number of the round being paired, starting at 1.
+
+    Returns
+    -------
+    dict
+        players itself outside the accelerated rounds, otherwise a new
+        mapping with the virtual points added for the players of group A.
+    """
+    if acceleration is None or not 0 < round_number <= len(acceleration["points"]):
+        return players
+    bonus = acceleration["points"][round_number - 1]
+    group_a = set(acceleration["players"])
+    return {player: points + bonus if player in group_a else points for player, points in players.items()}
+
+
+PAIRING_STRATEGIES = {
+    "backtracking": pair_swiss_round,
+    "matching": pair_weighted_round,
+}
+
+
+def round_rng(seed: int, round_number: int) -> random.Random:
+    """
+    Return the random generator pairing a round of a seeded tournament.
+
+    The generator only depends on the tournament seed and the round number,
+    not on what was drawn for the other rounds: a round paired again from
+    the same state (points, previous pairings, history) gives the same
+    pairings. String seeds are hashed with SHA-512 by random.Random, so the
+    result does not depend on PYTHONHASHSEED.
+
+    Parameters
+    ----------
+    seed : int
+        Pairing seed of the tournament (Tournament.pairing["seed"]).
+    round_number : int
+        Number of the round, starting at 1.
+
+    Returns
+    -------
+    random.Random
+        A generator for pair_swiss_round() / pair_weighted_round().
+    """
+    return random.Random(f"{seed}:{round_number}")
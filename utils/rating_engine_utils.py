@@ -0,0 +1,229 @@
+"""
+Rating engines: the rating systems a tournament can be rated with.
+
+A finished tournament is rated as one rating period by the engine selected
+for it (Tournament.rating_engine). Every engine works on compact per-player
+states (lists, by player id) read from and written back to the ChessPlayer
+instances, so the settlement is the same whatever the system:
+
+    states = {player_id: engine.state(player) for ...}
+    engine.rate_period(rounds_matches, states)
+    engine.apply(player, states[player_id]) for each player
+
+This module exposes:
+- RatingEngine: the interface of an engine.
+- EloEngine: the classic ELO of ChessPlayer.modify_elo / calculate_elo
+  (settle_elo), state [elo, coef_k, games_played].
+- Glicko2Engine: Glicko-2, state [rating, deviation, volatility,
+  games_played]; ChessPlayer.glicko stores [rating, deviation, volatility].
+- RATING_ENGINES: the engines by name; DEFAULT_RATING_ENGINE.
+- get_rating_engine(name): the engine of a tournament.
+
+Glicko-2
+--------
+Glickman's algorithm (http://www.glicko.net/glicko/glicko2.pdf): every game
+of the period is rated from the ratings before the period, the rating
+deviation (RD) measures the uncertainty of the rating and the volatility its
+expected fluctuation. A player without Glicko-2 state starts from their ELO
+with the deviation and volatility of a new player; a player registered in
+the tournament who played no game only sees their deviation grow.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Tuple
+import math
+from model.player_model import coefficient_k
+from utils.tournament_utils import settle_elo
+
+# Glicko-2 scale factor between the Glicko and the Glicko-2 scales.
+GLICKO2_SCALE = 173.7178
+# Deviation and volatility of a player without Glicko-2 state.
+GLICKO2_INITIAL_DEVIATION = 350.0
+GLICKO2_INITIAL_VOLATILITY = 0.06
+# System constant constraining the volatility changes (0.3 to 1.2).
+GLICKO2_TAU = 0.5
+# Convergence tolerance of the volatility iteration.
+GLICKO2_EPSILON = 0.000001
+
+
+class RatingEngine(ABC):
+    """Rating system applied to the games of a finished tournament.
+
+    Methods
+    -------
+    state(player):
+        Return the state of a player, as a list.
+    rate_period(rounds_matches, states):
+        Rate every game of a rating period, updating the states in place.
+    apply(player, state):
+        Write a state back to the player.
+    rating(player):
+        Return the rating shown for the player in this system.
+    """
+
+    name = ""
+    label = ""
+
+    @abstractmethod
+    def state(self, player: Any) -> List[Any]:
+        """Return the state of a player, as a list."""
+
+    @abstractmethod
+    def rate_period(
+        self,
+        rounds_matches: Iterable[Iterable[Tuple[List[Any], List[Any]]]],
+        states: Dict[str, List[Any]]
+    ) -> Dict[str, List[Any]]:
+        """
+        Rate every game of a rating period.
+
+        Parameters
+        ----------
+        rounds_matches : iterable
+            For each round, its matches ([white_id, white_score], [black_id, black_score]).
+        states : dict
+            Mapping player_id -> state, updated in place. Games with an
+            unknown player or without a result are ignored.
+
+        Returns
+        -------
+        dict
+            The updated states mapping.
+        """
+
+    @abstractmethod
+    def apply(self, player: Any, state: List[Any]) -> None:
+        """Write a state back to the player."""
+
+    @abstractmethod
+    def rating(self, player: Any) -> Any:
+        """Return the rating shown for the player in this system."""
+
+
+class EloEngine(RatingEngine):
+    """Classic ELO, rated round by round with the K coefficient rules."""
+
+    name = "elo"
+    label = "Elo"
+
+    def state(self, player):
+        return [player.elo, player.coef_k, player.games_played]
+
+    def rate_period(self, rounds_matches, states):
+        return settle_elo(rounds_matches, states)
+
+    def apply(self, player, state):
+        player.modify_games_played(state[2])
+        player.modify_elo(state[0])
+
+    def rating(self, player):
+        return player.elo
+
+
+def _glicko2_volatility(phi: float, sigma: float, delta: float, variance: float) -> float:
+    """
+    Return the new volatility of a player (Illinois iteration of step 5).
+    """
+    a = math.log(sigma * sigma)
+
+    def f(x):
+        exponential = math.exp(x)
+        total = phi * phi + variance + exponential
+        return (exponential * (delta * delta - phi * phi - variance - exponential) / (2 * total * total)
+                - (x - a) / (GLICKO2_TAU * GLICKO2_TAU))
+
+    lower = a
+    if delta * delta > phi * phi + variance:
+        upper = math.log(delta * delta - phi * phi - variance)
+    else:
+        k = 1
+        while f(a - k * GLICKO2_TAU) < 0:
+            k += 1
+        upper = a - k * GLICKO2_TAU
+    f_lower, f_upper = f(lower), f(upper)
+    while abs(upper - lower) > GLICKO2_EPSILON:
+        middle = lower + (lower - upper) * f_lower / (f_upper - f_lower)
+        f_middle = f(middle)
+        if f_middle * f_upper <= 0:
+            lower, f_lower = upper, f_upper
+        else:
+            f_lower /= 2
+        upper, f_upper = middle, f_middle
+    return math.exp(lower / 2)
+
+
+class Glicko2Engine(RatingEngine):
+    """Glicko-2, rated over the whole tournament as one rating period."""
+
+    name = "glicko2"
+    label = "Glicko-2"
+
+    def state(self, player):
+        glicko = player.glicko or [player.elo, GLICKO2_INITIAL_DEVIATION, GLICKO2_INITIAL_VOLATILITY]
+        return [float(glicko[0]), float(glicko[1]), float(glicko[2]), player.games_played]
+
+    def rate_period(self, rounds_matches, states):
+        # One pass over the games: sums of g^2 E (1 - E) and g (s - E) per
+        # player, all computed from the ratings before the period.
+        scaled = {player_id: ((state[0] - 1500) / GLICKO2_SCALE, state[1] / GLICKO2_SCALE)
+                  for player_id, state in states.items()}
+        weights = {player_id: 1 / math.sqrt(1 + 3 * phi * phi / (math.pi * math.pi))
+                   for player_id, (_, phi) in scaled.items()}
+        information: Dict[str, float] = {}
+        improvements: Dict[str, float] = {}
+        for matches in rounds_matches:
+            for (player1_id, result1), (player2_id, result2) in matches:
+                if player1_id not in states or player2_id not in states or result1 == "" or result2 == "":
+                    continue
+                for player_id, opponent_id, score in ((player1_id, player2_id, result1),
+                                                      (player2_id, player1_id, result2)):
+                    weight = weights[opponent_id]
+                    expected = 1 / (1 + math.exp(-weight * (scaled[player_id][0] - scaled[opponent_id][0])))
+                    information[player_id] = (information.get(player_id, 0.0)
+                                              + weight * weight * expected * (1 - expected))
+                    improvements[player_id] = improvements.get(player_id, 0.0) + weight * (score - expected)
+                    states[player_id][3] += 1
+
+        for player_id, state in states.items():
+            mu, phi = scaled[player_id]
+            if player_id not in information:
+                state[1] = min(math.sqrt(phi * phi + state[2] * state[2]) * GLICKO2_SCALE, GLICKO2_INITIAL_DEVIATION)
+                continue
+            variance = 1 / information[player_id]
+            sigma = _glicko2_volatility(phi, state[2], variance * improvements[player_id], variance)
+            phi_star = math.sqrt(phi * phi + sigma * sigma)
+            new_phi = 1 / math.sqrt(1 / (phi_star * phi_star) + 1 / variance)
+            state[0] = 1500 + GLICKO2_SCALE * (mu + new_phi * new_phi * improvements[player_id])
+            state[1] = GLICKO2_SCALE * new_phi
+            state[2] = sigma
+        return states
+
+    def apply(self, player, state):
+        player.glicko = [round(state[0], 2), round(state[1], 2), round(state[2], 6)]
+        player.modify_games_played(state[3])
+        player.coef_k = coefficient_k(player.games_played, player.elo)
+
+    def rating(self, player):
+        return round(player.glicko[0]) if player.glicko else player.elo
+
+
+RATING_ENGINES = {engine.name: engine for engine in (EloEngine(), Glicko2Engine())}
+DEFAULT_RATING_ENGINE = "elo"
+
+
+def get_rating_engine(name: Any = None) -> RatingEngine:
+    """
+    Return the rating engine of a tournament.
+
+    Parameters
+    ----------
+    name : str | None
+        Key of RATING_ENGINES; None (tournaments created before the engines)
+        or an unknown name selects DEFAULT_RATING_ENGINE.
+
+    Returns
+    -------
+    RatingEngine
+        The engine.
+    """
+    return RATING_ENGINES.get(name or DEFAULT_RATING_ENGINE, RATING_ENGINES[DEFAULT_RATING_ENGINE])
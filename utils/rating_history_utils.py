@@ -0,0 +1,269 @@
+"""
+Recomputation of the ratings from the archive of finished tournaments.
+
+A corrected result in an old tournament changes every later rating. The
+ratings are rebuilt by replaying the finished tournaments in chronological
+order with settle_elo (the rules of ChessPlayer.modify_elo and
+calculate_elo), from the ratings the players had before the archive (the
+base). Checkpoints of every player's rating are kept every CHECKPOINT_EVERY
+tournaments, so a correction is only replayed from the last checkpoint
+before the corrected tournament.
+
+This module exposes:
+- archive_order(tournaments): the finished tournaments in chronological order.
+- archive_entry(tournament): (tournament_id, results digest, rounds matches)
+  of a finished tournament.
+- unsettle_elo(rounds_matches, ratings): the ratings before a settled
+  tournament (inverse of settle_elo, up to rounding).
+- bootstrap_base(archive, ratings): the ratings before the archive, found
+  once from the current ratings.
+- replay_archive(base, archive, stored_archive, checkpoints, every): ratings
+  after the archive, replayed from the nearest valid checkpoint.
+
+Data formats
+------------
+- Rating states are lists [elo, coef_k, games_played] by player id, as in
+  settle_elo.
+- A checkpoint is {"position": n, "ratings": {player_id: state}}: the states
+  after the first n tournaments of the archive.
+- The archive is described by [tournament_id, digest] pairs: a checkpoint
+  at position n is valid while the first n pairs are unchanged (same
+  tournaments, same order, same results).
+"""
+
+from typing import Any, Dict, Iterable, List, Tuple
+import hashlib
+import json
+from model.player_model import coefficient_k
+from utils.tournament_utils import calculate_elo, settle_elo
+
+# Tournaments replayed between two checkpoints.
+CHECKPOINT_EVERY = 10
+# Passes solving the ratings before a round (the two players of a game
+# depend on each other); they agree after one or two passes.
+UNSETTLE_PASSES = 4
+# Forward replays correcting the base found by unsettle_elo.
+BOOTSTRAP_PASSES = 8
+
+
+def _rounds_in_order(tournament: Any) -> List[Any]:
+    """
+    Return the rounds of a tournament sorted by their start timestamp.
+    """
+    return sorted(tournament.rounds, key=lambda round: (round.start_date or "", round.start_time or ""))
+
+
+def archive_order(tournaments: Iterable[Any]) -> List[Any]:
+    """
+    Return the finished tournaments in chronological order.
+
+    Tournaments are sorted by start date, then by the timestamp of their
+    first round (tournaments starting the same day).
+
+    Parameters
+    ----------
+    tournaments : iterable
+        Tournament instances.
+
+    Returns
+    -------
+    list
+        The tournaments whose status is "Terminé", oldest first.
+    """
+    def key(tournament):
+        rounds = _rounds_in_order(tournament)
+        first = (rounds[0].start_date or "", rounds[0].start_time or "") if rounds else ("", "")
+        return (tournament.start_date or "",) + first
+
+    return sorted((t for t in tournaments if t.status == "Terminé"), key=key)
+
+
+def archive_entry(tournament: Any) -> Tuple[str, str, List[Any]]:
+    """
+    Return the description of a finished tournament used by the replay.
+
+    Parameters
+    ----------
+    tournament : Tournament
+        A finished tournament.
+
+    Returns
+    -------
+    tuple
+        (tournament_id, digest, rounds_matches): the digest is a SHA-1 of
+        the matches and results, which changes when a result is corrected;
+        rounds_matches lists the matches of each round in timestamp order.
+    """
+    rounds_matches = [round.matches for round in _rounds_in_order(tournament)]
+    encoded = json.dumps(rounds_matches, separators=(",", ":"), ensure_ascii=False)
+    return tournament.tournament_id, hashlib.sha1(encoded.encode("utf-8")).hexdigest(), rounds_matches
+
+
+def _elo_before_game(elo_after: int, games_before: int, opponent_elo: float, score: float) -> int:
+    """
+    Return the rating a player had before a game.
+
+    calculate_elo is increasing in the rating, but the rounding can map
+    two neighbouring ratings to the same result: the candidate closest to
+    elo_after is returned among those leading to elo_after (or closest to
+    it when none does, e.g. data edited by hand). bootstrap_base() corrects
+    the wrong guesses.
+    """
+    best_key, best = None, elo_after
+    center = round(elo_after)
+    for candidate in range(center - 41, center + 42):
+        k_factor = coefficient_k(games_before, candidate)
+        error = abs(calculate_elo(candidate, opponent_elo, k_factor, score) - elo_after)
+        key = (error, abs(candidate - elo_after))
+        if best_key is None or key < best_key:
+            best_key, best = key, candidate
+    return best
+
+
+def unsettle_elo(
+    rounds_matches: Iterable[Iterable[Tuple[List[Any], List[Any]]]],
+    ratings: Dict[str, List[Any]]
+) -> Dict[str, List[Any]]:
+    """
+    Undo settle_elo: return the ratings before a settled tournament.
+
+    Rounds are undone from the last one. The K coefficient of each game is
+    the one the settlement used, coefficient_k(games before, rating before).
+    As the rounding loses information, a rating may be one point off.
+
+    Parameters
+    ----------
+    rounds_matches : iterable
+        For each round, its matches, in playing order.
+    ratings : dict
+        Mapping player_id -> [elo, coef_k, games_played] after the
+        tournament, updated in place to the states before it.
+
+    Returns
+    -------
+    dict
+        The updated ratings mapping.
+    """
+    for matches in reversed(list(rounds_matches)):
+        games = []
+        for (player1_id, result1), (player2_id, result2) in matches:
+            if player1_id in ratings and player2_id in ratings and result1 != "" and result2 != "":
+                games.append((player1_id, result1, player2_id, result2))
+                ratings[player1_id][2] -= 1
+                ratings[player2_id][2] -= 1
+        after = {player_id: ratings[player_id][0] for game in games for player_id in (game[0], game[2])}
+        before = dict(after)
+        for _ in range(UNSETTLE_PASSES):
+            solved = {}
+            for player1_id, result1, player2_id, result2 in games:
+                solved[player1_id] = _elo_before_game(
+                    after[player1_id], ratings[player1_id][2], before[player2_id], result1)
+                solved[player2_id] = _elo_before_game(
+                    after[player2_id], ratings[player2_id][2], before[player1_id], result2)
+            if solved == before:
+                break
+            before = solved
+        for player_id, elo in before.items():
+            state = ratings[player_id]
+            state[0] = elo
+            state[1] = coefficient_k(state[2], elo)
+    return ratings
+
+
+def bootstrap_base(
+    archive: List[Tuple[str, str, List[Any]]],
+    ratings: Dict[str, List[Any]]
+) -> Tuple[Dict[str, List[Any]], List[str]]:
+    """
+    Return the ratings before the archive, found from the current ratings.
+
+    The tournaments are undone from the most recent one with unsettle_elo;
+    the base is then replayed forward and the players whose replayed rating
+    differs from their current rating get their base corrected by the
+    difference, for at most BOOTSTRAP_PASSES replays.
+
+    Parameters
+    ----------
+    archive : list
+        archive_entry() of the finished tournaments, in archive_order().
+    ratings : dict
+        Mapping player_id -> current [elo, coef_k, games_played]; not
+        modified.
+
+    Returns
+    -------
+    tuple (base, mismatches)
+        The base states, and the ids of the players whose replay still
+        differs from their current rating (ratings edited by hand).
+    """
+    base = {player_id: list(state) for player_id, state in ratings.items()}
+    for entry in reversed(archive):
+        unsettle_elo(entry[2], base)
+    mismatches = []
+    for _ in range(BOOTSTRAP_PASSES):
+        replayed = {player_id: list(state) for player_id, state in base.items()}
+        for entry in archive:
+            settle_elo(entry[2], replayed)
+        mismatches = [player_id for player_id, state in ratings.items() if replayed[player_id][0] != state[0]]
+        if not mismatches:
+            break
+        for player_id in mismatches:
+            state = base[player_id]
+            state[0] += ratings[player_id][0] - replayed[player_id][0]
+            state[1] = coefficient_k(state[2], state[0])
+    return base, mismatches
+
+
+def replay_archive(
+    base: Dict[str, List[Any]],
+    archive: List[Tuple[str, str, List[Any]]],
+    stored_archive: List[List[str]],
+    checkpoints: List[Dict[str, Any]],
+    every: int = CHECKPOINT_EVERY
+) -> Tuple[Dict[str, List[Any]], List[Dict[str, Any]], int]:
+    """
+    Recompute the ratings after the archive from the nearest valid checkpoint.
+
+    The replay starts at the last checkpoint placed before the first
+    tournament that differs from the stored archive (corrected results,
+    tournament inserted or removed), or from the base without one.
+
+    Parameters
+    ----------
+    base : dict
+        Mapping player_id -> state before the archive.
+    archive : list
+        archive_entry() of the finished tournaments, in archive_order().
+    stored_archive : list
+        [tournament_id, digest] pairs of the archive at the previous
+        replay.
+    checkpoints : list of dict
+        Checkpoints of the previous replay, by increasing position.
+    every : int
+        Tournaments between two checkpoints.
+
+    Returns
+    -------
+    tuple (ratings, checkpoints, start)
+        The states after the archive, the valid and new checkpoints, and the
+        position the replay started from (number of tournaments skipped).
+    """
+    changed = len(stored_archive)
+    for position, (entry, stored) in enumerate(zip(archive, stored_archive)):
+        if [entry[0], entry[1]] != list(stored):
+            changed = position
+            break
+    checkpoints = [checkpoint for checkpoint in checkpoints if checkpoint["position"] <= min(changed, len(archive))]
+    ratings = {player_id: list(state) for player_id, state in base.items()}
+    start = 0
+    if checkpoints:
+        start = checkpoints[-1]["position"]
+        ratings.update((player_id, list(state)) for player_id, state in checkpoints[-1]["ratings"].items())
+    for position in range(start, len(archive)):
+        settle_elo(archive[position][2], ratings)
+        if (position + 1) % every == 0:
+            checkpoints.append({
+                "position": position + 1,
+                "ratings": {player_id: list(state) for player_id, state in ratings.items()},
+            })
+    return ratings, checkpoints, start
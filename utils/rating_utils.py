@@ -0,0 +1,156 @@
+"""
+Batch ELO ratings.
+
+calculate_elo (utils.tournament_utils) rates one game of one player. This
+module rates many games at once, given as parallel arrays with one entry per
+player-game (a game gives two entries, one per player):
+
+- players: index of the rated player in the ratings array;
+- opponents: index of the opponent;
+- scores: result of the player (1.0, 0.5, 0.0);
+- k_factors: K coefficient of the player.
+
+This module exposes:
+- rate_games(ratings, players, opponents, scores, k_factors, use_numpy):
+  new ratings after a set of games.
+- HAS_NUMPY: True when NumPy is installed.
+
+Rating period
+-------------
+Every game is rated from the ratings before the set of games, and the
+changes of a player are summed before rounding:
+
+    R' = round(R + sum(K * (w - expected)))
+
+For one game per player (a round) this is exactly calculate_elo; for a
+whole tournament it is a rating period, as used by rating lists.
+
+NumPy
+-----
+NumPy is optional. When it is installed the expected scores and changes of
+all games are computed in one vectorised pass; otherwise a pure-Python loop
+computes the same values. Both paths add the changes in the same order and
+round half to even (round() and numpy.rint), and a player whose unrounded
+rating falls within ROUNDING_TOLERANCE of a half point is recomputed with the
+pure-Python formula, so both paths always return the same integers.
+"""
+
+from typing import Any, List, Optional, Sequence
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional: the pure-Python path is used.
+    numpy = None
+
+HAS_NUMPY = numpy is not None
+# Distance to a half point below which a rating is rounded by the pure-Python
+# formula (guards against last-bit differences of the vectorised power).
+ROUNDING_TOLERANCE = 1e-9
+
+
+def _rate_games_python(
+    ratings: Sequence[float],
+    players: Sequence[int],
+    opponents: Sequence[int],
+    scores: Sequence[float],
+    k_factors: Sequence[float],
+    only: Optional[set] = None
+) -> dict:
+    """
+    Return the new ratings of the rated players (pure Python).
+
+    Parameters
+    ----------
+    ratings, players, opponents, scores, k_factors :
+        See rate_games().
+    only : set | None
+        Restrict the computation to these player indexes.
+
+    Returns
+    -------
+    dict
+        Mapping player index -> new rating (int).
+    """
+    totals = {}
+    for player, opponent, score, k_factor in zip(players, opponents, scores, k_factors):
+        if only is not None and player not in only:
+            continue
+        expected = 1 / (1 + 10 ** ((ratings[opponent] - ratings[player]) / 400))
+        totals[player] = totals.get(player, 0.0) + k_factor * (score - expected)
+    return {player: round(ratings[player] + total) for player, total in totals.items()}
+
+
+def _rate_games_numpy(
+    ratings: Sequence[float],
+    players: Sequence[int],
+    opponents: Sequence[int],
+    scores: Sequence[float],
+    k_factors: Sequence[float]
+) -> List[Any]:
+    """
+    Return the new ratings of every player (vectorised with NumPy).
+    """
+    current = numpy.asarray(ratings, dtype=numpy.float64)
+    players = numpy.asarray(players, dtype=numpy.intp)
+    opponents = numpy.asarray(opponents, dtype=numpy.intp)
+    scores = numpy.asarray(scores, dtype=numpy.float64)
+    k_factors = numpy.asarray(k_factors, dtype=numpy.float64)
+    expected = 1 / (1 + numpy.power(10.0, (current[opponents] - current[players]) / 400))
+    changes = k_factors * (scores - expected)
+    totals = numpy.bincount(players, weights=changes, minlength=len(current))
+    rated = numpy.bincount(players, minlength=len(current)) > 0
+    unrounded = current + totals
+    rounded = numpy.rint(unrounded)
+    new_ratings = list(ratings)
+    for player, rating in zip(numpy.flatnonzero(rated).tolist(), rounded[rated].astype(numpy.int64).tolist()):
+        new_ratings[player] = rating
+    close = rated & (numpy.abs(numpy.abs(unrounded - numpy.floor(unrounded)) - 0.5) < ROUNDING_TOLERANCE)
+    if close.any():
+        only = set(numpy.flatnonzero(close).tolist())
+        for player, rating in _rate_games_python(
+                current.tolist(), players.tolist(), opponents.tolist(), scores.tolist(), k_factors.tolist(),
+                only).items():
+            new_ratings[player] = rating
+    return new_ratings
+
+
+def rate_games(
+    ratings: Sequence[float],
+    players: Sequence[int],
+    opponents: Sequence[int],
+    scores: Sequence[float],
+    k_factors: Sequence[float],
+    use_numpy: Optional[bool] = None
+) -> List[Any]:
+    """
+    Rate a set of games in one pass (rating period).
+
+    Parameters
+    ----------
+    ratings : sequence
+        Ratings before the games, indexed by player.
+    players : sequence of int
+        For each player-game, index of the rated player.
+    opponents : sequence of int
+        For each player-game, index of the opponent.
+    scores : sequence of float
+        For each player-game, result of the rated player.
+    k_factors : sequence
+        For each player-game, K coefficient of the rated player.
+    use_numpy : bool | None
+        Use the vectorised computation (True, when NumPy is installed) or
+        the pure-Python one (False); by default NumPy is used when
+        installed.
+
+    Returns
+    -------
+    list
+        New ratings, indexed like ratings: rounded to integers for the
+        players with at least one game, unchanged for the others.
+    """
+    if use_numpy is not False and HAS_NUMPY and len(players):
+        return _rate_games_numpy(ratings, players, opponents, scores, k_factors)
+    new_ratings = list(ratings)
+    for player, rating in _rate_games_python(ratings, players, opponents, scores, k_factors).items():
+        new_ratings[player] = rating
+    return new_ratings
@@ -0,0 +1,98 @@
+"""
+Berger tables for round-robin tournaments.
+
+The whole schedule of a round robin is computed once, when the tournament
+starts, and stored with the tournament; each round is then read from it.
+
+This module exposes:
+- berger_schedule(player_ids, rng=None): build the schedule of a set of players.
+- schedule_round(schedule, round_index): matches and bye of one round.
+
+Schedule format
+---------------
+A JSON-serializable dict:
+
+- "order": the player ids in seeding order (drawn at random);
+- "rounds": one string per round, "w-b w-b ...", where w and b are the
+  positions in "order" of the white and black players of each board. The
+  position len(order) is the dummy player added for an odd count: its
+  opponent is exempted from the round.
+
+Tables are built with the Berger rotation: the last seed stays in place and
+alternates colours, the others move by half a circle each round, which
+makes every player alternate colours (never more than two identical colours
+in a row, and at most one more white than black or the reverse).
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+import random
+
+
+def berger_schedule(player_ids: List[Any], rng: Optional[random.Random] = None) -> Dict[str, Any]:
+    """
+    Build the complete round-robin schedule of a set of players.
+
+    Parameters
+    ----------
+    player_ids : list
+        Ids of the players.
+    rng : random.Random | None
+        Source of randomness for the seeding order (defaults to the
+        functions of the random module).
+
+    Returns
+    -------
+    dict
+        The schedule ({"order": [...], "rounds": ["w-b ...", ...]}): n - 1
+        rounds for an even number n of players, n rounds for an odd one.
+    """
+    rng = rng if rng is not None else random
+    order = list(player_ids)
+    rng.shuffle(order)
+    size = len(order) + len(order) % 2
+    half = size // 2
+    fixed = size - 1
+    ring = list(range(size - 1))
+    rounds: List[str] = []
+    for round_index in range(size - 1):
+        boards = [(ring[0], fixed) if round_index % 2 == 0 else (fixed, ring[0])]
+        boards.extend((ring[i], ring[size - 1 - i]) for i in range(1, half))
+        rounds.append(" ".join(f"{white}-{black}" for white, black in boards))
+        ring = ring[half:] + ring[:half]
+    return {"order": order, "rounds": rounds}
+
+
+def schedule_round(
+    schedule: Dict[str, Any],
+    round_index: int
+) -> Tuple[List[Tuple[List[Any], List[Any]]], Optional[Any]]:
+    """
+    Return the matches of one round of a schedule.
+
+    Parameters
+    ----------
+    schedule : dict
+        Schedule built by berger_schedule().
+    round_index : int
+        Position of the round (0 for the first round).
+
+    Returns
+    -------
+    matches : list of tuple
+        Matches in the format ([white_id, ""], [black_id, ""]).
+    bye : player id | None
+        The player facing the dummy this round (odd number of players).
+    """
+    order = schedule["order"]
+    dummy = len(order)
+    matches: List[Tuple[List[Any], List[Any]]] = []
+    bye = None
+    for board in schedule["rounds"][round_index].split():
+        white, black = (int(position) for position in board.split("-"))
+        if white == dummy:
+            bye = order[black]
+        elif black == dummy:
+            bye = order[white]
+        else:
+            matches.append(([order[white], ""], [order[black], ""]))
+    return matches, bye
@@ -0,0 +1,229 @@
+"""
+Live index of the standings of a tournament by points.
+
+Pairing, the console and the reports all need the players by decreasing
+points: the score groups of a Swiss round, the standings, the podium, the
+rank of a player. ScoreIndex keeps the players in score buckets and the
+distinct scores sorted, and moves a player between two buckets when they
+score, so the order never has to be sorted again.
+
+This module exposes:
+- ScoreIndex: score buckets, sorted scores and a count of the players by
+  score, updated player by player.
+
+Complexity
+----------
+A tournament of R rounds has at most 2R + 1 distinct scores (S), whatever
+its number of players n. Inside a bucket the players are kept by
+registration position (the order of Tournament.players), which is the order
+in which the pairing draws a score group.
+
+- add_points(player, points): O(log S + log n) to find the buckets, plus the
+  shift of the two bucket lists.
+- rank(player): O(log n). The players are counted by score in a Fenwick
+  (binary indexed) tree indexed by half points, the unit of every result
+  (1, ½, 0 and BYE_POINTS); once a score that is not a multiple of ½ is
+  indexed, the rank falls back to summing the buckets above, O(S).
+- top(k): O(k + groups read).
+- score_groups(): O(n) for the whole iteration, groups already ordered;
+  stopping after the first groups (the leaders) only costs those groups.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+def _tree_key(score: float) -> Optional[int]:
+    """
+    Return the index of a score in the Fenwick tree (half points + 1), or
+    None when the score is not a non-negative whole number of half points.
+    """
+    half_points = score * 2
+    if half_points < 0 or half_points != int(half_points):
+        return None
+    return int(half_points) + 1
+
+
+class ScoreIndex:
+    """Players of a tournament bucketed by points, in standings order.
+
+    Methods
+    -------
+    add_player(player, points=0.0):
+        Index a player after the players already registered.
+    add_points(player, points):
+        Add points to a player and move them to their new bucket.
+    rank(player):
+        Return the rank of a player by points (shared by equal scores).
+    top(k):
+        Return the k best players by points.
+    score_groups():
+        Iterate over (score, players) from the highest score.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty index; players are added with add_player().
+        """
+        self._players: List[Any] = []
+        self._positions: Dict[Any, int] = {}
+        self._points: Dict[Any, float] = {}
+        # Score -> registration positions of its players, sorted.
+        self._buckets: Dict[float, List[int]] = {}
+        # Distinct scores, ascending.
+        self._scores: List[float] = []
+        # Fenwick tree of the number of players by half points (1-based).
+        self._tree: List[int] = [0]
+        # False once a score is not a whole number of half points.
+        self._counted = True
+
+    def _count(self, score: float, delta: int) -> None:
+        """
+        Add delta players to the count of a score in the Fenwick tree.
+        """
+        key = _tree_key(score)
+        if key is None:
+            self._counted = False
+            return
+        if key >= len(self._tree):
+            # The rebuilt tree already counts the buckets as they are now.
+            self._grow(key)
+            return
+        tree = self._tree
+        while key < len(tree):
+            tree[key] += delta
+            key += key & -key
+
+    def _grow(self, key: int) -> None:
+        """
+        Rebuild the Fenwick tree large enough to hold key.
+        """
+        size = len(self._tree)
+        while size <= key:
+            size *= 2
+        self._tree = [0] * size
+        for score, bucket in self._buckets.items():
+            if _tree_key(score) is not None:
+                self._count(score, len(bucket))
+
+    def _insert(self, position: int, score: float) -> None:
+        """
+        Put a registration position in the bucket of a score.
+        """
+        bucket = self._buckets.get(score)
+        if bucket is None:
+            bucket = self._buckets[score] = []
+            insort(self._scores, score)
+        insort(bucket, position)
+        self._count(score, 1)
+
+    def _remove(self, position: int, score: float) -> None:
+        """
+        Take a registration position out of the bucket of a score.
+        """
+        bucket = self._buckets[score]
+        del bucket[bisect_left(bucket, position)]
+        self._count(score, -1)
+        if not bucket:
+            del self._buckets[score]
+            del self._scores[bisect_left(self._scores, score)]
+
+    def add_player(self, player: Any, points: float = 0.0) -> None:
+        """
+        Index a player after the players already registered.
+
+        Parameters
+        ----------
+        player : player id
+            The player; ignored if already indexed.
+        points : float
+            Points of the player.
+        """
+        if player in self._positions:
+            return
+        self._positions[player] = len(self._players)
+        self._players.append(player)
+        self._points[player] = points
+        self._insert(self._positions[player], points)
+
+    def add_points(self, player: Any, points: float) -> None:
+        """
+        Add points to a player and move them to their new bucket.
+
+        Parameters
+        ----------
+        player : player id
+            The player (indexed with 0 points first if unknown).
+        points : float
+            Points scored.
+        """
+        if player not in self._positions:
+            self.add_player(player)
+        if not points:
+            return
+        position = self._positions[player]
+        self._remove(position, self._points[player])
+        self._points[player] += points
+        self._insert(position, self._points[player])
+
+    def score_groups(self) -> Iterator[Tuple[float, List[Any]]]:
+        """
+        Iterate over the score groups, from the highest score.
+
+        Yields
+        ------
+        tuple (score, players)
+            The score and a new list of its players, in registration order.
+        """
+        players = self._players
+        for score in reversed(self._scores):
+            yield score, [players[position] for position in self._buckets[score]]
+
+    def rank(self, player: Any) -> int:
+        """
+        Return the rank of a player by points.
+
+        Players on the same score share the rank of the best of them: 1 +
+        the number of players with more points.
+
+        Parameters
+        ----------
+        player : player id
+            An indexed player.
+
+        Returns
+        -------
+        int
+            The rank, starting at 1.
+        """
+        score = self._points[player]
+        if not self._counted:
+            higher = self._scores[bisect_right(self._scores, score):]
+            return 1 + sum(len(self._buckets[other]) for other in higher)
+        key = _tree_key(score)
+        at_most = 0
+        while key > 0:
+            at_most += self._tree[key]
+            key -= key & -key
+        return 1 + len(self._players) - at_most
+
+    def top(self, k: int) -> List[Any]:
+        """
+        Return the k best players by points, registration order on equal points.
+
+        Parameters
+        ----------
+        k : int
+            Number of players.
+
+        Returns
+        -------
+        list
+            Player ids, best first (fewer when the index holds fewer players).
+        """
+        leaders: List[Any] = []
+        for _, group in self.score_groups():
+            if len(leaders) >= k:
+                break
+            leaders.extend(group[:k - len(leaders)])
+        return leaders
@@ -0,0 +1,250 @@
+"""
+Tie-breaks of the standings of a tournament.
+
+Tournament.players only holds the points, so players on the same score
+cannot be ordered. TieBreaks keeps, for every player, the aggregates of the
+usual tie-breaks and updates them once per round: when a player scores, the
+sums of their opponents are increased by the points scored, instead of
+walking every round again.
+
+This module exposes:
+- TieBreaks: per-player points, opponents and tie-break aggregates, updated
+  round by round, and the sorted standings, read from the live score index
+  (utils.standings_utils.ScoreIndex) so that only the players of a same
+  score are sorted.
+- TIE_BREAKS: the tie-breaks by name, with their label.
+- DEFAULT_TIE_BREAK_ORDER: the order used when none is configured.
+- parse_tie_break_order(text): read an order such as "buchholz,median".
+
+Tie-breaks
+----------
+- buchholz: sum of the points of the opponents.
+- median: Buchholz without the best and the worst opponent (median
+  Buchholz), once a player met at least three opponents.
+- sonneborn_berger: sum of the points of the beaten opponents plus half the
+  points of the opponents drawn.
+- progressive: sum of the player's points after each round (cumulative
+  score), which favours early wins.
+
+A bye scores BYE_POINTS but adds no opponent; a game without a result is
+ignored.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from utils.pairing_utils import BYE_POINTS
+from utils.standings_utils import ScoreIndex
+
+TIE_BREAKS = {
+    "buchholz": "Buchholz",
+    "median": "Buchholz médian",
+    "sonneborn_berger": "Sonneborn-Berger",
+    "progressive": "Progressif",
+}
+DEFAULT_TIE_BREAK_ORDER = ("buchholz", "median", "sonneborn_berger", "progressive")
+
+
+def parse_tie_break_order(text: Optional[str]) -> Tuple[str, ...]:
+    """
+    Return the tie-break order described by a comma-separated list.
+
+    Parameters
+    ----------
+    text : str | None
+        Names of TIE_BREAKS separated by commas (e.g. "sonneborn_berger,
+        buchholz"); unknown names are ignored.
+
+    Returns
+    -------
+    tuple of str
+        The tie-breaks in order, or DEFAULT_TIE_BREAK_ORDER when text is
+        empty or names no known tie-break.
+    """
+    names = [name.strip().lower() for name in (text or "").split(",")]
+    order = tuple(dict.fromkeys(name for name in names if name in TIE_BREAKS))
+    return order or DEFAULT_TIE_BREAK_ORDER
+
+
+class TieBreaks:
+    """Incremental tie-break aggregates of the players of a tournament.
+
+    Attributes
+    ----------
+    rounds_recorded : int
+        Number of rounds applied with record_round().
+    scores : ScoreIndex
+        The players by points, moved between score buckets as they score.
+
+    Methods
+    -------
+    record_round(matches, bye=None):
+        Apply the results of a finished round.
+    points(player):
+        Return the points of a player.
+    buchholz(player), median(player), sonneborn_berger(player), progressive(player):
+        Return a tie-break of a player.
+    values(player, order):
+        Return the tie-breaks of a player in order.
+    standings(order=None, limit=None):
+        Return the players sorted by points, then by the tie-breaks.
+    """
+
+    def __init__(self, players: Iterable[Any] = ()):
+        """
+        Initialize the aggregates of players without games.
+
+        Parameters
+        ----------
+        players : iterable
+            Ids of the players of the tournament.
+        """
+        self.rounds_recorded = 0
+        self.scores = ScoreIndex()
+        self._points: Dict[Any, float] = {}
+        # Games of each player: (opponent, player's result, opponent's result).
+        self._games: Dict[Any, List[Tuple[Any, float, float]]] = {}
+        self._buchholz: Dict[Any, float] = {}
+        self._sonneborn_berger: Dict[Any, float] = {}
+        self._progressive: Dict[Any, float] = {}
+        for player in players:
+            self._add_player(player)
+
+    def __len__(self):
+        """
+        Return the number of players.
+        """
+        return len(self._points)
+
+    def _add_player(self, player: Any) -> None:
+        """
+        Give a player empty aggregates, unless they already have some.
+        """
+        if player not in self._points:
+            self._points[player] = 0.0
+            self._games[player] = []
+            self._buchholz[player] = 0.0
+            self._sonneborn_berger[player] = 0.0
+            self._progressive[player] = 0.0
+            self.scores.add_player(player)
+
+    def record_round(self, matches: Iterable[Tuple[List[Any], List[Any]]], bye: Any = None) -> None:
+        """
+        Apply the results of a finished round.
+
+        Each game adds the opponent's points before the round to the sums of
+        the player; then every point scored in the round is added to the sums
+        of the scorer's opponents (the new one included). The cost is the
+        number of games of the players who scored, not the number of rounds.
+
+        Parameters
+        ----------
+        matches : iterable
+            Matches of the round ([white_id, white_score], [black_id, black_score]).
+        bye : player id | None
+            Player exempted from the round, who scores BYE_POINTS.
+        """
+        scored: Dict[Any, float] = {}
+        for (player1, result1), (player2, result2) in matches:
+            if result1 == "" or result2 == "":
+                continue
+            self._add_player(player1)
+            self._add_player(player2)
+            for player, opponent, result, opponent_result in ((player1, player2, result1, result2),
+                                                              (player2, player1, result2, result1)):
+                self._games[player].append((opponent, result, opponent_result))
+                self._buchholz[player] += self._points[opponent]
+                self._sonneborn_berger[player] += result * self._points[opponent]
+                scored[player] = scored.get(player, 0.0) + result
+        if bye is not None:
+            self._add_player(bye)
+            scored[bye] = scored.get(bye, 0.0) + BYE_POINTS
+        for player, points in scored.items():
+            if not points:
+                continue
+            self._points[player] += points
+            self.scores.add_points(player, points)
+            for opponent, _, opponent_result in self._games[player]:
+                self._buchholz[opponent] += points
+                self._sonneborn_berger[opponent] += opponent_result * points
+        for player, points in self._points.items():
+            self._progressive[player] += points
+        self.rounds_recorded += 1
+
+    def points(self, player: Any) -> float:
+        """Return the points of a player."""
+        return self._points.get(player, 0.0)
+
+    def buchholz(self, player: Any) -> float:
+        """Return the sum of the points of the opponents of a player."""
+        return self._buchholz.get(player, 0.0)
+
+    def median(self, player: Any) -> float:
+        """Return the Buchholz of a player without their best and worst opponents."""
+        opponents_points = [self._points[opponent] for opponent, _, _ in self._games.get(player, ())]
+        if len(opponents_points) < 3:
+            return self.buchholz(player)
+        return self.buchholz(player) - max(opponents_points) - min(opponents_points)
+
+    def sonneborn_berger(self, player: Any) -> float:
+        """Return the points of the beaten opponents plus half those of the opponents drawn."""
+        return self._sonneborn_berger.get(player, 0.0)
+
+    def progressive(self, player: Any) -> float:
+        """Return the sum of the points of a player after each round."""
+        return self._progressive.get(player, 0.0)
+
+    def values(self, player: Any, order: Sequence[str] = DEFAULT_TIE_BREAK_ORDER) -> Tuple[float, ...]:
+        """
+        Return the tie-breaks of a player.
+
+        Parameters
+        ----------
+        player : player id
+            The player.
+        order : sequence of str
+            Names of TIE_BREAKS.
+
+        Returns
+        -------
+        tuple of float
+            The values, in order.
+        """
+        return tuple(getattr(self, name)(player) for name in order)
+
+    def standings(self, order: Optional[Sequence[str]] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Return the players sorted by points, then by the tie-breaks.
+
+        The score groups come already ordered from the score index, which
+        also gives the rank of the first player of each group (ScoreIndex.rank):
+        only the players of a same score are sorted by their tie-breaks, and
+        only the groups needed to reach limit.
+
+        Parameters
+        ----------
+        order : sequence of str | None
+            Names of TIE_BREAKS, compared in order (default
+            DEFAULT_TIE_BREAK_ORDER).
+        limit : int | None
+            Number of rows to return (the leaders), or None for every player.
+
+        Returns
+        -------
+        list of dict
+            One row per player, best first: {"rank", "player_id", "points",
+            "tie_breaks"}, tie_breaks being the values in order. Players
+            equal on points and on every tie-break share the same rank.
+        """
+        order = tuple(order) if order else DEFAULT_TIE_BREAK_ORDER
+        rows: List[Dict[str, Any]] = []
+        previous = None
+        for points, group in self.scores.score_groups():
+            if limit is not None and len(rows) >= limit:
+                break
+            group_rank = self.scores.rank(group[0])
+            keys = {player: self.values(player, order) for player in group}
+            for offset, player in enumerate(sorted(group, key=keys.get, reverse=True)):
+                key = (points,) + keys[player]
+                rank = rows[-1]["rank"] if key == previous else group_rank + offset
+                rows.append({"rank": rank, "player_id": player, "points": points, "tie_breaks": keys[player]})
+                previous = key
+        return rows if limit is None else rows[:limit]
@@ -4,12 +4,25 @@ Utilities for generating pairings and recording results in tournaments.
 This module provides simple, serializable helpers used by the tournament
 controller and views:
 
-- generate_first_round_matches(players): create randomized first-round pairings.
-- generate_round_matches(players, previous_matches): create subsequent round
-  pairings trying to avoid repeat pairings and grouping by score.
+- generate_first_round_matches(players, history, rng): create randomized
+  first-round pairings.
+- generate_round_matches(players, previous_matches, strategy, history, rng,
+  acceleration, round_number, score_groups): create subsequent round pairings
+  without repeat pairings, grouping by score or by maximum-weight matching
+  (see utils.pairing_utils), optionally accelerated.
+- pair_next_round(players, played, round_number, pairing, history, schedule,
+  strategy, score_groups, rng): pair a round of a tournament from its stored
+  state, as the tournament controller does.
+- pair_next_rounds(jobs, workers): pair rounds of several tournaments
+  concurrently in a process pool, timing each of them.
+- replay_rounds(players, rounds, pairing, schedule): pair the stored rounds
+  of a seeded tournament again and return the differences.
 - inscribe_match_results(match, result1): record a match result from the white
   player's perspective.
+- expected_score(elo_player, elo_opponent): expected score of a game.
 - calculate_elo(elo_player, elo_opponent, k_player, w): compute an updated ELO.
+- settle_elo(rounds_matches, ratings): apply every game of a tournament to
+  in-memory (elo, coef_k, games_played) states, a round at a time.
 
 Data formats and conventions
 ----------------------------
@@ -18,6 +31,12 @@ Data formats and conventions
   where scores are numeric (floats) or an empty string when not yet set.
 - previous_matches is a list of two-item lists ([[p1, p2], ...]) used to avoid
   rematches where possible.
+- history is the PlayerHistory of the tournament (utils.history_utils): when
+  given, the generated round (colours, bye, floats) is recorded in it and the
+  colours follow the players' colour wishes.
+- rng is the random.Random drawing the pairings (see
+  utils.pairing_utils.round_rng); without it the functions of the random
+  module are used and the round cannot be reproduced.
 
 Notes
 -----
@@ -26,11 +45,24 @@ They are not meant to implement every tournament pairing rule (e.g. full Swiss
 rules with tie-breaks). Use more advanced libraries for production-grade pairing.
 """
 
-from typing import Dict, List, Tuple, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple, Any, Iterable, Optional
+import os
 import random
-
-
-def generate_first_round_matches(players: Dict[str, Any]) -> Tuple[List[Tuple[List[Any], List[Any]]], List[List[Any]]]:
+import time
+from model.player_model import coefficient_k
+from utils.history_utils import PlayerHistory
+from utils.pairing_utils import BYE_POINTS, PAIRING_STRATEGIES, PlayedPairs, pairing_points, round_rng
+from utils.pairing_utils import pair_swiss_round
+from utils.rating_utils import rate_games
+from utils.round_robin_utils import berger_schedule, schedule_round
+
+
+def generate_first_round_matches(
+    players: Dict[str, Any],
+    history: Optional[PlayerHistory] = None,
+    rng: Optional[random.Random] = None
+) -> Tuple[List[Tuple[List[Any], List[Any]]], List[List[Any]]]:
     """
     Generate randomized pairings for the first round.
 
@@ -38,6 +70,11 @@ def generate_first_round_matches(players: Dict[str, Any]) -> Tuple[List[Tuple[Li
     ----------
     players : dict
         Mapping of player_id -> points (points are ignored for the first round).
+    history : PlayerHistory | None
+        History of the tournament's players; the colours of the round and
+        the bye of the player left out (odd count) are recorded in it.
+    rng : random.Random | None
+        Source of randomness for the draw (defaults to the random module).
 
     Returns
     -------
@@ -50,7 +87,7 @@ def generate_first_round_matches(players: Dict[str, Any]) -> Tuple[List[Tuple[Li
     shuffled_players: List[Any] = []
     for player_id in players.keys():
         shuffled_players.append(player_id)
-    random.shuffle(shuffled_players)
+    (rng if rng is not None else random).shuffle(shuffled_players)
 
     matches: List[Tuple[List[Any], List[Any]]] = []
     matches_used: List[List[Any]] = []
@@ -64,23 +101,33 @@ def generate_first_round_matches(players: Dict[str, Any]) -> Tuple[List[Tuple[Li
         matches.append(match)
         matches_used.append([p1, p2])
 
+    if history is not None:
+        bye = shuffled_players[-1] if len(shuffled_players) % 2 else None
+        history.record_round(matches, bye)
     return matches, matches_used
 
 
 def generate_round_matches(
     players: Dict[str, float],
-    previous_matches: List[List[Any]]
+    previous_matches: List[List[Any]],
+    strategy: str = "backtracking",
+    history: Optional[PlayerHistory] = None,
+    rng: Optional[random.Random] = None,
+    acceleration: Optional[Dict[str, List[Any]]] = None,
+    round_number: int = 0,
+    score_groups: Optional[List[Tuple[float, List[Any]]]] = None
 ) -> Tuple[List[Tuple[List[Any], List[Any]]], List[List[Any]]]:
     """
-    Generate pairings for a subsequent round while attempting to avoid rematches.
+    Generate pairings for a subsequent round without rematches.
 
-    Strategy:
-    - Group players by their current points.
-    - Within each score group shuffle players to avoid deterministic ordering.
-    - Attempt to pair players with the same (or nearest) score while avoiding
-      pairings that already occurred (tracked in previous_matches).
-    - If no eligible opponent is found for a player, that player remains unpaired
-      for this round (caller may handle by giving bye or other rules).
+    Thin wrapper over pair_next_round() (the function the tournament
+    controller pairs with) that also records the round in history and
+    previous_matches. The round is paired by the function of utils.pairing_utils selected by
+    strategy: pair_swiss_round() ("backtracking": score groups, floaters and
+    bounded backtracking) or pair_weighted_round() ("matching": maximum-
+    weight matching, for large opens). Every player is paired; with an odd
+    number of players one player is exempted, use the pairing functions
+    directly to know which one.
 
     Parameters
     ----------
@@ -89,6 +136,23 @@ def generate_round_matches(
     previous_matches : list
         Mutable list of previously paired id pairs, e.g. [[p1, p2], ...].
         This list will be appended with newly created pairs.
+    strategy : str
+        Key of utils.pairing_utils.PAIRING_STRATEGIES.
+    history : PlayerHistory | None
+        History of the tournament's players: used for the byes and colours,
+        then updated with the new round.
+    rng : random.Random | None
+        Source of randomness for the order inside score groups.
+    acceleration : dict | None
+        Accelerated pairing settings of the tournament
+        (Tournament.pairing["acceleration"]): during the accelerated rounds
+        the round is paired on the points plus the virtual points of group A
+        (players is not modified).
+    round_number : int
+        Number of the round being paired (selects the virtual points).
+    score_groups : list | None
+        Score groups of players (Tournament.score_groups()), used outside
+        the accelerated rounds instead of grouping the players again.
 
     Returns
     -------
@@ -97,43 +161,207 @@ def generate_round_matches(
     previous_matches : list
         The updated previous_matches list including the newly scheduled pairs.
     """
-    # Group players by score
-    score_groups: Dict[float, List[Any]] = {}
-    for player_id, points in players.items():
-        score_groups.setdefault(points, []).append(player_id)
+    pairing = {"strategy": strategy}
+    if acceleration is not None:
+        pairing["acceleration"] = acceleration
+    matches, bye, points = pair_next_round(players, previous_matches, round_number, pairing, history,
+                                           score_groups=score_groups, rng=rng)
+    if history is not None:
+        history.record_round(matches, bye, points)
+    previous_matches.extend([white[0], black[0]] for white, black in matches)
+    return matches, previous_matches
 
-    # Sort scores high -> low and flatten groups after shuffling each group
-    sorted_scores = sorted(score_groups.keys(), reverse=True)
-    sorted_players_id: List[Any] = []
-    for score in sorted_scores:
-        group = score_groups[score]
-        random.shuffle(group)
-        sorted_players_id.extend(group)
 
-    matches: List[Tuple[List[Any], List[Any]]] = []
-    used: List[Any] = []
-    i = 0
-    while i < len(sorted_players_id):
-        p1 = sorted_players_id[i]
-        if p1 in used:
-            i += 1
-            continue
-        # Find next player p2 that p1 hasn't played with
-        for j in range(i + 1, len(sorted_players_id)):
-            p2 = sorted_players_id[j]
-            if p2 in used:
-                continue
-            already_played = [p1, p2] in previous_matches or [p2, p1] in previous_matches
-            if not already_played:
-                matches.append(([p1, ""], [p2, ""]))
-                used.append(p1)
-                used.append(p2)
-                previous_matches.append([p1, p2])
-                break
-        # If no partner found, player remains unpaired (handled by caller if needed)
-        i += 1
+def pair_next_round(
+    players: Dict[str, float],
+    played: Any,
+    round_number: int,
+    pairing: Optional[Dict[str, Any]] = None,
+    history: Optional[PlayerHistory] = None,
+    schedule: Optional[Dict[str, Any]] = None,
+    strategy: str = "backtracking",
+    score_groups: Optional[List[Tuple[float, List[Any]]]] = None,
+    rng: Optional[random.Random] = None
+) -> Tuple[List[Tuple[List[Any], List[Any]]], Optional[Any], Dict[str, float]]:
+    """
+    Pair a round of a tournament from its stored state.
 
-    return matches, previous_matches
+    A round robin reads the round from its schedule. A Swiss round is paired
+    with the strategy and the round generator of the pairing seed, on the
+    points plus the virtual points of an accelerated pairing. Nothing is
+    modified: the caller records the round in the history.
+
+    Parameters
+    ----------
+    players : dict
+        Mapping player_id -> points (Tournament.players).
+    played : PlayedPairs | iterable
+        Pairs of players who already met (Tournament.played_pairs()).
+    round_number : int
+        Number of the round to pair, starting at 1.
+    pairing : dict | None
+        Pairing settings of the tournament (Tournament.pairing); without a
+        seed the round is drawn with the random module.
+    history : PlayerHistory | None
+        History of the tournament's players (colours and byes).
+    schedule : dict | None
+        Round-robin schedule of the tournament.
+    strategy : str
+        Strategy used when pairing holds none (tournaments started before
+        the pairing settings were stored).
+    score_groups : list | None
+        Score groups of players (Tournament.score_groups()); they replace
+        the grouping of players by points, except during the accelerated
+        rounds, paired on other points.
+    rng : random.Random | None
+        Source of randomness used when pairing holds no seed (defaults to
+        the random module).
+
+    Returns
+    -------
+    matches : list of tuple
+        Matches in the format ([white_id, ""], [black_id, ""]).
+    bye : player id | None
+        The player exempted from the round.
+    points : dict
+        The points the round was paired on, to pass to
+        PlayerHistory.record_round().
+    """
+    if schedule is not None:
+        matches, bye = schedule_round(schedule, round_number - 1)
+        return matches, bye, players
+    pairing = pairing or {}
+    pair_round = PAIRING_STRATEGIES.get(pairing.get("strategy", strategy), pair_swiss_round)
+    if "seed" in pairing:
+        rng = round_rng(pairing["seed"], round_number)
+    points = pairing_points(players, pairing.get("acceleration"), round_number)
+    if points is not players:
+        score_groups = None
+    matches, bye = pair_round(points, played, rng=rng, history=history, score_groups=score_groups)
+    return matches, bye, points
+
+
+def _pair_timed(
+    job: Dict[str, Any]
+) -> Tuple[List[Tuple[List[Any], List[Any]]], Optional[Any], Dict[str, float], float]:
+    """
+    Run pair_next_round(**job) and return its result followed by its duration in seconds.
+    """
+    start = time.perf_counter()
+    matches, bye, points = pair_next_round(**job)
+    return matches, bye, points, time.perf_counter() - start
+
+
+def pair_next_rounds(
+    jobs: List[Dict[str, Any]],
+    workers: Optional[int] = None
+) -> List[Tuple[List[Tuple[List[Any], List[Any]]], Optional[Any], Dict[str, float], float]]:
+    """
+    Pair the next rounds of several tournaments concurrently.
+
+    Each job is paired by pair_next_round() in a ProcessPoolExecutor (the
+    pairing is CPU bound, so threads would not run in parallel). Jobs only
+    hold plain data (dicts, lists, PlayedPairs, PlayerHistory), pickled to
+    the workers.
+
+    Parameters
+    ----------
+    jobs : list of dict
+        Keyword arguments of pair_next_round(), one dict per tournament.
+    workers : int | None
+        Number of worker processes (defaults to the number of CPUs); with
+        1 worker or a single job the rounds are paired in the current
+        process.
+
+    Returns
+    -------
+    list of tuple
+        (matches, bye, points, seconds) for each job, in order, seconds
+        being the pairing time measured in the worker.
+    """
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        return [_pair_timed(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_pair_timed, jobs))
+
+
+def replay_rounds(
+    players: Iterable[Any],
+    rounds: Iterable[Any],
+    pairing: Dict[str, Any],
+    schedule: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Pair the stored rounds of a seeded tournament again and compare them.
+
+    Each round is paired from the stored state before it (points from the
+    stored results, previous pairings and player history), with the random
+    generator derived from the tournament seed and the virtual points of an
+    accelerated pairing, exactly as TournamentController paired it. A round
+    robin draws its schedule again
+    from the seed. The first difference therefore points at the first round
+    that was not paired by the engine from the stored data (edited pairing,
+    other strategy or engine version); rounds after an edited round usually
+    differ too, since they were paired from its original state.
+
+    Parameters
+    ----------
+    players : iterable
+        Player ids in registration order (keys of Tournament.players).
+    rounds : iterable
+        Stored rounds in order (objects with matches and bye attributes, e.g.
+        TournamentRound).
+    pairing : dict
+        Pairing settings of the tournament ({"seed": int, "strategy": str}
+        and optionally "acceleration").
+    schedule : dict | None
+        Stored round-robin schedule; the tournament is a round robin when
+        given.
+
+    Returns
+    -------
+    list of dict
+        One entry per round paired differently: {"round": number,
+        "missing": stored boards [white_id, black_id] not produced again,
+        "unexpected": produced boards that were not stored, "stored_bye",
+        "replayed_bye"}. An empty list means every round was reproduced.
+    """
+    points = {player_id: 0.0 for player_id in players}
+    seed = pairing["seed"]
+    acceleration = pairing.get("acceleration")
+    if schedule is not None:
+        schedule = berger_schedule(list(points), round_rng(seed, 0))
+    history = PlayerHistory()
+    played = PlayedPairs()
+    differences = []
+    for index, round in enumerate(rounds):
+        if schedule is None and index == 0 and acceleration is None:
+            matches, pairs = generate_first_round_matches(points, rng=round_rng(seed, 1))
+            paired = {player_id for pair in pairs for player_id in pair}
+            bye = next((player_id for player_id in points if player_id not in paired), None)
+            paired_points = points
+        else:
+            matches, bye, paired_points = pair_next_round(points, played, index + 1, pairing, history, schedule)
+        stored = {(white[0], black[0]) for white, black in round.matches}
+        replayed = {(white[0], black[0]) for white, black in matches}
+        if stored != replayed or bye != round.bye:
+            differences.append({
+                "round": index + 1,
+                "missing": [list(board) for board in sorted(stored - replayed)],
+                "unexpected": [list(board) for board in sorted(replayed - stored)],
+                "stored_bye": round.bye,
+                "replayed_bye": bye,
+            })
+
+        history.record_round(round.matches, round.bye, paired_points)
+        played.add_all(stored)
+        for (white, white_score), (black, black_score) in round.matches:
+            points[white] += white_score or 0.0
+            points[black] += black_score or 0.0
+        if round.bye is not None:
+            points[round.bye] += BYE_POINTS
+    return differences
 
 
 def inscribe_match_results(match: Tuple[List[Any], List[Any]], result1: Any) -> Tuple[List[Any], List[Any]]:
@@ -177,6 +405,25 @@ def inscribe_match_results(match: Tuple[List[Any], List[Any]], result1: Any) ->
     return match
 
 
+def expected_score(elo_player, elo_opponent):
+    """
+    Return the expected score of a player against an opponent.
+
+    Parameters
+    ----------
+    elo_player : float | int
+        Elo rating of the player.
+    elo_opponent : float | int
+        Elo rating of the opponent.
+
+    Returns
+    -------
+    float
+        1 / (1 + 10 ** ((elo_opponent - elo_player) / 400)), between 0 and 1.
+    """
+    return 1 / (1 + 10 ** ((elo_opponent - elo_player) / 400))
+
+
 def calculate_elo(elo_player, elo_opponent, k_player, w):
     """
     Compute the updated Elo rating for a player after a single game.
@@ -204,7 +451,59 @@ def calculate_elo(elo_player, elo_opponent, k_player, w):
     and updates the rating as:
         R' = R + K * (w - expected)
     """
-    expected_score = 1 / (1 + 10 ** ((elo_opponent - elo_player) / 400))
-    elo_updated = elo_player + k_player * (w - expected_score)
+    elo_updated = elo_player + k_player * (w - expected_score(elo_player, elo_opponent))
 
     return round(elo_updated)
+
+
+def settle_elo(
+    rounds_matches: Iterable[Iterable[Tuple[List[Any], List[Any]]]],
+    ratings: Dict[str, List[Any]]
+) -> Dict[str, List[Any]]:
+    """
+    Apply every game of a tournament to the ratings of its players.
+
+    Games are processed round by round, exactly as if each result had been
+    applied to the ChessPlayer instances one after the other: both new
+    ratings of a game are computed from the ratings before the game with
+    each player's current K coefficient, then games_played is incremented and
+    the K coefficient updated with the ChessPlayer.modify_elo() rules. As a
+    player plays at most once per round, the games of a round are rated
+    together in one pass by utils.rating_utils.rate_games (vectorised when
+    NumPy is installed), with the rounding of calculate_elo().
+
+    Parameters
+    ----------
+    rounds_matches : iterable
+        For each round, its matches ([white_id, white_score], [black_id, black_score]).
+    ratings : dict
+        Mapping player_id -> [elo, coef_k, games_played], updated in place.
+
+    Returns
+    -------
+    dict
+        The updated ratings mapping. Games with an unknown player or without
+        a result are ignored.
+    """
+    for matches in rounds_matches:
+        slots: Dict[str, int] = {}
+        players, opponents, scores, k_factors = [], [], [], []
+        for (player1_id, result1), (player2_id, result2) in matches:
+            state1 = ratings.get(player1_id)
+            state2 = ratings.get(player2_id)
+            if state1 is None or state2 is None or result1 == "" or result2 == "":
+                continue
+            slot1 = slots.setdefault(player1_id, len(slots))
+            slot2 = slots.setdefault(player2_id, len(slots))
+            players += [slot1, slot2]
+            opponents += [slot2, slot1]
+            scores += [result1, result2]
+            k_factors += [state1[1], state2[1]]
+            state1[2] += 1
+            state2[2] += 1
+        new_elos = rate_games([ratings[player_id][0] for player_id in slots], players, opponents, scores, k_factors)
+        for player_id, slot in slots.items():
+            state = ratings[player_id]
+            state[0] = new_elos[slot]
+            state[1] = coefficient_k(state[2], state[0])
+    return ratings
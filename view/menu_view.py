@@ -7,6 +7,7 @@ from controller.tournament_controller import TournamentController
 from view.player_view import PlayerView
 from controller.player_controller import ChessPlayerController
 from view.report_view import ReportView
+from repository.session import commit_repositories
 
 
 class MenuView:
@@ -69,7 +70,7 @@ class MenuView:
 
         Displays the menu, reads user input and dispatches to the corresponding
         sub-view (tournament, player, report). The loop continues until the
-        user selects the quit option.
+        user selects the quit option, which flushes pending session changes.
 
         Returns
         -------
@@ -95,6 +96,7 @@ class MenuView:
                 report_view = ReportView()
                 report_view.execute()
             elif choice == "4":
+                commit_repositories()
                 self.display_exit_message()
                 running = False
             else:
@@ -24,6 +24,8 @@ class PlayerView:
         Render the modify-player submenu for given player.
     get_new_player_details():
         Prompt the user for new player fields and return them.
+    display_recomputed_ratings_view(report):
+        Render the rating changes of a recomputation.
     execute():
         Run the interactive player menu loop.
     display_*_message(...):
@@ -56,7 +58,8 @@ class PlayerView:
         table.add_row("[bold cyan]2.[/bold cyan] Ajouter un joueur")
         table.add_row("[bold cyan]3.[/bold cyan] Supprimer un joueur")
         table.add_row("[bold cyan]4.[/bold cyan] Modifier un joueur")
-        table.add_row("[bold cyan]5.[/bold cyan] Retour")
+        table.add_row("[bold cyan]5.[/bold cyan] Recalculer l'historique des classements")
+        table.add_row("[bold cyan]6.[/bold cyan] Retour")
         panel = Panel(
             table, title="[bold yellow]Gestion des Joueurs[/bold yellow]", border_style="magenta")
         centered_panel = Align.center(panel)
@@ -70,7 +73,7 @@ class PlayerView:
         ----------
         players : iterable
             Iterable of player objects (expected attributes: surname, name,
-            date_of_birth, federation_chess_id, elo).
+            date_of_birth, federation_chess_id, elo, glicko).
 
         Returns
         -------
@@ -83,10 +86,12 @@ class PlayerView:
         table.add_column("Date de Naissance", style="magenta")
         table.add_column("ID Fédération", style="green")
         table.add_column("Elo", style="dark_orange")
+        table.add_column("Glicko-2 (± RD)", style="dark_orange")
 
         for index, player in enumerate(players):
+            glicko = f"{player.glicko[0]:.0f} ± {player.glicko[1]:.0f}" if player.glicko else "-"
             table.add_row(str(index), player.surname, player.name,
-                          player.date_of_birth, player.federation_chess_id, str(player.elo))
+                          player.date_of_birth, player.federation_chess_id, str(player.elo), glicko)
 
         panel = Panel(table, title="[bold yellow]Liste des Joueurs[/bold yellow]",
                       subtitle="Appuyez sur 'b' pour revenir au menu précédent", border_style="magenta")
@@ -172,7 +177,7 @@ class PlayerView:
         while running:
             self.display_player_menu_view()
             player_choice = self.console.input(
-                "\n[bold green]Sélectionnez une action (1-5) : [/bold green]")
+                "\n[bold green]Sélectionnez une action (1-6) : [/bold green]")
             if player_choice == "1":
                 while True:
                     self.display_display_players_view(
@@ -277,10 +282,45 @@ class PlayerView:
                 except IndexError:
                     self.display_player_index_error_message()
             elif player_choice == "5":
+                self.display_section_message("Recalculer l'historique des classements")
+                self.display_recomputed_ratings_view(self.player_controller.recompute_ratings())
+            elif player_choice == "6":
                 running = False
             else:
                 self.display_invalid_choice_message()
 
+    def display_recomputed_ratings_view(self, report):
+        """
+        Display the result of a rating recomputation.
+
+        Parameters
+        ----------
+        report : dict
+            Report returned by ChessPlayerController.recompute_ratings().
+
+        Returns
+        -------
+        None
+        """
+        self.console.print(Align.center(
+            f"[bold blue]{report['replayed']} tournoi(s) rejoué(s) sur {report['tournaments']} "
+            f"tournoi(s) terminé(s).[/bold blue]"))
+        if report["mismatches"]:
+            self.console.print(Align.center(
+                f"[bold red]Classement actuel non reproductible pour : "
+                f"{', '.join(sorted(report['mismatches']))}[/bold red]"))
+        if not report["changes"]:
+            self.console.print(Align.center("[bold green]Aucun classement modifié.[/bold green]"))
+            return
+        table = Table(title=None, show_header=True, header_style="bold blue")
+        table.add_column("ID Fédération", style="green")
+        table.add_column("Ancien Elo", style="dark_orange")
+        table.add_column("Nouvel Elo", style="dark_orange")
+        for player_id, (old_elo, new_elo) in sorted(report["changes"].items()):
+            table.add_row(player_id, str(old_elo), str(new_elo))
+        panel = Panel(table, title="[bold yellow]Classements recalculés[/bold yellow]", border_style="magenta")
+        self.console.print(Align.center(panel))
+
     def display_player_added_message(self, name, surname):
         """
         Inform the user that a player was added.
@@ -7,6 +7,9 @@ from controller.player_controller import ChessPlayerController
 from controller.tournament_controller import TournamentController
 import os
 
+# Leading players of each tournament shown in the tournaments report.
+PODIUM_SIZE = 3
+
 
 class ReportView:
     """View responsible for generating HTML reports from templates.
@@ -22,10 +25,10 @@ class ReportView:
         Render the report generation menu in the console.
     display_players_jinja_view(players):
         Render and write a players HTML report using Jinja2.
-    display_tournaments_jinja_view(tournaments):
+    display_tournaments_jinja_view(tournaments, podiums, players):
         Render and write a tournaments HTML report using Jinja2.
-    display_tournament_players_jinja_view(tournament, players):
-        Render and write a tournament-specific players report.
+    display_tournament_players_jinja_view(tournament, players, labels, standings):
+        Render and write a tournament-specific players report (standings).
     display_tournament_rounds_jinja_view(tournament, players):
         Render and write a tournament-specific rounds report.
     display_index_jinja_view(tournaments, players):
@@ -113,7 +116,7 @@ class ReportView:
         self._write_html_file(file_path, html_rendu)
         self.display_successful_generation_message("joueurs")
 
-    def display_tournaments_jinja_view(self, tournaments):
+    def display_tournaments_jinja_view(self, tournaments, podiums, players):
         """
         Render and save the tournaments report from the 'tournaments.html.j2' template.
 
@@ -121,16 +124,23 @@ class ReportView:
         ----------
         tournaments : iterable
             List of tournament objects passed to the template.
+        podiums : dict
+            Mapping tournament_id -> leading standings rows of
+            TournamentController.get_standings(), for the tournaments with
+            a finished round.
+        players : iterable
+            List of player objects, to name the players of the podiums.
         """
         env = Environment(loader=FileSystemLoader('templates'))
         template = env.get_template('tournaments.html.j2')
-        html_rendu = template.render(tournaments=tournaments)
+        players_by_id = {player.federation_chess_id: player for player in players}
+        html_rendu = template.render(tournaments=tournaments, podiums=podiums, players_by_id=players_by_id)
         directory = self._ensure_reports_dir()
         file_path = f'{directory}/tournaments.html'
         self._write_html_file(file_path, html_rendu)
         self.display_successful_generation_message("tournois")
 
-    def display_tournament_players_jinja_view(self, tournament, players):
+    def display_tournament_players_jinja_view(self, tournament, players, labels, standings):
         """
         Render and save a tournament-specific players report.
 
@@ -140,10 +150,16 @@ class ReportView:
             Tournament instance passed to the template.
         players : iterable
             List of player objects passed to the template.
+        labels : list of str
+            Names of the tie-breaks, in the order they are compared.
+        standings : list of dict
+            Standings rows of TournamentController.get_standings().
         """
         env = Environment(loader=FileSystemLoader('templates'))
         template = env.get_template('tournament_players.html.j2')
-        html_rendu = template.render(tournament=tournament, players=players)
+        players_by_id = {player.federation_chess_id: player for player in players}
+        html_rendu = template.render(tournament=tournament, players=players, players_by_id=players_by_id,
+                                     labels=labels, standings=standings)
         tournament_id = tournament.tournament_id
         directory = self._ensure_reports_dir()
         file_path = f'{directory}/{tournament_id}_players.html'
@@ -210,10 +226,14 @@ class ReportView:
                 tournaments = tournament_controller.display_tournaments()
                 self.display_index_jinja_view(tournaments, players)
                 self.display_players_jinja_view(players)
-                self.display_tournaments_jinja_view(tournaments)
-                for tournament in tournaments:
+                podiums = {tournament.tournament_id: tournament_controller.get_standings(index, limit=PODIUM_SIZE)[1]
+                           for index, tournament in enumerate(tournaments)
+                           if tournament.rounds and tournament.rounds[0].status == "Terminé"}
+                self.display_tournaments_jinja_view(tournaments, podiums, players)
+                for index, tournament in enumerate(tournaments):
+                    labels, standings = tournament_controller.get_standings(index)
                     self.display_tournament_players_jinja_view(
-                        tournament, players)
+                        tournament, players, labels, standings)
                     self.display_tournament_rounds_jinja_view(
                         tournament, players)
                 self.display_link()
@@ -30,6 +30,14 @@ class TournamentView:
         Render rounds overview for a tournament.
     display_tournament_round_matches(matches):
         Return a Rich Table representing the matches of a round.
+    display_standings_view(labels, standings):
+        Render the standings with their tie-breaks.
+    display_forecast_view(forecast):
+        Render the win and podium probabilities of the players.
+    display_replay_view(differences):
+        Render the result of a pairing replay.
+    display_batch_pairing_view(paired, skipped):
+        Render the rounds paired at once and their pairing times.
     get_new_tournament_details():
         Prompt user for new tournament data and return it.
     get_match_result():
@@ -73,7 +81,11 @@ class TournamentView:
         # reprise si jamais programme arrêté en cours de tournoi
         table.add_row("[bold cyan]6.[/bold cyan] Mettre à jour un tournoi")
         table.add_row("[bold cyan]7.[/bold cyan] Supprimer un tournoi")
-        table.add_row("[bold cyan]8.[/bold cyan] Retour")
+        table.add_row("[bold cyan]8.[/bold cyan] Prévoir le classement final")
+        table.add_row("[bold cyan]9.[/bold cyan] Rejouer les appariements")
+        table.add_row("[bold cyan]10.[/bold cyan] Apparier plusieurs tournois")
+        table.add_row("[bold cyan]11.[/bold cyan] Afficher le classement")
+        table.add_row("[bold cyan]12.[/bold cyan] Retour")
         panel = Panel(
             table,
             title="[bold yellow]Gestion des Tournois[/bold yellow]",
@@ -89,7 +101,7 @@ class TournamentView:
         Parameters
         ----------
         tournaments : iterable
-            Iterable of Tournament instances to display.
+            Iterable of TournamentSummary instances to display.
 
         Returns
         -------
@@ -123,7 +135,7 @@ class TournamentView:
                 tournament.location,
                 tournament.start_date,
                 tournament.end_date,
-                str(len(tournament.players)),
+                str(tournament.players_count),
                 str(tournament.number_of_rounds),
                 str(tournament.current_round),
                 tournament.description,
@@ -228,6 +240,7 @@ class TournamentView:
             "Statut", style="green_yellow", justify="center")
         rounds_table.add_column("Round", style="cyan", justify="center")
         rounds_table.add_column("Matches", justify="center")
+        rounds_table.add_column("Exempt", style="dim", justify="center")
 
         for index, round in enumerate(rounds):
             rounds_table.add_row(
@@ -236,6 +249,7 @@ class TournamentView:
                 round.status,
                 round.name,
                 self.display_tournament_round_matches(round.matches),
+                round.bye if round.bye is not None else "-",
             )
 
         panel = Panel(
@@ -290,6 +304,189 @@ class TournamentView:
             )
         return matches_table
 
+    def display_standings_view(self, labels, standings):
+        """
+        Display the standings of a tournament as a Rich panel.
+
+        Parameters
+        ----------
+        labels : list of str
+            Names of the tie-breaks, in the order they are compared.
+        standings : list of dict
+            {"rank", "player_id", "points", "tie_breaks"} rows, as returned
+            by TournamentController.get_standings().
+
+        Returns
+        -------
+        None
+        """
+        table = Table(
+            title=None,
+            show_header=True,
+            header_style="bold blue",
+            show_lines=True,
+            box=box.SQUARE_DOUBLE_HEAD,
+        )
+        table.add_column("Rang", style="dim", justify="right")
+        table.add_column("Joueur", style="steel_blue3")
+        table.add_column("Points", style="cyan", justify="right")
+        for label in labels:
+            table.add_column(label, style="green", justify="right")
+
+        for row in standings:
+            table.add_row(
+                str(row["rank"]),
+                row["player_id"],
+                str(row["points"]),
+                *(f"{value:g}" for value in row["tie_breaks"]),
+            )
+
+        panel = Panel(
+            table, title="[bold yellow]Classement[/bold yellow]",
+            border_style="gold1",
+        )
+        centered_panel = Align.center(panel)
+        self.console.print(centered_panel)
+
+    def display_forecast_view(self, forecast):
+        """
+        Display the forecast of the final standings as a Rich panel.
+
+        Parameters
+        ----------
+        forecast : list of tuple
+            (player_id, points, {"win", "podium", "points"}) rows, as
+            returned by TournamentController.forecast_tournament().
+
+        Returns
+        -------
+        None
+        """
+        table = Table(
+            title=None,
+            show_header=True,
+            header_style="bold blue",
+            show_lines=True,
+            box=box.SQUARE_DOUBLE_HEAD,
+        )
+        table.add_column("Joueur", style="steel_blue3")
+        table.add_column("Points", style="cyan", justify="right")
+        table.add_column("Points attendus", style="cyan", justify="right")
+        table.add_column("Victoire", style="green", justify="right")
+        table.add_column("Podium", style="magenta", justify="right")
+
+        for player_id, points, probabilities in forecast:
+            table.add_row(
+                player_id,
+                str(points),
+                f"{probabilities['points']:.2f}",
+                f"{probabilities['win']:.1%}",
+                f"{probabilities['podium']:.1%}",
+            )
+
+        panel = Panel(
+            table, title="[bold yellow]Prévision du classement final[/bold yellow]",
+            border_style="gold1",
+        )
+        centered_panel = Align.center(panel)
+        self.console.print(centered_panel)
+
+    def display_replay_view(self, differences):
+        """
+        Display the result of a pairing replay as a Rich panel.
+
+        Parameters
+        ----------
+        differences : list of dict | None
+            Rounds paired differently, as returned by
+            TournamentController.replay_tournament_pairings().
+
+        Returns
+        -------
+        None
+        """
+        if differences is None:
+            self.console.print(Align.center(
+                "[bold red]Ce tournoi n'a pas de graine d'appariement, il ne peut pas être rejoué.[/bold red]"))
+            return
+        if not differences:
+            self.console.print(Align.center(
+                "[bold green]Tous les rounds ont été reproduits à l'identique.[/bold green]"))
+            return
+        table = Table(
+            title=None,
+            show_header=True,
+            header_style="bold blue",
+            show_lines=True,
+            box=box.SQUARE_DOUBLE_HEAD,
+        )
+        table.add_column("Round", style="cyan", justify="center")
+        table.add_column("Matches enregistrés", style="red")
+        table.add_column("Matches rejoués", style="green")
+        table.add_column("Exempt enregistré / rejoué", style="dim", justify="center")
+
+        for difference in differences:
+            table.add_row(
+                str(difference["round"]),
+                "\n".join(f"{white} - {black}" for white, black in difference["missing"]) or "-",
+                "\n".join(f"{white} - {black}" for white, black in difference["unexpected"]) or "-",
+                f"{difference['stored_bye'] or '-'} / {difference['replayed_bye'] or '-'}",
+            )
+
+        panel = Panel(
+            table, title="[bold yellow]Rounds appariés différemment[/bold yellow]",
+            border_style="gold1",
+        )
+        centered_panel = Align.center(panel)
+        self.console.print(centered_panel)
+
+    def display_batch_pairing_view(self, paired, skipped):
+        """
+        Display the rounds paired by a batch pairing as a Rich panel.
+
+        Parameters
+        ----------
+        paired : list of dict
+            Paired tournaments, as returned by
+            TournamentController.initiate_next_rounds().
+        skipped : list
+            Ids of the tournaments that were not paired.
+
+        Returns
+        -------
+        None
+        """
+        table = Table(
+            title=None,
+            show_header=True,
+            header_style="bold blue",
+            show_lines=True,
+            box=box.SQUARE_DOUBLE_HEAD,
+        )
+        table.add_column("Tournoi", style="steel_blue3")
+        table.add_column("Round", style="cyan", justify="center")
+        table.add_column("Matches", justify="right")
+        table.add_column("Temps (ms)", style="green", justify="right")
+
+        for result in paired:
+            table.add_row(
+                result["name"],
+                result["round"],
+                str(result["boards"]),
+                f"{result['seconds'] * 1000:.1f}",
+            )
+
+        panel = Panel(
+            table, title="[bold yellow]Rounds appariés[/bold yellow]",
+            border_style="gold1",
+        )
+        centered_panel = Align.center(panel)
+        self.console.print(centered_panel)
+        if skipped:
+            self.console.print(Align.center(
+                "[bold red]Non appariés (introuvables, non démarrés, round en cours ou terminés) : "
+                f"{', '.join(skipped)}[/bold red]"))
+
     def get_new_tournament_details(self):
         """
         Prompt the user for new tournament details.
@@ -297,14 +494,16 @@ class TournamentView:
         Returns
         -------
         tuple
-            (name, location, start_date, end_date, description)
+            (name, location, start_date, end_date, description, rating_engine)
         """
         name = self.console.input("Nom du tournoi : ")
         location = self.console.input("Lieu : ")
         start_date = self.console.input("Date de début (YYYY-MM-DD) : ")
         end_date = self.console.input("Date de fin (YYYY-MM-DD) : ")
         description = self.console.input("Description du tournoi : ")
-        return name, location, start_date, end_date, description
+        engine_choice = self.console.input("Système de classement (1 Elo / 2 Glicko-2) [1] : ")
+        rating_engine = "glicko2" if engine_choice.strip() == "2" else "elo"
+        return name, location, start_date, end_date, description, rating_engine
 
     def get_match_result(self):
         """
@@ -338,25 +537,26 @@ class TournamentView:
 
         The method displays the tournament menu, handles user choices and
         delegates operations to the tournament controller until the user exits.
+        Results still pending in memory are flushed when leaving the menu.
         """
         running = True
         while running:
             self.display_tournament_menu_view()
             choice = self.console.input(
-                "\n[bold green]Sélectionnez une option (1-8) : [/bold green]")
+                "\n[bold green]Sélectionnez une option (1-12) : [/bold green]")
             if choice == "1":
                 while True:
                     self.display_display_tournaments_view(
-                        self.tournament_controller.display_tournaments())
+                        self.tournament_controller.get_tournaments_summaries())
                     tournament_list_choice = self.console.input(
                         "\n[bold green]Sélectionnez une action : [/bold green]")
                     if tournament_list_choice.lower() == 'b':
                         break
             elif choice == "2":
                 self.display_section_message("Créer un tournoi")
-                name, location, start_date, end_date, description = self.get_new_tournament_details()
+                name, location, start_date, end_date, description, rating_engine = self.get_new_tournament_details()
                 self.tournament_controller.add_tournament(
-                    name, location, start_date, end_date, description)
+                    name, location, start_date, end_date, description, rating_engine)
                 self.display_tournament_added_message(name)
             elif choice == "3":
                 self.display_section_message("Modifier un tournoi")
@@ -474,7 +674,10 @@ class TournamentView:
                     tournament = self.tournament_controller.get_tournament(
                         index)
                     if tournament.status == "À venir":
-                        self.tournament_controller.start_tournament(index)
+                        pairing_format = self.console.input(
+                            "Format (1. Toutes rondes, 2. Système suisse, 3. Système suisse accéléré) [1] : ")
+                        self.tournament_controller.start_tournament(
+                            index, round_robin=pairing_format not in ("2", "3"), accelerated=pairing_format == "3")
                         round_index = 0
                         self.display_tournament_started_message(index)
                         started_tournament = self.tournament_controller.get_tournament(
@@ -633,6 +836,59 @@ class TournamentView:
                 except IndexError:
                     self.display_tournament_index_error_message()
             elif choice == "8":
+                self.display_section_message("Prévoir le classement final")
+                tournaments_count = self.tournament_controller.get_tournaments_count()
+                try:
+                    index = int(self.console.input(
+                        f"Index du tournoi (0-{tournaments_count - 1}): "))
+                    simulations = self.console.input("Nombre de simulations (10000 par défaut) : ")
+                    forecast = self.tournament_controller.forecast_tournament(
+                        index, simulations=int(simulations) if simulations else 10000)
+                    self.display_forecast_view(forecast)
+                except ValueError:
+                    self.display_index_value_error_message()
+                except IndexError:
+                    self.display_tournament_index_error_message()
+            elif choice == "9":
+                self.display_section_message("Rejouer les appariements")
+                tournaments_count = self.tournament_controller.get_tournaments_count()
+                try:
+                    index = int(self.console.input(
+                        f"Index du tournoi (0-{tournaments_count - 1}): "))
+                    differences = self.tournament_controller.replay_tournament_pairings(index)
+                    self.display_replay_view(differences)
+                except ValueError:
+                    self.display_index_value_error_message()
+                except IndexError:
+                    self.display_tournament_index_error_message()
+            elif choice == "10":
+                self.display_section_message("Apparier plusieurs tournois")
+                tournaments_count = self.tournament_controller.get_tournaments_count()
+                try:
+                    indexes = self.console.input(
+                        f"Index des tournois, séparés par des espaces (0-{tournaments_count - 1}): ")
+                    tournament_ids = [self.tournament_controller.get_tournament(int(index)).tournament_id
+                                      for index in indexes.split()]
+                    paired, skipped = self.tournament_controller.initiate_next_rounds(tournament_ids)
+                    self.display_batch_pairing_view(paired, skipped)
+                except ValueError:
+                    self.display_index_value_error_message()
+                except IndexError:
+                    self.display_tournament_index_error_message()
+            elif choice == "11":
+                self.display_section_message("Afficher le classement")
+                tournaments_count = self.tournament_controller.get_tournaments_count()
+                try:
+                    index = int(self.console.input(
+                        f"Index du tournoi (0-{tournaments_count - 1}): "))
+                    labels, standings = self.tournament_controller.get_standings(index)
+                    self.display_standings_view(labels, standings)
+                except ValueError:
+                    self.display_index_value_error_message()
+                except IndexError:
+                    self.display_tournament_index_error_message()
+            elif choice == "12":
+                self.tournament_controller.commit()
                 running = False
             else:
                 self.display_invalid_choice_message()